@@ -1,6 +1,17 @@
-from .api import API
-
-__name__ = ["pcpartpicker"]
+__all__ = ["API"]
 __version__ = '2.2.2'
 __author__ = 'Jonathan Vusich'
 __email__ = 'jonathanvusich@gmail.com'
+
+
+def __getattr__(name: str):
+    # The API is imported on first use so that importing the package stays cheap.
+    if name == "API":
+        from .api import API
+        globals()["API"] = API
+        return API
+    raise AttributeError(f"module 'pcpartpicker' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
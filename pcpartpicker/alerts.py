@@ -0,0 +1,296 @@
+import bisect
+import itertools
+import logging
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from .catalog import normalize_name
+from .errors import UnsupportedPart
+from .mappings import part_classes
+from .prices import CompactPrice, price_key
+
+if TYPE_CHECKING:
+    from moneyed import Money
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+"""
+    Price alerts. Subscriptions are indexed by region, part, field, product
+    name and currency, and the thresholds of each index entry are kept sorted.
+    When a category is refreshed, the lowest (or highest) price of every
+    watched product is looked up once and only the alerts whose threshold it
+    crossed are fired, so the cost of a refresh does not grow with the number
+    of subscriptions that stay quiet.
+"""
+
+Threshold = Union["Money", CompactPrice, Decimal, str, int, float]
+_AlertKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class Alert:
+    """Dataclass that describes a one-shot price alert for a product in one region."""
+
+    id: int
+    region: str
+    part: str
+    model: str
+    threshold: CompactPrice
+    brand: Optional[str] = None
+    field: str = "price"
+    above: bool = False
+
+
+@dataclass(frozen=True)
+class AlertEvent:
+    """Dataclass that describes a fired alert, with the part and price that fired it."""
+
+    alert: Alert
+    item: Any
+    price: Any
+
+
+def _threshold(threshold: Threshold, currency: Optional[str]) -> CompactPrice:
+    if isinstance(threshold, CompactPrice):
+        return threshold
+    if hasattr(threshold, "amount") and hasattr(threshold, "currency"):
+        return CompactPrice.from_money(threshold)
+    if currency is None:
+        raise ValueError(f"A currency is required for the threshold {threshold!r}!")
+    if isinstance(threshold, str):
+        return CompactPrice.from_string(threshold, currency)
+    return CompactPrice.from_decimal(Decimal(str(threshold)), currency)
+
+
+def _currency(price: Any) -> str:
+    return price.currency if isinstance(price, CompactPrice) else price.currency.code
+
+
+class _Thresholds:
+    """The armed alerts of one product and currency, as (threshold, id) pairs sorted by how easily they fire."""
+
+    def __init__(self) -> None:
+        self.below: List[Tuple[int, int]] = []
+        self.above: List[Tuple[int, int]] = []
+
+    def _entries(self, alert: Alert) -> Tuple[List[Tuple[int, int]], Tuple[int, int]]:
+        # Alerts that fire above a threshold are stored negated, so both lists fire from their end.
+        if alert.above:
+            return self.above, (-alert.threshold.units, alert.id)
+        return self.below, (alert.threshold.units, alert.id)
+
+    def add(self, alert: Alert) -> None:
+        entries, entry = self._entries(alert)
+        bisect.insort(entries, entry)
+
+    def remove(self, alert: Alert) -> None:
+        entries, entry = self._entries(alert)
+        index = bisect.bisect_left(entries, entry)
+        if index < len(entries) and entries[index] == entry:
+            del entries[index]
+
+    def fire_below(self, units: int) -> List[int]:
+        index = bisect.bisect_left(self.below, (units, -1))
+        fired = [alert_id for _, alert_id in self.below[index:]]
+        del self.below[index:]
+        return fired
+
+    def fire_above(self, units: int) -> List[int]:
+        index = bisect.bisect_left(self.above, (-units, -1))
+        fired = [alert_id for _, alert_id in self.above[index:]]
+        del self.above[index:]
+        return fired
+
+    def __len__(self) -> int:
+        return len(self.below) + len(self.above)
+
+
+class AlertEngine:
+    """AlertEngine:
+
+    This class holds price alert subscriptions and fires them when a refreshed category crosses
+    their threshold. An alert fires once, when the lowest price of its product in its region is at
+    or below the threshold (or the highest price is at or above it for alerts with above=True),
+    and is then removed. A subscription whose condition already holds fires on the next refresh.
+
+    Attributes:
+        max_events: int:
+            The number of fired alerts that are kept until drain() is called.
+    """
+
+    def __init__(self, max_events: int = 10000) -> None:
+        self.max_events: int = max_events
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._alerts: Dict[int, Alert] = {}
+        self._index: Dict[Tuple[str, str], Dict[_AlertKey, _Thresholds]] = {}
+        self._names: Dict[Tuple[str, str], Counter] = {}
+        self._listeners: List[Callable[[AlertEvent], None]] = []
+        self._events: Deque[AlertEvent] = deque(maxlen=max_events)
+
+    @staticmethod
+    def _key(alert: Alert) -> _AlertKey:
+        return alert.field, normalize_name(alert.brand, alert.model), alert.threshold.currency
+
+    def subscribe(self, region: str, part: str, model: str, threshold: Threshold, currency: Optional[str] = None,
+                  brand: Optional[str] = None, field: str = "price", above: bool = False) -> Alert:
+        """
+        Function that adds a price alert.
+
+        :param region: str: The region, e.g. 'us'.
+        :param part: str: The part category, e.g. 'memory'.
+        :param model: str: The product model, compared ignoring case and spacing.
+        :param threshold: Threshold: The price, as a Money or CompactPrice object or as an amount with a currency.
+        :param currency: Optional[str]: The currency of an amount threshold, e.g. 'USD'.
+        :param brand: Optional[str]: If given, only parts of this brand match.
+        :param field: str: The price field, e.g. 'price' or 'price_per_gb'.
+        :param above: bool: Fire when the price rises to the threshold instead of dropping to it.
+        :return: Alert: The alert, which can be passed to unsubscribe.
+        """
+
+        if part not in part_classes:
+            raise UnsupportedPart(f"Part '{part}' is not supported by this API!")
+        with self._lock:
+            alert = Alert(next(self._ids), region, part, model, _threshold(threshold, currency), brand, field, above)
+            key = self._key(alert)
+            self._index.setdefault((region, part), {}).setdefault(key, _Thresholds()).add(alert)
+            self._names.setdefault((region, part), Counter())[key[1]] += 1
+            self._alerts[alert.id] = alert
+        return alert
+
+    def subscribe_all(self, subscriptions: Iterable[Dict[str, Any]]) -> List[Alert]:
+        return [self.subscribe(**subscription) for subscription in subscriptions]
+
+    def _forget(self, alert: Alert) -> None:
+        del self._alerts[alert.id]
+        category = (alert.region, alert.part)
+        names = self._names[category]
+        name = self._key(alert)[1]
+        names[name] -= 1
+        if not names[name]:
+            del names[name]
+        if not names:
+            del self._names[category]
+
+    def unsubscribe(self, alert: Union[Alert, int]) -> bool:
+        """
+        Function that removes an alert that has not fired yet.
+
+        :param alert: Union[Alert, int]: The alert or its id.
+        :return: bool: Whether the alert was still armed.
+        """
+
+        with self._lock:
+            alert = self._alerts.get(alert if isinstance(alert, int) else alert.id)
+            if alert is None:
+                return False
+            category = (alert.region, alert.part)
+            key = self._key(alert)
+            thresholds = self._index[category][key]
+            thresholds.remove(alert)
+            if not thresholds:
+                del self._index[category][key]
+            if not self._index[category]:
+                del self._index[category]
+            self._forget(alert)
+            return True
+
+    def watches(self, region: str, part: str) -> bool:
+        return (region, part) in self._index
+
+    def alerts(self, region: Optional[str] = None, part: Optional[str] = None) -> List[Alert]:
+        with self._lock:
+            return [alert for alert in self._alerts.values()
+                    if region in (None, alert.region) and part in (None, alert.part)]
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def add_listener(self, listener: Callable[[AlertEvent], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[AlertEvent], None]) -> None:
+        self._listeners.remove(listener)
+
+    def drain(self) -> List[AlertEvent]:
+        """
+        Function that returns and forgets the alerts fired since the last call.
+
+        :return: List[AlertEvent]: The fired alerts, oldest first.
+        """
+
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+    def evaluate(self, region: str, part: str, parts: Iterable) -> List[AlertEvent]:
+        """
+        Function that fires the alerts of a category whose threshold the refreshed parts crossed.
+
+        The parts are scanned once to find the lowest and highest price of every watched product;
+        each product then fires only the alerts at the end of its sorted thresholds.
+
+        :param region: str: The region of the parts.
+        :param part: str: The part category.
+        :param parts: Iterable: The refreshed parts.
+        :return: List[AlertEvent]: The fired alerts. They are also passed to the listeners and kept for drain().
+        """
+
+        with self._lock:
+            index = self._index.get((region, part))
+            if not index:
+                return []
+            names = self._names[(region, part)]
+            price_fields = {key[0] for key in index}
+            lowest: Dict[_AlertKey, Tuple[int, Any, Any]] = {}
+            highest: Dict[_AlertKey, Tuple[int, Any, Any]] = {}
+            for item in parts:
+                # Same as normalize_name, with the model normalized only once for both names.
+                model_name = normalize_name(None, item.model)
+                brand_name = f"{normalize_name(item.brand, None)} {model_name}".strip()
+                for name in (model_name, brand_name) if model_name != brand_name else (model_name,):
+                    if name not in names:
+                        continue
+                    for field in price_fields:
+                        price = getattr(item, field, None)
+                        if price is None:
+                            continue
+                        key = (field, name, _currency(price))
+                        if key not in index:
+                            continue
+                        units = price_key(price)
+                        thresholds = index[key]
+                        if thresholds.below and (key not in lowest or units < lowest[key][0]):
+                            lowest[key] = (units, item, price)
+                        if thresholds.above and (key not in highest or units > highest[key][0]):
+                            highest[key] = (units, item, price)
+
+            events = []
+            for key, (units, item, price) in lowest.items():
+                events.extend(AlertEvent(self._alerts[alert_id], item, price)
+                              for alert_id in index[key].fire_below(units))
+            for key, (units, item, price) in highest.items():
+                events.extend(AlertEvent(self._alerts[alert_id], item, price)
+                              for alert_id in index[key].fire_above(units))
+            for key in set(lowest) | set(highest):
+                if not index[key]:
+                    del index[key]
+            if not index:
+                del self._index[(region, part)]
+            for event in events:
+                self._forget(event.alert)
+            self._events.extend(events)
+            listeners = list(self._listeners)
+
+        for event in events:
+            for listener in listeners:
+                try:
+                    listener(event)
+                except Exception:
+                    logger.exception(f"Alert listener {listener!r} failed for alert {event.alert.id}!")
+        return events
@@ -1,8 +1,21 @@
+import contextlib
 import logging
-from typing import Set, Dict, List
+from typing import TYPE_CHECKING, Set, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .handler import Handler
+from .cache import CacheInfo
+from .handler import Handler, ParseMetrics
+from .limiter import LimiterMetrics
+from .mirrors import MirrorStats
+from .page_store import PageStore
 from .part_data import PartData
+from .profiling import Profiler
+from .quarantine import Quarantine
+from .scheduler import RefreshScheduler
+
+if TYPE_CHECKING:
+    from .alerts import AlertEngine
+    from .catalog import GlobalCatalog
+    from .shared_catalog import SharedCatalog
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARN)
@@ -15,8 +28,15 @@ class API:
     the internals and the externally available functions.
     """
 
-    def __init__(self, region: str = "us") -> None:
-        self._handler = Handler(region)
+    def __init__(self, region: str = "us", concurrency_limit: Optional[int] = 16,
+                 rate_limit: Optional[float] = None, page_store: Optional[PageStore] = None,
+                 compact_prices: bool = False, base_url: Union[str, Sequence[str], None] = None,
+                 cache_size: Optional[int] = None, spill_dir: Optional[str] = None, strict: bool = False) -> None:
+        self._handler = Handler(region, concurrency_limit, rate_limit, page_store, compact_prices, base_url,
+                                cache_size, spill_dir, strict)
+        self._scheduler: Optional[RefreshScheduler] = None
+        self._profiler: Optional[Profiler] = None
+        self.last_profile: Optional[Profiler] = None
 
     @property
     def supported_regions(self) -> Set[str]:
@@ -30,6 +50,50 @@ class API:
     def region(self) -> str:
         return self._handler.region
 
+    @property
+    def request_metrics(self) -> LimiterMetrics:
+        return self._handler.request_metrics
+
+    @property
+    def parse_metrics(self) -> ParseMetrics:
+        return self._handler.parse_metrics
+
+    @property
+    def quarantine(self) -> Quarantine:
+        return self._handler.quarantine
+
+    @property
+    def alerts(self) -> "AlertEngine":
+        """
+        The price alert subscriptions, which are checked whenever a category is downloaded.
+        """
+        return self._handler.alerts
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Public function that reports the size and hit statistics of the part cache.
+
+        :return: CacheInfo: The number of cached part lists, their estimated size in bytes (in total and
+        per region), hits, misses, evictions and part lists spilled to disk.
+        """
+        return self._handler.cache_info()
+
+    def mirror_stats(self) -> Dict[str, MirrorStats]:
+        """
+        Public function that reports the request count, error count and smoothed latency of every mirror.
+
+        :return: Dict[str, MirrorStats]: The statistics keyed by mirror URL, in the order the mirrors were given.
+        """
+        return self._handler.mirror_stats()
+
+    def probe_mirrors(self) -> Dict[str, MirrorStats]:
+        """
+        Public function that measures the latency of every mirror so that requests start on the fastest one.
+
+        :return: Dict[str, MirrorStats]: The statistics keyed by mirror URL.
+        """
+        return self._handler.probe_mirrors()
+
     def set_region(self, region: str) -> None:
         """
         Public function that allows the user to change the region from which data will be fetched.
@@ -41,27 +105,182 @@ class API:
         self._handler.set_region(region)
         logger.debug(f"Region set to {self.region}")
 
-    def retrieve(self, *args, force_refresh: bool = False) -> PartData:
+    @contextlib.contextmanager
+    def profile(self, directory: Optional[str] = None) -> Iterator[Profiler]:
+        """
+        Public function that profiles every retrieve made through this API inside the with block.
+
+        cProfile and tracemalloc data are collected separately for the 'scrape', 'extract', 'decode',
+        'build' and 'cache' stages. While profiling, pages are parsed after all of them have been
+        downloaded instead of while the rest are still downloading.
+
+        :param directory: Optional[str]: If given, the summary, collapsed stacks and pstats files are
+        written here when the block exits.
+        :return: Iterator[Profiler]: A context manager that yields the profiler.
+        """
+        profiler = Profiler()
+        previous, self._profiler = self._profiler, profiler
+        try:
+            with profiler:
+                yield profiler
+        finally:
+            self._profiler = previous
+            self.last_profile = profiler
+        if directory is not None:
+            profiler.write(directory)
+
+    def _retrieve(self, args: Sequence[str], force_refresh: bool, fields: Optional[Sequence[str]],
+                  profile: bool) -> PartData:
+        if profile and self._profiler is None:
+            with self.profile():
+                return self._handler.retrieve(*args, force_refresh=force_refresh, fields=fields,
+                                              profiler=self._profiler)
+        return self._handler.retrieve(*args, force_refresh=force_refresh, fields=fields, profiler=self._profiler)
+
+    def retrieve(self, *args, force_refresh: bool = False, fields: Optional[Sequence[str]] = None,
+                 profile: bool = False) -> PartData:
         """
         Public function that allows the user to make part requests.
 
         :param args: str: Various string arguments that must be valid part types.
         :param force_refresh: bool: This value determines whether or not the API will used internally
         cached values (if available) or freshly acquired data.
+        :param fields: Optional[Sequence[str]]: If given, only these fields are parsed and each part is
+        returned as a lightweight named tuple record.
+        :param profile: bool: Whether to profile each stage of this retrieve. The profiler is stored in
+        last_profile, see also profile().
         :return: dict: A dictionary that contains the requested parts as keys to their associated data object
         lists.
         """
         logger.debug(f"Retrieving {args}...")
-        return self._handler.retrieve(*args, force_refresh=force_refresh)
+        return self._retrieve(args, force_refresh, fields, profile)
+
+    def iter_retrieve(self, *args, force_refresh: bool = False,
+                      fields: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, List]]:
+        """
+        Public function that yields each requested part as soon as it is ready, instead of waiting for all of them.
+
+        Pages are parsed while the remaining pages are still downloading.
 
-    def retrieve_all(self, force_refresh: bool = False) -> PartData:
+        :param args: str: Various string arguments that must be valid part types. All supported parts are
+        retrieved if none are given.
+        :param force_refresh: bool: This value determines whether or not the API will used internally
+        cached values (if available) or freshly acquired data.
+        :param fields: Optional[Sequence[str]]: If given, only these fields are parsed and each part is
+        returned as a lightweight named tuple record.
+        :return: Iterator[Tuple[str, List]]: Pairs of part name and data object list, cached parts first
+        and then in the order that their downloads complete.
+        """
+        logger.debug(f"Iterating over {args}...")
+        parts = args or sorted(self._handler.supported_parts)
+        return self._handler.iter_retrieve(*parts, force_refresh=force_refresh, fields=fields)
+
+    def retrieve_all(self, force_refresh: bool = False, fields: Optional[Sequence[str]] = None,
+                     profile: bool = False) -> PartData:
         """
         Public function that allows the user to retrieve all supported part types.
 
         :param force_refresh: bool: This value determines whether or not the API will used internally
         cached values (if available) or freshly acquired data.
+        :param fields: Optional[Sequence[str]]: If given, only these fields are parsed and each part is
+        returned as a lightweight named tuple record. Every field must exist on every part type.
+        :param profile: bool: Whether to profile each stage of this retrieve. The profiler is stored in
+        last_profile, see also profile().
         :return: dict: A dictionary that contains all parts as keys to their associated data object
         lists.
         """
         logger.debug(f"Retrieving all parts...")
-        return self._handler.retrieve(*self._handler.supported_parts, force_refresh=force_refresh)
+        return self._retrieve(tuple(self._handler.supported_parts), force_refresh, fields, profile)
+
+    def sync_archive(self, source: Optional[str] = None, regions: Optional[Iterable[str]] = None,
+                     parts: Optional[Iterable[str]] = None) -> Dict[str, PartData]:
+        """
+        Public function that refreshes many regions and parts from one tar or zip archive of pages.
+
+        A full sync is then a single large download instead of one request per region and part. The
+        archive holds raw pages as '<region>/<part>' members, like the URLs of the origin.
+
+        :param source: Optional[str]: The http(s) URL or local path of the archive. Defaults to
+        'archive.tar.gz' on the best mirror.
+        :param regions: Optional[Iterable[str]]: Only load these regions, defaults to every supported region.
+        :param parts: Optional[Iterable[str]]: Only load these parts, defaults to every supported part.
+        :return: Dict[str, PartData]: The parts found in the archive, keyed by region. They are cached
+        like downloaded parts.
+        """
+        return self._handler.sync_archive(source, regions, parts)
+
+    def last_refresh(self, part: str, region: Optional[str] = None) -> Optional[float]:
+        """
+        Public function that returns when the cached data for a part was last refreshed.
+
+        :param part: str: The part.
+        :param region: Optional[str]: The region, defaults to the current region.
+        :return: Optional[float]: The refresh time as a Unix timestamp, or None if the part has never been loaded.
+        """
+        return self._handler.last_refresh(part, region)
+
+    def global_catalog(self, *args, regions: Optional[Iterable[str]] = None) -> "GlobalCatalog":
+        """
+        Public function that loads parts from several regions into a catalog that stores every distinct product once.
+
+        :param args: str: The parts to load. All supported parts are loaded if none are given.
+        :param regions: Optional[Iterable[str]]: The regions to load, defaults to all supported regions.
+        :return: GlobalCatalog: The catalog, with per-region views and cross-region price lookups.
+        """
+        from .catalog import GlobalCatalog
+
+        parts = args or sorted(self._handler.supported_parts)
+        regions = list(regions) if regions is not None else sorted(self._handler.supported_regions)
+        catalog = GlobalCatalog(self._handler.compact_prices)
+        catalog.add_all(self._handler.snapshot(regions, parts))
+        return catalog
+
+    def share_catalog(self, *args, regions: Optional[Iterable[str]] = None,
+                      name: Optional[str] = None) -> "SharedCatalog":
+        """
+        Public function that loads parts into a shared memory catalog that worker processes can attach to.
+        Requires Python 3.8 or later.
+
+        :param args: str: The parts to share. All supported parts are shared if none are given.
+        :param regions: Optional[Iterable[str]]: The regions to share, defaults to the current region.
+        :param name: Optional[str]: The shared memory segment name, or None for a random name.
+        :return: SharedCatalog: The catalog, which removes the segment when it is closed. Workers call
+        SharedCatalog.attach(catalog.name).
+        """
+        from .shared_catalog import SharedCatalog, has_shared_memory
+
+        if not has_shared_memory():
+            raise RuntimeError("Sharing a catalog requires Python 3.8 or later!")
+        parts = args or sorted(self._handler.supported_parts)
+        regions = list(regions) if regions is not None else [self.region]
+        return SharedCatalog.create(self._handler.snapshot(regions, parts), name, self._handler.compact_prices)
+
+    def start_refresh(self, *args, regions: Optional[Iterable[str]] = None,
+                      interval: float = 300) -> RefreshScheduler:
+        """
+        Public function that keeps part data warm by refreshing it on a background thread.
+
+        :param args: str: The parts to refresh. All supported parts are refreshed if none are given.
+        :param regions: Optional[Iterable[str]]: The regions to refresh, defaults to the current region.
+        :param interval: float: The number of seconds between two refreshes of the same part and region.
+        This should be shorter than the 600 second cache window so that requests never wait for a download.
+        :return: RefreshScheduler: The running scheduler, which reports the last success time of each entry.
+        """
+        self.stop_refresh()
+        parts = args or sorted(self._handler.supported_parts)
+        regions = list(regions) if regions is not None else [self.region]
+        entries = [(region, part) for region in regions for part in parts]
+        self._scheduler = RefreshScheduler(self._handler, entries, interval)
+        self._scheduler.start()
+        logger.debug(f"Started background refresh of {len(entries)} entries.")
+        return self._scheduler
+
+    def stop_refresh(self) -> None:
+        """
+        Public function that stops the background refresh started by start_refresh, if any.
+
+        :return: None
+        """
+        if self._scheduler is not None:
+            self._scheduler.stop()
+            self._scheduler = None
@@ -0,0 +1,118 @@
+import io
+import logging
+import os
+import tarfile
+import time
+import zipfile
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+"""
+    Page archives. A full sync of every region and part is hundreds of small
+    requests, so pages can also be bundled into a single tar or zip archive
+    laid out like the origin ('<region>/<part>') and downloaded in one
+    sequential transfer. Archives are read as a stream of (region, part, page)
+    entries that go through the normal parse path.
+"""
+
+ArchiveEntry = Tuple[Tuple[str, str], bytes]
+
+archive_modes: Dict[str, str] = {"tar": "w", "tar.gz": "w:gz", "tar.bz2": "w:bz2", "tar.xz": "w:xz", "zip": ""}
+default_archive_name: str = "archive.tar.gz"
+
+
+def archive_format(name: str) -> str:
+    """
+    Function that returns the archive format implied by a file name, e.g. 'tar.gz' for 'pages.tar.gz'.
+
+    :param name: str: The file name or URL.
+    :return: str: The format, one of the keys of archive_modes.
+    """
+
+    for archive_format_name in sorted(archive_modes, key=len, reverse=True):
+        if name.endswith(f".{archive_format_name}"):
+            return archive_format_name
+    if name.endswith(".tgz"):
+        return "tar.gz"
+    raise ValueError(f"Archive '{name}' must end with one of {['.' + key for key in archive_modes]}!")
+
+
+def _open_tar(source: Union[str, BinaryIO], mode: str) -> tarfile.TarFile:
+    if isinstance(source, str):
+        return tarfile.open(source, mode)
+    return tarfile.open(fileobj=source, mode=mode)
+
+
+def write_archive(entries: Iterable[ArchiveEntry], target: Union[str, BinaryIO],
+                  archive_format: str = "tar.gz") -> None:
+    """
+    Function that writes raw pages into a tar or zip archive as '<region>/<part>' members.
+
+    :param entries: Iterable[ArchiveEntry]: The (region, part) keys and raw pages.
+    :param target: Union[str, BinaryIO]: The path or binary file to write to.
+    :param archive_format: str: One of 'tar', 'tar.gz', 'tar.bz2', 'tar.xz' and 'zip'.
+    :return: None
+    """
+
+    if archive_format not in archive_modes:
+        raise ValueError(f"Archive format '{archive_format}' must be one of {tuple(archive_modes)}!")
+    if archive_format == "zip":
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as archive:
+            for (region, part), page in entries:
+                archive.writestr(f"{region}/{part}", page)
+        return
+    with _open_tar(target, archive_modes[archive_format]) as archive:
+        modified = time.time()
+        for (region, part), page in entries:
+            info = tarfile.TarInfo(f"{region}/{part}")
+            info.size, info.mtime = len(page), modified
+            archive.addfile(info, io.BytesIO(page))
+
+
+def archive_bytes(entries: Iterable[ArchiveEntry], archive_format: str = "tar.gz") -> bytes:
+    buffer = io.BytesIO()
+    write_archive(entries, buffer, archive_format)
+    return buffer.getvalue()
+
+
+def _entry_key(name: str) -> Optional[Tuple[str, str]]:
+    path = [component for component in name.split("/") if component not in ("", ".")]
+    if len(path) != 2 or not all(path):
+        return None
+    return path[0], os.path.splitext(path[1])[0]
+
+
+def read_archive(source: Union[bytes, str, BinaryIO]) -> Iterator[Tuple[str, str, bytes]]:
+    """
+    Function that reads the pages of a tar or zip archive one member at a time.
+
+    The format is detected from the content, so compressed and uncompressed tar files and zip files
+    are all accepted. Members that are not laid out as '<region>/<part>' are skipped, and an
+    extension such as '.html' is removed from the part name.
+
+    :param source: Union[bytes, str, BinaryIO]: The archive content, a path or a seekable binary file.
+    :return: Iterator[Tuple[str, str, bytes]]: The region, part and raw page of every member.
+    """
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                key = None if info.is_dir() else _entry_key(info.filename)
+                if key is None:
+                    logger.debug(f"Skipping archive member {info.filename}.")
+                    continue
+                yield key[0], key[1], archive.read(info)
+        return
+    if not isinstance(source, str):
+        source.seek(0)
+    with _open_tar(source, "r:*") as archive:
+        for info in archive:
+            key = _entry_key(info.name) if info.isfile() else None
+            if key is None:
+                logger.debug(f"Skipping archive member {info.name}.")
+                continue
+            yield key[0], key[1], archive.extractfile(info).read()
@@ -0,0 +1,177 @@
+import importlib.util
+import os
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from .prices import CompactPrice, price_digits
+from .schema import is_price
+
+if TYPE_CHECKING:
+    import pyarrow
+
+"""
+    Apache Arrow export. Every part class maps to a fixed Arrow schema: unit
+    dataclasses are flattened into one numeric column per field (for example
+    'boost_clock.cycles' or 'fan_rpm.max'), prices are split into a float64
+    'price.amount' column and a dictionary encoded 'price.currency' column,
+    and every other field keeps its annotated type. pyarrow is an optional
+    dependency; install it with the 'arrow' extra.
+"""
+
+Column = Tuple[str, str, Callable[[Any], Any]]
+
+
+def has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _require_pyarrow():
+    if not has_pyarrow():
+        raise ImportError("The pyarrow package is required for Arrow and Parquet export!")
+    import pyarrow
+    return pyarrow
+
+
+def _arrow_kind(annotation: Any) -> str:
+    if annotation is bool:
+        return "bool"
+    if annotation is int:
+        return "int"
+    if annotation is str:
+        return "str"
+    return "float"
+
+
+def _number(value: Any) -> Any:
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _amount(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, CompactPrice):
+        return value.units / 10 ** price_digits
+    return float(value.amount)
+
+
+def _currency(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.currency if isinstance(value, CompactPrice) else value.currency.code
+
+
+def _getter(name: str, kind: str) -> Callable[[Any], Any]:
+    if kind in ("int", "float"):
+        return lambda part: _number(getattr(part, name))
+    value_type = bool if kind == "bool" else str
+    return lambda part: getattr(part, name) if isinstance(getattr(part, name), value_type) else None
+
+
+def _nested_getter(name: str, nested: str) -> Callable[[Any], Any]:
+    def get(part: Any) -> Any:
+        value = getattr(part, name)
+        return None if value is None else _number(getattr(value, nested))
+    return get
+
+
+@lru_cache(maxsize=None)
+def columns(datatype: type) -> Tuple[Column, ...]:
+    """
+    Function that returns the flattened columns of a part class.
+
+    :param datatype: type: The part dataclass.
+    :return: Tuple[Column, ...]: The column name, kind ('int', 'float', 'bool', 'str', 'currency') and a
+    function that reads the column value from a part, for each column.
+    """
+
+    result: List[Column] = []
+    for field in fields(datatype):
+        name = field.name
+        if is_price(field.type):
+            result.append((f"{name}.amount", "float", lambda part, name=name: _amount(getattr(part, name))))
+            result.append((f"{name}.currency", "currency", lambda part, name=name: _currency(getattr(part, name))))
+        elif is_dataclass(field.type):
+            for nested in fields(field.type):
+                result.append((f"{name}.{nested.name}", _arrow_kind(nested.type), _nested_getter(name, nested.name)))
+        else:
+            kind = _arrow_kind(field.type)
+            result.append((name, kind, _getter(name, kind)))
+    return tuple(result)
+
+
+def _arrow_type(kind: str) -> "pyarrow.DataType":
+    pyarrow = _require_pyarrow()
+    return {"int": pyarrow.int64(), "float": pyarrow.float64(), "bool": pyarrow.bool_(), "str": pyarrow.string(),
+            "currency": pyarrow.dictionary(pyarrow.int32(), pyarrow.string())}[kind]
+
+
+def arrow_schema(datatype: type, field_names: Optional[Sequence[str]] = None) -> "pyarrow.Schema":
+    """
+    Function that returns the fixed Arrow schema of a part class.
+
+    :param datatype: type: The part dataclass.
+    :param field_names: Optional[Sequence[str]]: Only include the columns of these fields.
+    :return: pyarrow.Schema: The schema.
+    """
+
+    pyarrow = _require_pyarrow()
+    return pyarrow.schema([pyarrow.field(name, _arrow_type(kind)) for name, kind, _ in
+                           select_columns(datatype, field_names)],
+                          metadata={"pcpartpicker.part": datatype.__name__})
+
+
+def select_columns(datatype: type, field_names: Optional[Sequence[str]]) -> List[Column]:
+    if field_names is None:
+        return list(columns(datatype))
+    return [column for column in columns(datatype) if column[0].split(".")[0] in field_names]
+
+
+def part_table(datatype: type, parts: Sequence) -> "pyarrow.Table":
+    """
+    Function that converts a part list into an Arrow table with the fixed schema of its part class.
+
+    Projected records (see Projection) are converted into the columns of their fields only.
+
+    :param datatype: type: The part dataclass.
+    :param parts: Sequence: The parts or projected records.
+    :return: pyarrow.Table: The table.
+    """
+
+    pyarrow = _require_pyarrow()
+    field_names = None
+    if parts and not isinstance(parts[0], datatype):
+        field_names = parts[0]._fields
+    selected = select_columns(datatype, field_names)
+    arrays = []
+    for name, kind, get in selected:
+        values = [get(part) for part in parts]
+        if kind == "currency":
+            arrays.append(pyarrow.array(values, pyarrow.string()).dictionary_encode())
+        else:
+            arrays.append(pyarrow.array(values, _arrow_type(kind)))
+    return pyarrow.Table.from_arrays(arrays, schema=arrow_schema(datatype, field_names))
+
+
+def write_parquet(tables: Iterable[Tuple[str, "pyarrow.Table"]], directory: str, **options) -> List[str]:
+    """
+    Function that writes tables to '<directory>/<part>.parquet' files.
+
+    :param tables: Iterable[Tuple[str, pyarrow.Table]]: The part names and their tables.
+    :param directory: str: The output directory, which is created if needed.
+    :param options: Keyword arguments passed on to pyarrow.parquet.write_table, e.g. compression.
+    :return: List[str]: The written paths.
+    """
+
+    _require_pyarrow()
+    import pyarrow.parquet
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for part, table in tables:
+        path = os.path.join(directory, f"{part}.parquet")
+        temp_path = f"{path}.tmp"
+        pyarrow.parquet.write_table(table, temp_path, **options)
+        os.replace(temp_path, path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,221 @@
+import logging
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+CacheKey = Tuple[str, str]
+
+
+def _deep_size(obj: Any, seen: Set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        return size + sum(_deep_size(key, seen) + _deep_size(value, seen) for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(_deep_size(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += _deep_size(obj.__dict__, seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += _deep_size(getattr(obj, slot), seen)
+    return size
+
+
+def estimate_size(data: Sequence, sample: int = 16) -> int:
+    """
+    Function that estimates the number of bytes held by a part list from a sample of its parts.
+
+    Objects that are shared between parts, such as currencies, are only counted once.
+
+    :param data: Sequence: The part list.
+    :param sample: int: The number of parts to measure.
+    :return: int: The estimated size in bytes.
+    """
+
+    size = sys.getsizeof(data)
+    if not data:
+        return size
+    step = max(1, len(data) // sample)
+    sampled = data[::step][:sample]
+    seen: Set[int] = set()
+    sampled_size = sum(_deep_size(item, seen) for item in sampled)
+    return size + sampled_size * len(data) // len(sampled)
+
+
+@dataclass
+class CacheInfo:
+    """Dataclass that reports the state of a PartCache."""
+
+    entries: int = 0
+    size: int = 0
+    max_size: Optional[int] = None
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    spilled: int = 0
+    spill_loads: int = 0
+    regions: Dict[str, int] = field(default_factory=dict)
+
+
+class PartCache:
+    """PartCache:
+
+    This class holds part lists keyed by region and part, evicting the least recently used
+    lists once their estimated size exceeds a limit. Evicted lists are either dropped or, if a
+    spill directory is set, pickled to disk and loaded again on their next use.
+
+    Attributes:
+        max_size: Optional[int]:
+            The maximum estimated number of bytes kept in memory, or None for no limit.
+        spill_dir: Optional[str]:
+            The directory that evicted lists are written to as '<region>/<part>.pickle', or None to drop them.
+        on_evict: Optional[Callable[[CacheKey], None]]:
+            Called with the key of every list that leaves memory.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, spill_dir: Optional[str] = None,
+                 on_evict: Optional[Callable[[CacheKey], None]] = None) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError("Cache size must be a positive number!")
+        self.max_size: Optional[int] = max_size
+        self.spill_dir: Optional[str] = spill_dir
+        self.on_evict: Optional[Callable[[CacheKey], None]] = on_evict
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[CacheKey, Tuple[List, int]]" = OrderedDict()
+        self._spilled: Dict[CacheKey, str] = {}
+        self._size = 0
+        self._info = CacheInfo(max_size=max_size)
+
+    def _spill_path(self, key: CacheKey) -> str:
+        return os.path.join(self.spill_dir, key[0], f"{key[1]}.pickle")
+
+    def _spill(self, key: CacheKey, data: List) -> None:
+        path = self._spill_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        self._spilled[key] = path
+
+    def _unspill(self, key: CacheKey) -> List:
+        path = self._spilled.pop(key)
+        with open(path, "rb") as file:
+            data = pickle.load(file)
+        os.remove(path)
+        self._info.spill_loads += 1
+        return data
+
+    def _remove(self, key: CacheKey, notify: bool = True) -> Optional[List]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._size -= entry[1]
+        if notify and self.on_evict is not None:
+            self.on_evict(key)
+        return entry[0]
+
+    def _evict(self) -> None:
+        while self.max_size is not None and self._size > self.max_size and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            data = self._remove(key, notify=False)
+            self._info.evictions += 1
+            if self.spill_dir is not None:
+                self._spill(key, data)
+                logger.debug(f"Spilled {key[0]}/{key[1]} to disk.")
+            else:
+                logger.debug(f"Evicted {key[0]}/{key[1]}.")
+            # Spilled lists are still in the cache when the callback runs, dropped ones are not.
+            if self.on_evict is not None:
+                self.on_evict(key)
+
+    def put(self, key: CacheKey, data: List) -> None:
+        """
+        Function that stores a part list as the most recently used entry, evicting older entries if needed.
+
+        :param key: CacheKey: The region and part.
+        :param data: List: The part list.
+        :return: None
+        """
+
+        size = estimate_size(data)
+        with self._lock:
+            self._remove(key, notify=False)
+            if self._spilled.pop(key, None) is not None:
+                os.remove(self._spill_path(key))
+            self._entries[key] = (data, size)
+            self._size += size
+            self._evict()
+
+    def get(self, key: CacheKey) -> Optional[List]:
+        """
+        Function that returns a part list and marks it as the most recently used entry.
+
+        :param key: CacheKey: The region and part.
+        :return: Optional[List]: The part list, or None if it is not cached.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._info.hits += 1
+                return entry[0]
+            if key in self._spilled:
+                data = self._unspill(key)
+                self._info.hits += 1
+                self._entries[key] = (data, estimate_size(data))
+                self._size += self._entries[key][1]
+                self._evict()
+                return data
+            self._info.misses += 1
+            return None
+
+    def peek(self, key: CacheKey) -> Optional[List]:
+        """
+        Function that returns a part list held in memory without marking it as used or counting a hit.
+
+        :param key: CacheKey: The region and part.
+        :return: Optional[List]: The part list, or None if it is not in memory.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def __contains__(self, key: CacheKey) -> bool:
+        with self._lock:
+            return key in self._entries or key in self._spilled
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            for path in self._spilled.values():
+                os.remove(path)
+            self._spilled.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        Function that returns a snapshot of the cache statistics.
+
+        :return: CacheInfo: The number of entries and estimated bytes in memory, per-region sizes and counters.
+        """
+
+        with self._lock:
+            regions: Dict[str, int] = {}
+            for (region, _), (_, size) in self._entries.items():
+                regions[region] = regions.get(region, 0) + size
+            return CacheInfo(len(self._entries), self._size, self.max_size, self._info.hits, self._info.misses,
+                             self._info.evictions, len(self._spilled), self._info.spill_loads, regions)
@@ -0,0 +1,294 @@
+import threading
+from array import array
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .errors import UnsupportedField, UnsupportedPart
+from .part_data import PartData
+from .prices import CompactPrice, price_key
+from .schema import is_price
+
+"""
+    Global product catalog. The same product is usually listed in many regions
+    with identical specifications and only different prices, so the catalog
+    stores the specifications of every distinct product once and keeps, for
+    each region, compact integer arrays of product indexes and prices. Parts
+    are rebuilt from the shared specification when a region is read.
+"""
+
+_missing_price: int = -(1 << 63)
+
+
+def normalize_name(brand: Optional[str], model: Optional[str]) -> str:
+    """
+    Function that returns the key under which a product is looked up, ignoring case and spacing.
+
+    :param brand: Optional[str]: The brand.
+    :param model: Optional[str]: The model.
+    :return: str: The normalized 'brand model' key.
+    """
+
+    return " ".join(f"{brand or ''} {model or ''}".split()).lower()
+
+
+@dataclass
+class CatalogInfo:
+    """Dataclass that reports how many distinct products a GlobalCatalog shares between its listings."""
+
+    products: int = 0
+    listings: int = 0
+    regions: int = 0
+
+    @property
+    def sharing(self) -> float:
+        if not self.products:
+            return 0.0
+        return self.listings / self.products
+
+
+class _RegionListing:
+    """The products of one region and part, with their prices as integer units and currency indexes."""
+
+    def __init__(self, products: array, units: Dict[str, array], currencies: Dict[str, array]) -> None:
+        self.products: array = products
+        self.units: Dict[str, array] = units
+        self.currencies: Dict[str, array] = currencies
+
+
+class _PartCatalog:
+    """The distinct products of one part category and their listings per region."""
+
+    def __init__(self, datatype: type) -> None:
+        self.datatype: type = datatype
+        self.price_fields: Tuple[str, ...] = tuple(field.name for field in fields(datatype) if is_price(field.type))
+        self.spec_fields: Tuple[str, ...] = tuple(field.name for field in fields(datatype)
+                                                  if field.name not in self.price_fields)
+        self.specs: List[Any] = []
+        self.index: Dict[Tuple, int] = {}
+        self.names: Dict[str, List[int]] = {}
+        self.listings: Dict[str, _RegionListing] = {}
+
+    def product(self, part: Any) -> int:
+        key = tuple(getattr(part, name) for name in self.spec_fields)
+        product = self.index.get(key)
+        if product is None:
+            product = self.index[key] = len(self.specs)
+            spec = object.__new__(self.datatype)
+            spec.__dict__.update(part.__dict__)
+            spec.__dict__.update((name, None) for name in self.price_fields)
+            self.specs.append(spec)
+            self.names.setdefault(normalize_name(part.brand, part.model), []).append(product)
+        return product
+
+    def prune(self) -> int:
+        used = sorted({product for listing in self.listings.values() for product in listing.products})
+        if len(used) == len(self.specs):
+            return 0
+        removed = len(self.specs) - len(used)
+        remap = {old: new for new, old in enumerate(used)}
+        self.specs = [self.specs[old] for old in used]
+        self.index, self.names = {}, {}
+        for product, spec in enumerate(self.specs):
+            self.index[tuple(getattr(spec, name) for name in self.spec_fields)] = product
+            self.names.setdefault(normalize_name(spec.brand, spec.model), []).append(product)
+        for listing in self.listings.values():
+            listing.products = array("q", [remap[product] for product in listing.products])
+        return removed
+
+
+class CatalogView(Sequence):
+    """CatalogView:
+
+    This class is a read-only sequence over the parts that a GlobalCatalog holds for one region
+    and category. Parts are rebuilt from their shared specification and regional prices on access.
+    """
+
+    def __init__(self, catalog: "GlobalCatalog", part_catalog: _PartCatalog, listing: _RegionListing) -> None:
+        self._catalog = catalog
+        self._part_catalog = part_catalog
+        self._listing = listing
+
+    def __len__(self) -> int:
+        return len(self._listing.products)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._part(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Part index out of range!")
+        return self._part(index)
+
+    def _part(self, index: int) -> Any:
+        listing = self._listing
+        spec = self._part_catalog.specs[listing.products[index]]
+        part = object.__new__(self._part_catalog.datatype)
+        part.__dict__.update(spec.__dict__)
+        for name in self._part_catalog.price_fields:
+            part.__dict__[name] = self._catalog._price(listing.units[name][index], listing.currencies[name][index])
+        return part
+
+
+class GlobalCatalog:
+    """GlobalCatalog:
+
+    This class holds the parts of many regions, storing the specifications of every distinct
+    product once. Products are identified by all of their fields except prices, and can be looked
+    up by a normalized brand and model name.
+
+    Attributes:
+        compact_prices: bool:
+            Whether prices are returned as CompactPrice objects instead of Money.
+    """
+
+    def __init__(self, compact_prices: bool = False) -> None:
+        self.compact_prices: bool = compact_prices
+        self._lock = threading.Lock()
+        self._parts: Dict[str, _PartCatalog] = {}
+        self._currencies: List[str] = []
+        self._currency_index: Dict[str, int] = {}
+
+    def _currency(self, code: str) -> int:
+        index = self._currency_index.get(code)
+        if index is None:
+            index = self._currency_index[code] = len(self._currencies)
+            self._currencies.append(code)
+        return index
+
+    def _price(self, units: int, currency: int) -> Any:
+        if units == _missing_price:
+            return None
+        price = CompactPrice(units, self._currencies[currency])
+        return price if self.compact_prices else price.to_money()
+
+    def add(self, region: str, part: str, parts: Sequence) -> None:
+        """
+        Function that stores the parts of one region and category, replacing any earlier listing.
+
+        :param region: str: The region.
+        :param part: str: The part category.
+        :param parts: Sequence: The parts.
+        :return: None
+        """
+
+        from .mappings import part_classes
+
+        datatype = part_classes[part]
+        if any(type(item) is not datatype for item in parts):
+            raise TypeError(f"Only complete '{datatype.__name__}' objects can be added to a global catalog!")
+        with self._lock:
+            part_catalog = self._parts.setdefault(part, _PartCatalog(datatype))
+            products = array("q", map(part_catalog.product, parts))
+            units, currencies = {}, {}
+            for name in part_catalog.price_fields:
+                prices = [getattr(item, name) for item in parts]
+                units[name] = array("q", [_missing_price if price is None else price_key(price) for price in prices])
+                currencies[name] = array("H", [0 if price is None else self._currency(
+                    price.currency if isinstance(price, CompactPrice) else price.currency.code) for price in prices])
+            part_catalog.listings[region] = _RegionListing(products, units, currencies)
+
+    def add_all(self, catalog: Dict[str, Dict[str, Sequence]]) -> None:
+        for region, part_lists in catalog.items():
+            for part, parts in part_lists.items():
+                self.add(region, part, parts)
+
+    def regions(self, part: str) -> List[str]:
+        part_catalog = self._parts.get(part)
+        return list(part_catalog.listings) if part_catalog is not None else []
+
+    def products(self, part: str) -> List:
+        """
+        Function that returns the distinct products of a category, with their prices set to None.
+
+        :param part: str: The part category.
+        :return: list: The shared specifications.
+        """
+
+        part_catalog = self._parts.get(part)
+        return list(part_catalog.specs) if part_catalog is not None else []
+
+    def view(self, region: str, part: str) -> CatalogView:
+        """
+        Function that returns the parts of one region and category in their original order.
+
+        :param region: str: The region.
+        :param part: str: The part category.
+        :return: CatalogView: A read-only sequence of the parts.
+        """
+
+        part_catalog = self._parts[part]
+        return CatalogView(self, part_catalog, part_catalog.listings[region])
+
+    def part_data(self, region: str) -> PartData:
+        results = PartData()
+        for part, part_catalog in self._parts.items():
+            if region in part_catalog.listings:
+                results[part] = self.view(region, part)
+        return results
+
+    def find(self, part: str, brand: str, model: str) -> List:
+        """
+        Function that returns the distinct products of a category with the given brand and model.
+
+        :param part: str: The part category.
+        :param brand: str: The brand, compared ignoring case and spacing.
+        :param model: str: The model, compared ignoring case and spacing.
+        :return: list: The matching specifications, with their prices set to None.
+        """
+
+        part_catalog = self._parts.get(part)
+        if part_catalog is None:
+            return []
+        return [part_catalog.specs[product] for product in part_catalog.names.get(normalize_name(brand, model), [])]
+
+    def prices(self, part: str, brand: str, model: str, field: str = "price") -> Dict[str, List]:
+        """
+        Function that compares the prices of a product across regions.
+
+        :param part: str: The part category.
+        :param brand: str: The brand, compared ignoring case and spacing.
+        :param model: str: The model, compared ignoring case and spacing.
+        :param field: str: The price field, e.g. 'price' or 'price_per_gb'.
+        :return: Dict[str, List]: The prices of every matching listing, keyed by region.
+        """
+
+        from .mappings import part_classes
+
+        if part not in part_classes:
+            raise UnsupportedPart(f"Part '{part}' is not supported by this API!")
+        datatype = part_classes[part]
+        if not any(price_field.name == field and is_price(price_field.type) for price_field in fields(datatype)):
+            raise UnsupportedField(f"Field '{field}' is not a price field of '{datatype.__name__}'!")
+        part_catalog = self._parts.get(part)
+        if part_catalog is None:
+            return {}
+        products = set(part_catalog.names.get(normalize_name(brand, model), []))
+        results: Dict[str, List] = {}
+        for region, listing in part_catalog.listings.items():
+            units, currencies = listing.units[field], listing.currencies[field]
+            found = [self._price(units[index], currencies[index])
+                     for index, product in enumerate(listing.products) if product in products]
+            if found:
+                results[region] = found
+        return results
+
+    def prune(self) -> int:
+        """
+        Function that drops the products that are no longer listed in any region.
+
+        Views obtained before pruning must not be used afterwards.
+
+        :return: int: The number of products that were dropped.
+        """
+
+        with self._lock:
+            return sum(part_catalog.prune() for part_catalog in self._parts.values())
+
+    def info(self) -> CatalogInfo:
+        with self._lock:
+            regions = {region for part_catalog in self._parts.values() for region in part_catalog.listings}
+            return CatalogInfo(sum(len(part_catalog.specs) for part_catalog in self._parts.values()),
+                               sum(len(listing.products) for part_catalog in self._parts.values()
+                                   for listing in part_catalog.listings.values()),
+                               len(regions))
@@ -8,3 +8,16 @@ class UnsupportedPart(Exception):
 
 class DifferentModel(Exception):
     pass
+
+
+class UnsupportedField(Exception):
+    pass
+
+
+class DecodeError(RuntimeError):
+
+    def __init__(self, message: str, part: str, field: str = None, reason: str = None) -> None:
+        super().__init__(message)
+        self.part = part
+        self.field = field
+        self.reason = reason
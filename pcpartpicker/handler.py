@@ -1,18 +1,59 @@
 import asyncio
+import contextvars
+import hashlib
 import logging
+import queue
+import threading
 import time
-from typing import List, Set, Dict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, List, Set, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
 
+from .cache import CacheInfo, CacheKey, PartCache
 from .errors import UnsupportedRegion, UnsupportedPart
-from .mappings import part_classes
-from .parse_utils import parse
-from .scraper import Scraper
+from .limiter import LimiterMetrics, RequestLimiter
+from .mirrors import MirrorSet, MirrorStats
+from .page_store import PageStore
+from .scraper import Scraper, default_base_url
 from .part_data import PartData
+from .profiling import Profiler, profile_stage
+from .quarantine import Quarantine, QuarantinedItem
+from .views import ViewCache
+
+if TYPE_CHECKING:
+    from .alerts import AlertEngine
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARN)
 
 
+FlightKey = Tuple[str, str, Optional[Tuple[str, ...]]]
+
+
+class _Flight:
+    """A download of a single part that other threads can wait on instead of starting their own."""
+
+    def __init__(self, key: FlightKey) -> None:
+        self.key = key
+        self.done = threading.Event()
+        self.data: Optional[List] = None
+        self.error: Optional[BaseException] = None
+
+
+@dataclass
+class ParseMetrics:
+    """Dataclass that counts downloaded pages that were parsed or skipped because their content was unchanged."""
+
+    pages: int = 0
+    parsed: int = 0
+    unchanged: int = 0
+    bytes_skipped: int = 0
+    quarantined: int = 0
+
+
+def page_digest(page: Union[str, bytes]) -> bytes:
+    return hashlib.blake2b(page.encode() if isinstance(page, str) else page, digest_size=16).digest()
+
+
 class Handler:
     _supported_parts: Set[str] = {"cpu", "cpu-cooler", "motherboard", "memory", "internal-hard-drive",
                                   "video-card", "power-supply", "case", "case-fan", "fan-controller",
@@ -23,12 +64,29 @@ class Handler:
     _supported_regions: Set[str] = {"au", "be", "ca", "de", "es", "fr", "se",
                                     "in", "ie", "it", "nz", "uk", "us"}
 
-    def __init__(self, region: str = "us") -> None:
+    def __init__(self, region: str = "us", concurrency_limit: Optional[int] = 16,
+                 rate_limit: Optional[float] = None, page_store: Optional[PageStore] = None,
+                 compact_prices: bool = False, base_url: Union[str, Sequence[str], None] = None,
+                 cache_size: Optional[int] = None, spill_dir: Optional[str] = None, strict: bool = False) -> None:
         if region not in self._supported_regions:
             raise UnsupportedRegion(f"Region '{region}' is not supported for this API!")
         self._region = region
-        self._last_refresh = time.time()
-        self.scraper = Scraper(self.region)
+        self._lock = threading.RLock()
+        self._flights: Dict[FlightKey, _Flight] = {}
+        self._refresh_times: Dict[CacheKey, float] = {}
+        self._view_caches: Dict[str, ViewCache] = {}
+        self._cache = PartCache(cache_size, spill_dir, self._evicted)
+        self._page_digests: Dict[Tuple[str, str], bytes] = {}
+        self.parse_metrics: ParseMetrics = ParseMetrics()
+        self.quarantine: Quarantine = Quarantine()
+        self._alerts: Optional["AlertEngine"] = None
+        self.strict: bool = strict
+        self.max_age: float = 600
+        self.compact_prices: bool = compact_prices
+        self._limiter = RequestLimiter(concurrency_limit, rate_limit)
+        self._page_store = page_store
+        self._mirrors = MirrorSet(base_url if base_url is not None else default_base_url)
+        self.scraper = self._scraper(self.region)
 
     @property
     def region(self) -> str:
@@ -42,6 +100,33 @@ class Handler:
     def supported_regions(self) -> Set[str]:
         return self._supported_regions
 
+    @property
+    def request_metrics(self) -> LimiterMetrics:
+        return self._limiter.metrics
+
+    def cache_info(self) -> CacheInfo:
+        return self._cache.info()
+
+    @property
+    def alerts(self) -> "AlertEngine":
+        if self._alerts is None:
+            from .alerts import AlertEngine
+
+            with self._lock:
+                if self._alerts is None:
+                    self._alerts = AlertEngine()
+        return self._alerts
+
+    def mirror_stats(self) -> Dict[str, MirrorStats]:
+        return self._mirrors.stats()
+
+    def probe_mirrors(self) -> Dict[str, MirrorStats]:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self._scraper(self.region).probe())
+        finally:
+            loop.close()
+
     def set_region(self, region: str) -> None:
         """
         Hidden method that changes the region for the parser and scraper objects contained in this instance.
@@ -51,54 +136,503 @@ class Handler:
         """
         if region not in self._supported_regions:
             raise UnsupportedRegion(f"Region '{region}' is not supported for this API!")
-        self._region = region
-        self.scraper = Scraper(region)
+        with self._lock:
+            self._region = region
+            self.scraper = self._scraper(region)
+
+    def _scraper(self, region: str) -> Scraper:
+        return Scraper(region, self._limiter, self._page_store, self._mirrors)
+
+    def _verify_parts(self, parts: Iterable[str]) -> None:
+        for part in parts:
+            if part not in self._supported_parts:
+                raise UnsupportedPart(f"Part '{part}' is not supported by this API!")
+
+    def last_refresh(self, part: str, region: Optional[str] = None) -> Optional[float]:
+        """
+        Hidden function that returns when the cached data for a part was last refreshed.
 
-    def retrieve(self, *args, force_refresh=False) -> PartData:
+        :param part: str: The part.
+        :param region: Optional[str]: The region, defaults to the current region.
+        :return: Optional[float]: The refresh time as a Unix timestamp, or None if the part has never been loaded.
+        """
+        return self._refresh_times.get((region or self._region, part))
+
+    @staticmethod
+    async def _produce(scraper: Scraper, parts: List[str], pages: "queue.Queue") -> None:
+        try:
+            async for part, page in scraper.stream(parts):
+                pages.put((part, page))
+            pages.put(None)
+        except Exception as error:
+            pages.put(error)
+
+    @staticmethod
+    def _run_download(loop: asyncio.AbstractEventLoop, task: "asyncio.Task") -> None:
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            logger.debug("Download cancelled.")
+
+    def _download_iter(self, scraper: Scraper, parts: List[str], loop: Optional[asyncio.AbstractEventLoop] = None,
+                       fields: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, List]]:
+        """
+        Hidden function that downloads parts and parses each page as soon as it arrives.
+
+        The download runs on the event loop in a background thread while pages are parsed on the
+        calling thread, so network waits and parsing overlap.
+
+        :param scraper: Scraper: The scraper to download with.
+        :param parts: List[str]: The parts to download.
+        :param loop: Optional[asyncio.AbstractEventLoop]: The event loop to download on, or None for a private loop.
+        :param fields: Optional[Sequence[str]]: If given, only these fields are parsed into named tuple records.
+        :return: Iterator[Tuple[str, List]]: The parts and their data object lists, in the order they complete.
+        """
+        logger.debug(f"Downloading html for {parts}...")
+
+        own_loop = loop is None
+        loop = asyncio.new_event_loop() if own_loop else loop
+        pages: "queue.Queue" = queue.Queue()
+        task = loop.create_task(self._produce(scraper, parts, pages))
+        thread = threading.Thread(target=self._run_download, args=(loop, task), name="pcpartpicker-download",
+                                  daemon=True)
+        start = time.perf_counter()
+        thread.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                part, page = item
+                yield part, self._parse_page(scraper.region, part, page, fields)
+            logger.debug(f"Completed downloading and parsing! Time elapsed is {time.perf_counter() - start} seconds.")
+        finally:
+            if not task.done():
+                loop.call_soon_threadsafe(task.cancel)
+            thread.join()
+            if own_loop:
+                loop.close()
+
+    def _profiled_download(self, scraper: Scraper, parts: List[str], profiler: Profiler,
+                           fields: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, List]]:
+        """
+        Hidden function that downloads all parts and then parses them one stage at a time.
+
+        Unlike _download_iter, downloading and parsing do not overlap, so that the time and memory
+        of every stage can be attributed to it alone.
+
+        :param scraper: Scraper: The scraper to download with.
+        :param parts: List[str]: The parts to download.
+        :param profiler: Profiler: The profiler that records the stages.
+        :param fields: Optional[Sequence[str]]: If given, only these fields are parsed into named tuple records.
+        :return: Iterator[Tuple[str, List]]: The parts and their data object lists.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            with profiler.stage("scrape"):
+                pages = loop.run_until_complete(scraper.retrieve(parts))
+        finally:
+            loop.close()
+        for part, page in pages.items():
+            yield part, self._parse_page(scraper.region, part, page, fields, profiler)
+
+    def _parse_page(self, region: str, part: str, page: Union[str, bytes],
+                    fields: Optional[Sequence[str]] = None, profiler: Optional[Profiler] = None) -> List:
+        from .parse_utils import parse
+
+        digest = None
+        if fields is None:
+            with profile_stage(profiler, "cache"):
+                digest = page_digest(page)
+                data = self._cache.peek((region, part))
+                unchanged = data is not None and self._page_digests.get((region, part)) == digest
+            if unchanged:
+                logger.debug(f"Page for {region}/{part} is unchanged, reusing the cached parts.")
+                with self._lock:
+                    self.parse_metrics.pages += 1
+                    self.parse_metrics.unchanged += 1
+                    self.parse_metrics.bytes_skipped += len(page)
+                return data
+
+        start = time.perf_counter()
+        rejected: Optional[List[QuarantinedItem]] = None if self.strict else []
+        data = parse({part: page}, self.compact_prices, fields, profiler, rejected)[part]
+        logger.debug(f"Completed parsing {part}! Time elapsed is {time.perf_counter() - start} seconds.")
+        if rejected:
+            logger.warning(f"Quarantined {len(rejected)} malformed item(s) of {region}/{part}, "
+                           f"e.g. item {rejected[0].index}: {rejected[0].reason}")
+        with self._lock:
+            if digest is not None:
+                self._page_digests[(region, part)] = digest
+            self.parse_metrics.pages += 1
+            self.parse_metrics.parsed += 1
+            self.parse_metrics.quarantined += len(rejected or ())
+        if rejected is not None:
+            self.quarantine.record(region, part, rejected)
+        return data
+
+    def _download(self, scraper: Scraper, parts: List[str], loop: asyncio.AbstractEventLoop,
+                  fields: Optional[Sequence[str]] = None) -> Dict[str, List]:
+        return dict(self._download_iter(scraper, parts, loop, fields))
+
+    def _store(self, region: str, parsed_data: Dict[str, List]) -> None:
+        refresh_time = time.time()
+        with self._lock:
+            views = self._view_caches.get(region)
+            for part, data in parsed_data.items():
+                self._cache.put((region, part), data)
+                self._refresh_times[(region, part)] = refresh_time
+                if views is not None:
+                    views.replace(part, data)
+        alerts = self._alerts
+        if alerts is not None:
+            for part, data in parsed_data.items():
+                if alerts.watches(region, part):
+                    alerts.evaluate(region, part, data)
+
+    def _cached(self, part: str, region: str) -> Optional[List]:
+        with self._lock:
+            refresh_time = self._refresh_times.get((region, part))
+            if refresh_time is None or time.time() - refresh_time >= self.max_age:
+                return None
+            return self._cache.get((region, part))
+
+    def _evicted(self, key: CacheKey) -> None:
+        if key not in self._cache:
+            # The parts were dropped rather than spilled, so they have no refresh time or page to compare with.
+            with self._lock:
+                self._refresh_times.pop(key, None)
+                self._page_digests.pop(key, None)
+        views = self._view_caches.get(key[0])
+        if views is not None:
+            views.discard(key[1])
+
+    def _fetch_iter(self, region: str, parts: List[str],
+                    download: Callable[[List[str]], Iterable[Tuple[str, List]]],
+                    profiler: Optional[Profiler] = None, detached: bool = False,
+                    fields: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, List]]:
+        """
+        Hidden function that downloads, parses and caches parts, coalescing concurrent requests.
+
+        Only one download per region and part is ever in flight. Threads that ask for a part that
+        is already being downloaded wait for that download instead of starting another one. Each
+        part is cached and handed to waiting threads as soon as it has been parsed.
+
+        Projected downloads (see fields) are shared by requests for the same fields and are not
+        cached. A projected request for a part whose full download is in flight waits for that
+        download and projects its parts instead.
+
+        :param region: str: The region that the parts are fetched from.
+        :param parts: List[str]: The parts to fetch.
+        :param download: Callable: Downloads and parses a list of parts, yielding each part with its data.
+        :param profiler: Optional[Profiler]: If given, storing the parts is profiled as the 'cache' stage.
+        :param detached: bool: Whether to download, parse and cache on a background thread. The parts are then
+        cached and handed to waiting threads even if the caller stops iterating early.
+        :param fields: Optional[Sequence[str]]: The fields that download parses into records, or None for full parts.
+        :return: Iterator[Tuple[str, List]]: The parts and their data object lists, in the order they complete.
+        """
+        from .mappings import part_classes
+        from .projection import projection
+
+        fields = None if fields is None else tuple(fields)
+        flights: Dict[str, _Flight] = {}
+        led: List[str] = []
+        with self._lock:
+            for part in parts:
+                key = (region, part, fields)
+                if fields is not None and (region, part, None) in self._flights:
+                    key = (region, part, None)
+                elif key not in self._flights:
+                    self._flights[key] = _Flight(key)
+                    led.append(part)
+                flights[part] = self._flights[key]
+
+        if led and detached:
+            landed: "queue.Queue" = queue.Queue()
+            # The parts are parsed on the thread, in the caller's validation mode.
+            thread = threading.Thread(target=contextvars.copy_context().run,
+                                      args=(self._forward, self._lead(region, led, flights, download), landed),
+                                      name="pcpartpicker-fetch", daemon=True)
+            thread.start()
+            while True:
+                item = landed.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        elif led:
+            yield from self._lead(region, led, flights, download, profiler)
+
+        for part in parts:
+            if part in led:
+                continue
+            flight = flights[part]
+            logger.debug(f"Waiting for the download of {part} in progress...")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if fields is not None and flight.key[2] is None:
+                fields_projection = projection(part_classes[part], fields)
+                yield part, [fields_projection.from_part(item) for item in flight.data]
+            else:
+                yield part, flight.data
+
+    def _lead(self, region: str, led: List[str], flights: Dict[str, _Flight],
+              download: Callable[[List[str]], Iterable[Tuple[str, List]]],
+              profiler: Optional[Profiler] = None) -> Iterator[Tuple[str, List]]:
+        pending = set(led)
+        try:
+            for part, data in download(led):
+                if flights[part].key[2] is None:
+                    with profile_stage(profiler, "cache"):
+                        self._store(region, {part: data})
+                self._land(flights[part], data=data)
+                pending.discard(part)
+                yield part, data
+            if pending:
+                raise RuntimeError(f"No data was downloaded for {sorted(pending)}!")
+        except GeneratorExit:
+            for part in pending:
+                self._land(flights[part],
+                           error=RuntimeError(f"The download of '{part}' was abandoned before it completed!"))
+            raise
+        except BaseException as error:
+            for part in pending:
+                self._land(flights[part], error=error)
+            raise
+
+    @staticmethod
+    def _forward(results: Iterator, landed: "queue.Queue") -> None:
+        try:
+            for item in results:
+                landed.put(item)
+            landed.put(None)
+        except BaseException as error:
+            landed.put(error)
+
+    def _land(self, flight: _Flight, data: Optional[List] = None, error: Optional[BaseException] = None) -> None:
+        flight.data, flight.error = data, error
+        with self._lock:
+            del self._flights[flight.key]
+        flight.done.set()
+
+    def _download_all(self, scraper: Scraper, parts: List[str],
+                      fields: Optional[Sequence[str]] = None) -> Iterable[Tuple[str, List]]:
+        loop = asyncio.new_event_loop()
+        try:
+            return self._download(scraper, parts, loop, fields).items()
+        finally:
+            loop.close()
+
+    def _fetch(self, region: str, scraper: Scraper, parts: List[str], profiler: Optional[Profiler] = None,
+               fields: Optional[Sequence[str]] = None) -> Dict[str, List]:
+        if profiler is None:
+            results = dict(self._fetch_iter(region, parts, lambda led: self._download_all(scraper, led, fields),
+                                            fields=fields))
+        else:
+            results = dict(self._fetch_iter(region, parts,
+                                            lambda led: self._profiled_download(scraper, led, profiler, fields),
+                                            profiler, fields=fields))
+        return {part: results[part] for part in parts}
+
+    def refresh(self, region: str, parts: Iterable[str]) -> Dict[str, List]:
+        """
+        Hidden function that downloads parts for any region and replaces their cached data.
+
+        This does not touch the current region or scraper, so it can be called from a background thread.
+
+        :param region: str: The region to refresh.
+        :param parts: Iterable[str]: The parts to refresh.
+        :return: dict: The freshly parsed parts mapped to their data object lists.
+        """
+        if region not in self._supported_regions:
+            raise UnsupportedRegion(f"Region '{region}' is not supported for this API!")
+        parts = list(parts)
+        self._verify_parts(parts)
+        return self._fetch(region, self._scraper(region), parts)
+
+    def snapshot(self, regions: Iterable[str], parts: Iterable[str]) -> Dict[str, Dict[str, List]]:
+        """
+        Hidden function that collects the part lists of several regions, downloading any that are not cached.
+
+        :param regions: Iterable[str]: The regions.
+        :param parts: Iterable[str]: The parts.
+        :return: dict: The part lists keyed by region and then by part.
+        """
+        parts = list(parts)
+        self._verify_parts(parts)
+        results: Dict[str, Dict[str, List]] = {}
+        for region in regions:
+            if region not in self._supported_regions:
+                raise UnsupportedRegion(f"Region '{region}' is not supported for this API!")
+            cached = {part: self._cached(part, region) for part in parts}
+            results[region] = {part: data for part, data in cached.items() if data is not None}
+            missing = [part for part in parts if part not in results[region]]
+            if missing:
+                results[region].update(self._fetch(region, self._scraper(region), missing))
+        return results
+
+    def sync_archive(self, source: Optional[str] = None, regions: Optional[Iterable[str]] = None,
+                     parts: Optional[Iterable[str]] = None) -> Dict[str, PartData]:
+        """
+        Hidden function that refreshes parts from a single archive of pages instead of one request per page.
+
+        :param source: Optional[str]: The http(s) URL or local path of a tar or zip archive. Defaults to the
+        archive next to the region directories of the best mirror.
+        :param regions: Optional[Iterable[str]]: Only load these regions, defaults to every supported region.
+        :param parts: Optional[Iterable[str]]: Only load these parts, defaults to every supported part.
+        :return: Dict[str, PartData]: The parsed parts keyed by region.
+        """
+        from .archive import default_archive_name, read_archive
+
+        regions = set(regions) if regions is not None else self._supported_regions
+        parts = set(parts) if parts is not None else self._supported_parts
+        self._verify_parts(parts)
+        for region in regions:
+            if region not in self._supported_regions:
+                raise UnsupportedRegion(f"Region '{region}' is not supported for this API!")
+
+        scraper = self._scraper(self._region)
+        archive: Union[str, bytes] = source
+        if source is None or source.startswith(("http://", "https://")):
+            start = time.perf_counter()
+            loop = asyncio.new_event_loop()
+            try:
+                download = scraper.fetch_path(default_archive_name) if source is None else scraper.fetch_url(source)
+                archive = loop.run_until_complete(download)
+            finally:
+                loop.close()
+            logger.debug(f"Downloaded {len(archive)} byte archive in {time.perf_counter() - start} seconds.")
+
+        results: Dict[str, PartData] = {}
+        for region, part, page in read_archive(archive):
+            if region not in regions or part not in parts:
+                logger.debug(f"Skipping {region}/{part} from the archive.")
+                continue
+            if self._page_store is not None:
+                self._page_store.save(region, part, page)
+            data = self._parse_page(region, part, page)
+            self._store(region, {part: data})
+            if region not in results:
+                with self._lock:
+                    results[region] = PartData(self._view_caches.setdefault(region, ViewCache()))
+            results[region][part] = data
+        return results
+
+    def _retrieve_projected(self, parts: Sequence[str], fields: Sequence[str], force_refresh: bool,
+                            profiler: Optional[Profiler] = None) -> PartData:
+        from .mappings import part_classes
+        from .projection import projection
+
+        projections = {part: projection(part_classes[part], fields) for part in parts}
+        with self._lock:
+            region, scraper = self._region, self.scraper
+        results: PartData = PartData()
+
+        if not force_refresh:
+            for part in parts:
+                with profile_stage(profiler, "cache"):
+                    data = self._cached(part, region)
+                if data is not None:
+                    logger.debug(f"Projecting cached data for {part}...")
+                    with profile_stage(profiler, "build"):
+                        results[part] = [projections[part].from_part(item) for item in data]
+
+        parts_to_download: List[str] = [part for part in parts if part not in results]
+        if parts_to_download:
+            results.update(self._fetch(region, scraper, parts_to_download, profiler, fields))
+        return results
+
+    def iter_retrieve(self, *args, force_refresh: bool = False,
+                      fields: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, List]]:
+        """
+        Hidden function that yields each requested part as soon as its data is available.
+
+        Cached parts are yielded first, then downloaded parts in the order that their pages finish
+        downloading and parsing. Pages are downloaded, parsed and cached on a background thread, so
+        other requests for the same parts never wait on a consumer that stops iterating early.
+
+        :param args: str: Variable number of arguments that must map to valid parts.
+        :param force_refresh: bool: Whether to ignore cached data.
+        :param fields: Optional[Sequence[str]]: If given, only these fields are converted and each part is
+        returned as a lightweight named tuple record. Projected downloads are not cached, but concurrent
+        requests for the same fields share one download, and a download of the full parts in flight is
+        projected instead of downloading again.
+        :return: Iterator[Tuple[str, List]]: The parts and their data object lists.
+        """
+        from .mappings import part_classes
+        from .projection import projection
+
+        self._verify_parts(args)
+        projections = None
+        if fields is not None:
+            projections = {part: projection(part_classes[part], fields) for part in args}
+        with self._lock:
+            region, scraper = self._region, self.scraper
+        return self._iter_retrieve(region, scraper, args, force_refresh, projections, fields)
+
+    def _iter_retrieve(self, region: str, scraper: Scraper, parts: Sequence[str], force_refresh: bool,
+                       projections: Optional[Dict], fields: Optional[Sequence[str]]) -> Iterator[Tuple[str, List]]:
+        missing: List[str] = []
+        for part in parts:
+            data = None if force_refresh else self._cached(part, region)
+            if data is None:
+                missing.append(part)
+            elif projections is None:
+                yield part, data
+            else:
+                yield part, [projections[part].from_part(item) for item in data]
+        if not missing:
+            return
+        yield from self._fetch_iter(region, missing, lambda led: self._download_iter(scraper, led, fields=fields),
+                                    detached=True, fields=fields)
+
+    def retrieve(self, *args, force_refresh=False, fields: Optional[Sequence[str]] = None,
+                 profiler: Optional[Profiler] = None) -> PartData:
         """
         Hidden function that is designed to retrieve and parse part data from PCPartPicker.
 
+        This is safe to call from multiple threads at once; concurrent requests for the same
+        part are served by a single download.
+
         :param args: str: Variable number of arguments that must map to valid parts.
         :param force_refresh: bool: This value determines whether or not to completely refresh the
         entire API database, or to simply retrieve cached values.
+        :param fields: Optional[Sequence[str]]: If given, only these fields are converted and each part is
+        returned as a lightweight named tuple record. Projected downloads are not cached, but concurrent
+        requests for the same fields share one download, and a download of the full parts in flight is
+        projected instead of downloading again.
+        :param profiler: Optional[Profiler]: If given, every stage of the retrieve is profiled, and downloading
+        and parsing run one after the other instead of overlapping.
         :return: dict: A part data object that contains the part names and their mapped data object values.
         """
-        results: PartData = PartData()
-
         # Verify the validity of the parts
-        for part in args:
-            if part not in self._supported_parts:
-                raise UnsupportedPart(f"Part '{part}' is not supported by this API!")
+        self._verify_parts(args)
+
+        if fields is not None:
+            return self._retrieve_projected(args, fields, force_refresh, profiler)
+
+        with self._lock:
+            region, scraper = self._region, self.scraper
+            views = self._view_caches.setdefault(region, ViewCache())
+        results: PartData = PartData(views)
 
         # Determine whether or not a refresh of part data should occur
-        for part in args:
-            if hasattr(self, f"{part_classes[part].__name__.lower()}_{self._region}"):
-                if time.time() - self._last_refresh < 600 and not force_refresh:
+        if not force_refresh:
+            for part in args:
+                with profile_stage(profiler, "cache"):
+                    data = self._cached(part, region)
+                if data is not None:
                     logger.debug(f"Retrieving cached data for {part}...")
-                    results[part] = getattr(self, f"{part_classes[part].__name__.lower()}_{self._region}")
+                    results[part] = data
 
         if len(results) == len(args):
             logger.debug(f"All parts were cached.")
             return results
 
         parts_to_download: List[str] = [part for part in args if part not in results]
-
-        logger.debug(f"Downloading html for {parts_to_download}...")
-
-        start = time.perf_counter()
-        loop = asyncio.get_event_loop()
-        raw_data: Dict[str, str] = loop.run_until_complete(self.scraper.retrieve(parts_to_download))
-        total_time = time.perf_counter() - start
-
-        logger.debug(f"Completed downloading! Time elapsed is {total_time} seconds.")
-
-        start = time.perf_counter()
-        parsed_data = parse(raw_data)
-        total_time = time.perf_counter() - start
-
-        logger.debug(f"Completed parsing! Time elapsed is {total_time} seconds.")
-
-        for part, data in parsed_data.items():
-            setattr(self, f"{part_classes[part].__name__.lower()}_{self._region}", data)
-            results[part] = data
+        results.update(self._fetch(region, scraper, parts_to_download, profiler))
         return results
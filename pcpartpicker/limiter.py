@@ -0,0 +1,258 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+
+@dataclass
+class LimiterMetrics:
+    """Dataclass that stores queueing statistics for outgoing requests."""
+
+    requests: int = 0
+    retries: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    throttled: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def mean_wait_time(self) -> float:
+        if not self.requests:
+            return 0.0
+        return self.total_wait_time / self.requests
+
+
+class TokenBucket:
+    """TokenBucket:
+
+    This class implements a token bucket that allows short bursts of requests while
+    enforcing a sustained request rate.
+
+    Attributes:
+        rate: float:
+            The number of tokens that are added to the bucket every second.
+        capacity: float:
+            The maximum number of tokens that the bucket can hold.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0:
+            raise ValueError("Rate limit must be a positive number!")
+        if capacity < 1:
+            raise ValueError("Burst size must be at least 1!")
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._tokens: float = capacity
+        self._last_update: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_update) * self.rate)
+        self._last_update = now
+
+    def try_acquire(self) -> float:
+        """
+        Function that takes a token if one is available.
+
+        :return: float: 0.0 if a token was taken, otherwise the number of seconds until one is available.
+        """
+
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> bool:
+        """
+        Coroutine that waits until a token is available and takes it.
+
+        :return: bool: Whether or not the caller had to wait for a token.
+        """
+
+        throttled = False
+        delay = self.try_acquire()
+        while delay:
+            throttled = True
+            await asyncio.sleep(delay)
+            delay = self.try_acquire()
+        return throttled
+
+
+def _grant(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class SharedSemaphore:
+    """SharedSemaphore:
+
+    This class implements a semaphore that can be acquired from coroutines running on different
+    event loops and threads, so that a limit holds for the whole process rather than for one loop.
+    Waiters are served in order and woken on their own loop.
+
+    Attributes:
+        value: int:
+            The number of slots that can be held at once.
+    """
+
+    def __init__(self, value: int) -> None:
+        self.value: int = value
+        self._available: int = value
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Coroutine that waits until a slot is available and takes it.
+
+        :return: None
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._available and not self._waiters:
+                self._available -= 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except BaseException:
+            with self._lock:
+                granted = waiter not in self._waiters
+                if not granted:
+                    self._waiters.remove(waiter)
+            # A slot handed over just before the waiter gave up is passed on to the next one.
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Function that returns a slot, handing it to the first waiter if there is one.
+
+        :return: None
+        """
+
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_grant, future)
+                    return
+                except RuntimeError:
+                    # The waiter's event loop was closed.
+                    continue
+            self._available += 1
+
+
+class RequestLimiter:
+    """RequestLimiter:
+
+    This class caps the number of simultaneous requests and applies a token bucket rate
+    limit to each host that requests are sent to.
+
+    Attributes:
+        concurrency_limit: Optional[int]:
+            The maximum number of requests that can be in flight at once, or None for no limit.
+        rate_limit: Optional[float]:
+            The sustained number of requests per second allowed for each host, or None for no limit.
+        burst: int:
+            The number of requests that can be sent to a host at once before the rate limit applies.
+        metrics: LimiterMetrics:
+            Queueing statistics for all requests that passed through this limiter.
+    """
+
+    def __init__(self, concurrency_limit: Optional[int] = 16, rate_limit: Optional[float] = None,
+                 burst: int = 10) -> None:
+        if concurrency_limit is not None and concurrency_limit < 1:
+            raise ValueError("Concurrency limit must be a positive integer!")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("Rate limit must be a positive number!")
+        self.concurrency_limit: Optional[int] = concurrency_limit
+        self.rate_limit: Optional[float] = rate_limit
+        self.burst: int = burst
+        self.metrics: LimiterMetrics = LimiterMetrics()
+        self._buckets: Dict[str, TokenBucket] = {}
+        # Handler runs a new event loop for every call and thread, so the cap is shared by all of them.
+        self._semaphore: Optional[SharedSemaphore] = \
+            SharedSemaphore(concurrency_limit) if concurrency_limit is not None else None
+        self._metrics_lock = threading.Lock()
+
+    def _bucket(self, host: str) -> Optional[TokenBucket]:
+        if self.rate_limit is None:
+            return None
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets.setdefault(host, TokenBucket(self.rate_limit, self.burst))
+        return bucket
+
+    def record_retry(self) -> None:
+        """
+        Function that counts a request that is about to be retried.
+
+        :return: None
+        """
+
+        with self._metrics_lock:
+            self.metrics.retries += 1
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Asynchronous context manager that holds a request slot for the given URL.
+
+        :param url: str: The URL that is about to be requested.
+        :return: AsyncIterator[None]
+        """
+
+        metrics = self.metrics
+        with self._metrics_lock:
+            metrics.waiting += 1
+            metrics.max_waiting = max(metrics.max_waiting, metrics.waiting)
+        start = time.perf_counter()
+        semaphore = self._semaphore
+        acquired = False
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+                acquired = True
+            bucket = self._bucket(urlsplit(url).netloc)
+            if bucket is not None and await bucket.acquire():
+                with self._metrics_lock:
+                    metrics.throttled += 1
+        except BaseException:
+            if acquired:
+                semaphore.release()
+            raise
+        finally:
+            with self._metrics_lock:
+                metrics.waiting -= 1
+        wait_time = time.perf_counter() - start
+        with self._metrics_lock:
+            metrics.requests += 1
+            metrics.total_wait_time += wait_time
+            metrics.max_wait_time = max(metrics.max_wait_time, wait_time)
+            metrics.in_flight += 1
+            metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+        try:
+            yield
+        finally:
+            with self._metrics_lock:
+                metrics.in_flight -= 1
+            if semaphore is not None:
+                semaphore.release()
@@ -1,30 +1,36 @@
-from typing import Dict, Callable
+from typing import Any, Dict
 
-from .parts import CPU, CPUCooler, Motherboard, Memory, EthernetCard, WirelessCard, Case, \
-    PSU, GPU, StorageDrive, Fan, FanController, ThermalPaste, OpticalDrive, SoundCard, \
-    Monitor, ExternalHDD, Headphones, Keyboard, Mouse, Speakers, UPS
-
-part_classes: Dict[str, Callable] = {
-    "cpu": CPU,
-    "cpu-cooler": CPUCooler,
-    "motherboard": Motherboard,
-    "memory": Memory,
-    "wired-network-card": EthernetCard,
-    "wireless-network-card": WirelessCard,
-    "case": Case,
-    "power-supply": PSU,
-    "video-card": GPU,
-    "internal-hard-drive": StorageDrive,
-    "case-fan": Fan,
-    "fan-controller": FanController,
-    "thermal-paste": ThermalPaste,
-    "optical-drive": OpticalDrive,
-    "sound-card": SoundCard,
-    "monitor": Monitor,
-    "external-hard-drive": ExternalHDD,
-    "headphones": Headphones,
-    "keyboard": Keyboard,
-    "mouse": Mouse,
-    "speakers": Speakers,
-    "ups": UPS
+part_class_names: Dict[str, str] = {
+    "cpu": "CPU",
+    "cpu-cooler": "CPUCooler",
+    "motherboard": "Motherboard",
+    "memory": "Memory",
+    "wired-network-card": "EthernetCard",
+    "wireless-network-card": "WirelessCard",
+    "case": "Case",
+    "power-supply": "PSU",
+    "video-card": "GPU",
+    "internal-hard-drive": "StorageDrive",
+    "case-fan": "Fan",
+    "fan-controller": "FanController",
+    "thermal-paste": "ThermalPaste",
+    "optical-drive": "OpticalDrive",
+    "sound-card": "SoundCard",
+    "monitor": "Monitor",
+    "external-hard-drive": "ExternalHDD",
+    "headphones": "Headphones",
+    "keyboard": "Keyboard",
+    "mouse": "Mouse",
+    "speakers": "Speakers",
+    "ups": "UPS"
 }
+
+
+def __getattr__(name: str) -> Any:
+    # part_classes is built on first use, since importing the part dataclasses pulls in moneyed.
+    if name == "part_classes":
+        from . import parts
+        globals()["part_classes"] = {part: getattr(parts, class_name)
+                                     for part, class_name in part_class_names.items()}
+        return globals()["part_classes"]
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,175 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
+"""
+    Mirror selection. Pages can be served by several sources: http(s) hosts
+    and local directories (plain paths or file:// URLs) laid out as
+    '<region>/<part>'. A MirrorSet tracks the latency and failures of each
+    source and ranks them, so that each request goes to the fastest healthy
+    mirror and fails over to the next one when a mirror errors.
+"""
+
+
+@dataclass
+class MirrorStats:
+    """Dataclass that stores the request statistics of one mirror."""
+
+    requests: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    latency: Optional[float] = None
+    last_error: Optional[float] = None
+
+    @property
+    def error_rate(self) -> float:
+        if not self.requests:
+            return 0.0
+        return self.errors / self.requests
+
+
+def local_path(source: str) -> Optional[str]:
+    """
+    Function that returns the directory of a local mirror, or None for a remote one.
+
+    Sources with a scheme other than http, https or file, e.g. 'ftp://' or a typo such as 'htps://',
+    raise a ValueError.
+
+    :param source: str: A URL such as 'https://host/pages/' or 'file:///srv/pages', or a plain directory path.
+    :return: Optional[str]: The directory, or None if the source is not local.
+    """
+
+    scheme = urlsplit(source).scheme
+    if scheme == "file":
+        from urllib.request import url2pathname
+        return url2pathname(urlsplit(source).path)
+    if scheme in ("http", "https"):
+        return None
+    # A single letter is the drive of a Windows path such as 'C:\\pages'.
+    if not scheme or len(scheme) == 1:
+        return source
+    raise ValueError(f"Mirror '{source}' has an unsupported scheme '{scheme}'! "
+                     f"Use an http(s) or file URL or a directory path.")
+
+
+class Mirror:
+    """Mirror:
+
+    This class is one source of part pages.
+
+    Attributes:
+        url: str:
+            The base URL or directory, ending with a separator.
+        path: Optional[str]:
+            The directory of a local mirror, or None for an http(s) mirror.
+        stats: MirrorStats:
+            The request statistics of the mirror.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url: str = url if url.endswith("/") else f"{url}/"
+        self.path: Optional[str] = local_path(self.url)
+        self.stats: MirrorStats = MirrorStats()
+
+    @property
+    def local(self) -> bool:
+        return self.path is not None
+
+    def resource(self, path: str) -> str:
+        if self.path is not None:
+            return os.path.join(self.path, *path.split("/"))
+        return f"{self.url}{path}"
+
+    def read(self, path: str) -> bytes:
+        with open(self.resource(path), "rb") as file:
+            return file.read()
+
+    def __repr__(self) -> str:
+        return f"Mirror({self.url!r})"
+
+
+class MirrorSet:
+    """MirrorSet:
+
+    This class ranks a list of mirrors by health and latency. Mirrors that failed within the
+    cooldown period rank after all healthy ones. Healthy mirrors without a measurement rank
+    first, in the order they were given, so that every mirror is tried; the rest are ordered
+    by their smoothed latency.
+
+    Attributes:
+        mirrors: List[Mirror]:
+            The mirrors, in the order they were given.
+        cooldown: float:
+            The number of seconds that a mirror ranks last after failing.
+        smoothing: float:
+            The weight of the newest latency measurement in the smoothed latency.
+    """
+
+    def __init__(self, sources: Union[str, Sequence[str]], cooldown: float = 30.0, smoothing: float = 0.3) -> None:
+        sources = [sources] if isinstance(sources, str) else list(sources)
+        if not sources:
+            raise ValueError("At least one mirror is required!")
+        self.mirrors: List[Mirror] = [Mirror(source) for source in sources]
+        self.cooldown: float = cooldown
+        self.smoothing: float = smoothing
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.mirrors)
+
+    def __iter__(self):
+        return iter(self.mirrors)
+
+    def _failing(self, mirror: Mirror, now: float) -> bool:
+        stats = mirror.stats
+        return stats.consecutive_errors > 0 and now - stats.last_error < self.cooldown
+
+    def ranked(self, exclude: Iterable[Mirror] = ()) -> List[Mirror]:
+        """
+        Function that returns the mirrors from the most to the least preferred.
+
+        :param exclude: Iterable[Mirror]: Mirrors that are moved to the end, e.g. because they already
+        failed for the current request.
+        :return: List[Mirror]: The ranked mirrors.
+        """
+
+        excluded = set(exclude)
+        now = time.monotonic()
+        with self._lock:
+            return sorted(self.mirrors, key=lambda mirror: (mirror in excluded, self._failing(mirror, now),
+                                                            mirror.stats.latency is not None,
+                                                            mirror.stats.latency or 0.0))
+
+    def best(self, exclude: Iterable[Mirror] = ()) -> Mirror:
+        return self.ranked(exclude)[0]
+
+    def record(self, mirror: Mirror, latency: Optional[float] = None, failed: bool = False) -> None:
+        """
+        Function that records the outcome of a request to a mirror.
+
+        :param mirror: Mirror: The mirror.
+        :param latency: Optional[float]: The seconds until the response started, if there was a response.
+        :param failed: bool: Whether the mirror failed, e.g. with a timeout, connection or server error.
+        :return: None
+        """
+
+        with self._lock:
+            stats = mirror.stats
+            stats.requests += 1
+            if latency is not None and stats.latency is None:
+                stats.latency = latency
+            elif latency is not None:
+                stats.latency += self.smoothing * (latency - stats.latency)
+            if failed:
+                stats.errors += 1
+                stats.consecutive_errors += 1
+                stats.last_error = time.monotonic()
+            else:
+                stats.consecutive_errors = 0
+
+    def stats(self) -> Dict[str, MirrorStats]:
+        with self._lock:
+            return {mirror.url: MirrorStats(**vars(mirror.stats)) for mirror in self.mirrors}
@@ -0,0 +1,110 @@
+import gzip
+import importlib.util
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+codec_extensions: Dict[str, str] = {"zstd": ".zst", "gzip": ".gz"}
+
+
+def has_zstandard() -> bool:
+    return importlib.util.find_spec("zstandard") is not None
+
+
+class PageStore:
+    """PageStore:
+
+    This class stores raw part pages on disk in compressed form so that a download
+    can be replayed later without touching the network.
+
+    Attributes:
+        root: str:
+            The directory in which pages are stored as '<region>/<part><extension>'.
+        codec: str:
+            The compression codec, either 'zstd' (requires the zstandard package) or 'gzip'.
+        level: int:
+            The compression level passed to the codec.
+    """
+
+    def __init__(self, root: str, codec: Optional[str] = None, level: int = 3) -> None:
+        if codec is None:
+            codec = "zstd" if has_zstandard() else "gzip"
+        if codec not in codec_extensions:
+            raise ValueError(f"Codec '{codec}' must be one of {tuple(codec_extensions)}!")
+        if codec == "zstd" and not has_zstandard():
+            raise ImportError("The zstandard package is required for zstd page storage!")
+        self.root: str = root
+        self.codec: str = codec
+        self.level: int = level
+
+    def path(self, region: str, part: str) -> str:
+        return os.path.join(self.root, region, f"{part}{codec_extensions[self.codec]}")
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            import zstandard
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return gzip.compress(data, compresslevel=self.level)
+
+    def _decompress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            import zstandard
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def save(self, region: str, part: str, page: bytes) -> None:
+        """
+        Function that compresses a raw page and writes it to disk.
+
+        The page is written to a temporary file first so that readers never see a partial page. Pages
+        can be saved from several threads at once.
+
+        :param region: str: The region that the page belongs to.
+        :param part: str: The part that the page belongs to.
+        :param page: bytes: The raw page.
+        :return: None
+        """
+
+        path = self.path(region, part)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self._compress(page))
+        os.replace(temp_path, path)
+        logger.debug(f"Stored {len(page)} bytes for {region}/{part}.")
+
+    def load(self, region: str, part: str) -> bytes:
+        with open(self.path(region, part), "rb") as file:
+            return self._decompress(file.read())
+
+    def contains(self, region: str, part: str) -> bool:
+        return os.path.isfile(self.path(region, part))
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """
+        Function that lists the stored pages.
+
+        :return: List[Tuple[str, str]]: The region and part of every stored page, sorted.
+        """
+
+        extension = codec_extensions[self.codec]
+        if not os.path.isdir(self.root):
+            return []
+        return sorted((region, name[:-len(extension)]) for region in os.listdir(self.root)
+                      if os.path.isdir(os.path.join(self.root, region))
+                      for name in os.listdir(os.path.join(self.root, region)) if name.endswith(extension))
+
+    def replay(self, region: str, parts: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Function that loads stored pages in the same form that Scraper.retrieve returns them.
+
+        :param region: str: The region to load.
+        :param parts: Iterable[str]: The parts to load.
+        :return: Dict[str, bytes]: The raw pages keyed by part.
+        """
+
+        return {part: self.load(region, part) for part in parts}
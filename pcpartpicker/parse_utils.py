@@ -1,35 +1,88 @@
 import json
 import re
-from decimal import Decimal
-from typing import Tuple, Dict, List
-
-from dacite import from_dict, Config
-from moneyed import Money
+from typing import TYPE_CHECKING, Tuple, Dict, List, Optional, Sequence, Union
 
+from .errors import DecodeError
 from .mappings import part_classes
 from .part_data import PartData
+from .prices import CompactPrice
+from .profiling import profile_stage
+from .projection import projection
+from .quarantine import QuarantinedItem, quarantine_rows
+from .schema import decoder, part_decoders, price_from_list
+
+if TYPE_CHECKING:
+    from .profiling import Profiler
+
+
+def compact_price_from_list(data: list) -> CompactPrice:
+    return price_from_list(data, True)
+
+
+def dataclass_from_dict(datatype, dictionary: dict, compact_prices: bool = False):
+    return decoder(datatype)(dictionary, compact_prices)
+
+
+body_pattern = re.compile('<body>(.*?)</body>', re.DOTALL)
+body_bytes_pattern = re.compile(b'<body>(.*?)</body>', re.DOTALL)
+
+
+def extract_body(page: Union[str, bytes]) -> Union[str, bytes]:
+    """
+    Function that returns the JSON payload between the body tags of a raw part page.
+
+    Pages downloaded as bytes are searched as bytes, so the payload is never copied into an
+    intermediate string before being decoded.
+
+    :param page: Union[str, bytes]: The raw page.
+    :return: Union[str, bytes]: The stripped payload.
+    """
+
+    pattern = body_bytes_pattern if isinstance(page, bytes) else body_pattern
+    return pattern.search(page).group(1).strip()
 
 
-def dataclass_from_dict(datatype, dictionary: dict):
-    result = {}
-    for field, data in dictionary.items():
-        if isinstance(data, list):
-            if not len(data) == 2 or not isinstance(data[0], str) or not isinstance(data[1], str):
-                raise RuntimeError
-            money = Money(Decimal(data[0]), data[1])
-            result.update({field: money})
-        else:
-            result.update({field: data})
-    dataclass = from_dict(datatype, result, config=Config(check_types=False))
-    return dataclass
+def deserialize_part_data(part_data: Tuple[str, Union[str, bytes]], compact_prices: bool = False,
+                          fields: Optional[Sequence[str]] = None, profiler: Optional["Profiler"] = None,
+                          rejected: Optional[List[QuarantinedItem]] = None) -> list:
+    """
+    Function that parses a raw part page into a list of parts.
 
+    :param part_data: Tuple[str, Union[str, bytes]]: The part name and its raw page.
+    :param compact_prices: bool: Whether prices are decoded as CompactPrice objects instead of Money.
+    :param fields: Optional[Sequence[str]]: If given, only these fields are parsed into named tuple records.
+    :param profiler: Optional[Profiler]: If given, the extract, decode and build stages are profiled.
+    :param rejected: Optional[List[QuarantinedItem]]: If given, items that fail to decode are appended
+    here and left out instead of failing the whole page. A DecodeError is still raised if every item fails.
+    :return: list: The parts.
+    """
 
-def deserialize_part_data(part_data: Tuple[str, str]) -> list:
-    body = re.findall('<body>(.*?)</body>', part_data[1], re.DOTALL)[0].strip().lstrip()
-    deserialized_parts = json.loads(body)
-    return [dataclass_from_dict(part_classes[part_data[0]], item) for item in deserialized_parts]
+    part = part_data[0]
+    with profile_stage(profiler, "extract"):
+        body = extract_body(part_data[1])
+    with profile_stage(profiler, "decode"):
+        deserialized_parts = json.loads(body)
+    with profile_stage(profiler, "build"):
+        if fields is not None:
+            projected = projection(part_classes[part], fields)
+            price = compact_price_from_list if compact_prices else price_from_list
+            try:
+                return [projected.from_dict(item, price) for item in deserialized_parts]
+            except DecodeError:
+                if rejected is None:
+                    raise
+            return quarantine_rows(part, deserialized_parts, lambda item: projected.from_dict(item, price), rejected)
+        decode = part_decoders()[part]
+        try:
+            return [decode(item, compact_prices) for item in deserialized_parts]
+        except DecodeError:
+            if rejected is None:
+                raise
+        return quarantine_rows(part, deserialized_parts, lambda item: decode(item, compact_prices), rejected)
 
 
-def parse(part_dict: Dict[str, str]) -> Dict[str, List]:
-    results = [deserialize_part_data(item) for item in part_dict.items()]
+def parse(part_dict: Dict[str, Union[str, bytes]], compact_prices: bool = False,
+          fields: Optional[Sequence[str]] = None, profiler: Optional["Profiler"] = None,
+          rejected: Optional[List[QuarantinedItem]] = None) -> Dict[str, List]:
+    results = [deserialize_part_data(item, compact_prices, fields, profiler, rejected) for item in part_dict.items()]
     return dict(zip(part_dict.keys(), results))
@@ -1,16 +1,155 @@
 from datetime import datetime
 import json
 from dataclasses import is_dataclass
-from moneyed import Money
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from .prices import CompactPrice
+from .views import Key, ViewCache
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
 
 
 class PartData(dict):
 
-    def __init__(self):
+    def __init__(self, views: Optional[ViewCache] = None):
         super().__init__()
         self.timestamp: datetime = datetime.now()
+        self._views: ViewCache = views if views is not None else ViewCache()
+
+    def __setitem__(self, part: str, parts: List) -> None:
+        super().__setitem__(part, parts)
+        self._views.replace(part, parts)
+
+    # dict.update, setdefault and |= do not call __setitem__, so they are routed through it.
+    def update(self, *args, **kwargs) -> None:
+        for part, parts in dict(*args, **kwargs).items():
+            self[part] = parts
+
+    def setdefault(self, part: str, parts: Optional[List] = None) -> Optional[List]:
+        if part not in self:
+            self[part] = parts
+        return self[part]
+
+    def __ior__(self, other) -> "PartData":
+        self.update(other)
+        return self
+
+    def sorted_view(self, part: str, key: Key = "price", reverse: bool = False) -> List:
+        """
+        Function that returns the parts of a category ordered by a key, leaving out parts without a value.
+
+        The ordering is cached, and when the data comes from the API it is patched incrementally
+        whenever the category is refreshed.
+
+        :param part: str: The part category.
+        :param key: Key: A field name such as 'price', 'price_per_gb' or 'boost_clock', or a key function.
+        :param reverse: bool: Order from the largest value to the smallest. This requires numeric values.
+        :return: list: The ordered parts.
+        """
+        return self._views.view(part, self[part], key, reverse).top()
+
+    def top_k(self, part: str, k: int = 10, key: Key = "price", reverse: bool = False) -> List:
+        """
+        Function that returns the k parts of a category with the smallest (or largest) key values.
+
+        The parts are selected with a bounded heap and the selection is cached like sorted_view.
+
+        :param part: str: The part category.
+        :param k: int: The number of parts to return.
+        :param key: Key: A field name such as 'price', 'price_per_gb' or 'boost_clock', or a key function.
+        :param reverse: bool: Select the largest values instead of the smallest. This requires numeric values.
+        :return: list: Up to k parts in order.
+        """
+        return self._views.view(part, self[part], key, reverse, limit=k).top(k)
+
+    def similar(self, part: str, item: Any, k: int = 5, features: Optional[Sequence[str]] = None,
+                weights: Optional[Dict[str, float]] = None) -> List:
+        """
+        Function that returns the k parts of a category that are most similar to a given part.
+
+        Similarity is the weighted distance between standardized numeric fields, e.g. vram, clocks,
+        length and price for video cards. The index is cached like sorted_view.
+
+        :param part: str: The part category.
+        :param item: Any: The part to find alternatives for; it is left out of the results.
+        :param k: int: The number of parts to return.
+        :param features: Optional[Sequence[str]]: The fields to compare, e.g. ['vram', 'boost_clock', 'price'],
+        or None for every numeric field.
+        :param weights: Optional[Dict[str, float]]: Weights for some fields, 1 by default.
+        :return: list: Up to k parts, most similar first.
+        """
+        return self._views.similarity(part, self[part], features, weights).similar(item, k)
+
+    def stats(self, part: str, group_by: Any = None, fields: Optional[Sequence[str]] = None,
+              percentiles: Optional[Sequence[float]] = None) -> Any:
+        """
+        Function that returns the count, min, max, mean and percentiles of the numeric fields of a category.
+
+        Every column is summarized in one vectorized pass when numpy is installed. The results are
+        cached like sorted_view and recomputed after the category is refreshed, except when grouping
+        by a key function.
+
+        :param part: str: The part category.
+        :param group_by: Any: A field name such as 'brand', 'socket' or 'form_factor', a list of field names,
+        a key function, or None to summarize the whole category.
+        :param fields: Optional[Sequence[str]]: The fields to summarize, e.g. ['price', 'boost_clock'],
+        or None for every numeric field.
+        :param percentiles: Optional[Sequence[float]]: The percentiles to compute, (25, 50, 75, 90) by default.
+        :return: Union[GroupStats, Mapping[Any, GroupStats]]: The read-only statistics of the category, or of each
+        group keyed by its value. Columns are named like the Arrow columns, e.g. 'price.amount' or 'boost_clock.cycles'.
+        """
+        return self._views.stats(part, self[part], fields, group_by, percentiles)
+
+    def to_arrow(self, part: str) -> "pyarrow.Table":
+        """
+        Function that converts a part category into an Arrow table with the fixed schema of its part class.
+
+        Unit objects are flattened into numeric columns such as 'boost_clock.cycles', and prices are split
+        into 'price.amount' and 'price.currency' columns. Requires pyarrow.
+
+        :param part: str: The part category.
+        :return: pyarrow.Table: The table.
+        """
+        from .arrow import part_table
+        from .mappings import part_classes
+
+        return part_table(part_classes[part], self[part])
+
+    def to_parquet(self, directory: str, **options) -> List[str]:
+        """
+        Function that writes every category to '<directory>/<part>.parquet'. Requires pyarrow.
+
+        :param directory: str: The output directory.
+        :param options: Keyword arguments passed on to pyarrow.parquet.write_table, e.g. compression.
+        :return: list: The written paths.
+        """
+        from .arrow import write_parquet
+
+        return write_parquet(((part, self.to_arrow(part)) for part in self), directory, **options)
+
+    def to_pandas(self, part: str) -> "pandas.DataFrame":
+        """
+        Function that converts a part category into a pandas DataFrame through Arrow.
+
+        The intermediate table is released while it is converted, and numeric columns without missing
+        values are handed to pandas without copying. Requires pyarrow and pandas.
+
+        :param part: str: The part category.
+        :return: pandas.DataFrame: The data frame.
+        """
+        return self.to_arrow(part).to_pandas(split_blocks=True, self_destruct=True)
+
+    @staticmethod
+    def _fields(item) -> dict:
+        values = item._asdict() if isinstance(item, tuple) and hasattr(item, "_fields") else item.__dict__
+        return {key: (value.currency, str(value.amount)) if isinstance(value, CompactPrice) else value
+                for key, value in values.items()}
 
     def to_json(self) -> str:
+        from moneyed import Money
+
         class CustomEncoder(json.JSONEncoder):
             def default(self, o):
                 if is_dataclass(o):
@@ -20,4 +159,5 @@ class PartData(dict):
                 if isinstance(o, datetime):
                     return str(o)
                 raise TypeError("Not JSON serializable!")
-        return json.dumps(self, indent=4, cls=CustomEncoder)
+        data = {part: [self._fields(item) for item in items] for part, items in self.items()}
+        return json.dumps(data, indent=4, cls=CustomEncoder)
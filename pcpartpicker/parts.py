@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import Union
+from typing import Iterable, List, Union
 
 from moneyed import Money
 
-from .utils import num
+from .prices import CompactPrice
+from .utils import build_many, num, scale_many
+from .validation import validated
 
 """
     Author: Jonathan Vusich
@@ -12,6 +14,10 @@ from .utils import num
 """
 
 
+Price = Union[Money, CompactPrice]
+price_types = (Money, CompactPrice)
+
+
 def check_typing(attribute, class_type):
     """"""
     if attribute:
@@ -19,6 +25,7 @@ def check_typing(attribute, class_type):
             raise ValueError(f"'{attribute}' must be of type '{class_type}'!")
 
 
+@validated
 @dataclass(frozen=True)
 class Range:
     """Base dataclass for different types of data ranges."""
@@ -32,6 +39,7 @@ class Range:
         check_typing(self.default, (float, int))
 
 
+@validated
 @dataclass(frozen=True)
 class Resolution:
     """Dataclass that stores resolution data for monitors."""
@@ -43,6 +51,7 @@ class Resolution:
         check_typing(self.height, int)
 
 
+@validated
 @dataclass(frozen=True, order=True)
 class Bytes:
     """Dataclass that stores byte numbers for easier user manipulation."""
@@ -117,7 +126,28 @@ class Bytes:
         num_bytes = int(number * 1000000000000000)
         return cls(num_bytes)
 
+    @classmethod
+    def from_kb_many(cls, numbers: Iterable) -> List["Bytes"]:
+        return build_many(cls, scale_many(numbers, 1000))
+
+    @classmethod
+    def from_mb_many(cls, numbers: Iterable) -> List["Bytes"]:
+        return build_many(cls, scale_many(numbers, 1000000))
+
+    @classmethod
+    def from_gb_many(cls, numbers: Iterable) -> List["Bytes"]:
+        return build_many(cls, scale_many(numbers, 1000000000))
+
+    @classmethod
+    def from_tb_many(cls, numbers: Iterable) -> List["Bytes"]:
+        return build_many(cls, scale_many(numbers, 1000000000000))
+
+    @classmethod
+    def from_pb_many(cls, numbers: Iterable) -> List["Bytes"]:
+        return build_many(cls, scale_many(numbers, 1000000000000000))
+
 
+@validated
 @dataclass(frozen=True)
 class RPM(Range):
     """Dataclass that stores RPM data for computer parts."""
@@ -131,6 +161,7 @@ class RPM(Range):
         check_typing(self.default, (float, int))
 
 
+@validated
 @dataclass(frozen=True)
 class Decibels(Range):
     """Dataclass that stores RPM data for computer parts."""
@@ -144,6 +175,7 @@ class Decibels(Range):
         check_typing(self.default, (float, int))
 
 
+@validated
 @dataclass(frozen=True)
 class CFM(Range):
     """Dataclass that stores RPM data for computer parts."""
@@ -157,6 +189,7 @@ class CFM(Range):
         check_typing(self.default, (float, int))
 
 
+@validated
 @dataclass(frozen=True)
 class FrequencyResponse(Range):
     """Dataclass that stores RPM data for computer parts."""
@@ -170,6 +203,7 @@ class FrequencyResponse(Range):
         check_typing(self.default, (float, int))
 
 
+@validated
 @dataclass(frozen=True, order=True)
 class ClockSpeed:
     """Dataclass that stores clock speed data for various parts."""
@@ -203,7 +237,16 @@ class ClockSpeed:
             check_typing(number, (float, int))
         return cls(int(number * 1000000))
 
+    @classmethod
+    def from_ghz_many(cls, numbers: Iterable) -> List["ClockSpeed"]:
+        return build_many(cls, scale_many(numbers, 1000000000))
+
+    @classmethod
+    def from_mhz_many(cls, numbers: Iterable) -> List["ClockSpeed"]:
+        return build_many(cls, scale_many(numbers, 1000000))
+
 
+@validated
 @dataclass(frozen=True, order=True)
 class NetworkSpeed:
     """Dataclass that stores network speed data."""
@@ -232,7 +275,16 @@ class NetworkSpeed:
         check_typing(number, (float, int))
         return cls(int(number * 1000000))
 
+    @classmethod
+    def from_gbits_many(cls, numbers: Iterable[float]) -> List["NetworkSpeed"]:
+        return build_many(cls, scale_many(numbers, 1000000000, strings=False))
+
+    @classmethod
+    def from_mbits_many(cls, numbers: Iterable[float]) -> List["NetworkSpeed"]:
+        return build_many(cls, scale_many(numbers, 1000000, strings=False))
+
 
+@validated
 @dataclass(frozen=True)
 class CPU:
     """CPU dataclass."""
@@ -245,7 +297,7 @@ class CPU:
     tdp: int
     integrated_graphics: str
     multithreading: bool
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -256,9 +308,10 @@ class CPU:
         check_typing(self.tdp, int)
         check_typing(self.integrated_graphics, str)
         check_typing(self.multithreading, bool)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class CPUCooler:
     """CPU Cooler dataclass."""
@@ -269,7 +322,7 @@ class CPUCooler:
     decibels: Decibels
     color: str
     radiator_size: int
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -278,9 +331,10 @@ class CPUCooler:
         check_typing(self.decibels, Decibels)
         check_typing(self.color, str)
         check_typing(self.radiator_size, int)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Motherboard:
     """Motherboard dataclass."""
@@ -292,7 +346,7 @@ class Motherboard:
     ram_slots: int
     max_ram: Bytes
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -302,9 +356,10 @@ class Motherboard:
         check_typing(self.ram_slots, int)
         check_typing(self.max_ram, Bytes)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Memory:
     """Memory dataclass."""
@@ -315,12 +370,12 @@ class Memory:
     speed: ClockSpeed
     number_of_modules: int
     module_size: Bytes
-    price_per_gb: Money
+    price_per_gb: Price
     color: str
     first_word_latency: float
     cas_timing: int
     error_correction: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -329,11 +384,11 @@ class Memory:
         check_typing(self.speed, ClockSpeed)
         check_typing(self.number_of_modules, int)
         check_typing(self.module_size, Bytes)
-        check_typing(self.price_per_gb, Money)
+        check_typing(self.price_per_gb, price_types)
         check_typing(self.color, str)
         check_typing(self.first_word_latency, float)
         check_typing(self.cas_timing, int)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
         check_typing(self.error_correction, str)
 
     @property
@@ -341,6 +396,7 @@ class Memory:
         return Bytes(self.number_of_modules * self.module_size.total)
 
 
+@validated
 @dataclass(frozen=True)
 class StorageDrive:
     """Dataclass for storage devices."""
@@ -348,27 +404,28 @@ class StorageDrive:
     brand: str
     model: str
     capacity: Bytes
-    price_per_gb: Money
+    price_per_gb: Price
     storage_type: str
     platter_rpm: int
     cache_amount: Bytes
     form_factor: str
     interface: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
         check_typing(self.model, str)
         check_typing(self.capacity, Bytes)
-        check_typing(self.price_per_gb, Money)
+        check_typing(self.price_per_gb, price_types)
         check_typing(self.storage_type, str)
         check_typing(self.platter_rpm, int)
         check_typing(self.cache_amount, Bytes)
         check_typing(self.form_factor, str)
         check_typing(self.interface, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class GPU:
     """GPU dataclass."""
@@ -381,7 +438,7 @@ class GPU:
     boost_clock: ClockSpeed
     color: str
     length: float
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -392,9 +449,10 @@ class GPU:
         check_typing(self.boost_clock, ClockSpeed)
         check_typing(self.color, str)
         check_typing(self.length, float)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class PSU:
     """PSU dataclass."""
@@ -406,7 +464,7 @@ class PSU:
     wattage: int
     modular: str
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -416,9 +474,10 @@ class PSU:
         check_typing(self.wattage, int)
         check_typing(self.modular, str)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Case:
     """PC case dataclass."""
@@ -431,7 +490,7 @@ class Case:
     side_panel: bool
     external_bays: int
     internal_bays: int
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -442,9 +501,10 @@ class Case:
         check_typing(self.psu_wattage, int)
         check_typing(self.external_bays, int)
         check_typing(self.internal_bays, int)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Fan:
     """CPU and case fan dataclass."""
@@ -457,7 +517,7 @@ class Fan:
     airflow: CFM
     decibels: Decibels
     pwm: bool
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -468,9 +528,10 @@ class Fan:
         check_typing(self.airflow, CFM)
         check_typing(self.decibels, Decibels)
         check_typing(self.pwm, bool)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class FanController:
     """Fan controller dataclass."""
@@ -482,7 +543,7 @@ class FanController:
     pwm: bool
     form_factor: str
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -492,25 +553,27 @@ class FanController:
         check_typing(self.pwm, bool)
         check_typing(self.form_factor, str)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class ThermalPaste:
     """Thermal paste dataclass."""
 
     brand: str
     model: str
-    amount: float
-    price: Money
+    amount: Union[float, int]
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
         check_typing(self.model, str)
         check_typing(self.amount, (float, int))
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class OpticalDrive:
     """Optical drive dataclass."""
@@ -523,7 +586,7 @@ class OpticalDrive:
     bluray_write_speed: str
     dvd_write_speed: str
     cd_write_speed: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -534,22 +597,23 @@ class OpticalDrive:
         check_typing(self.bluray_write_speed, str)
         check_typing(self.dvd_write_speed, str)
         check_typing(self.cd_write_speed, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class SoundCard:
     """Sound card dataclass."""
 
     brand: str
     model: str
-    channels: float
+    channels: Union[float, int]
     bitrate: int
     snr: int
     sample_rate: float
     chipset: str
     interface: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -560,9 +624,10 @@ class SoundCard:
         check_typing(self.sample_rate, float)
         check_typing(self.chipset, str)
         check_typing(self.interface, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class EthernetCard:
     """Ethernet card dataclass."""
@@ -573,7 +638,7 @@ class EthernetCard:
     port_speed: NetworkSpeed
     port_number: int
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -582,9 +647,10 @@ class EthernetCard:
         check_typing(self.port_speed, NetworkSpeed)
         check_typing(self.port_number, int)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class WirelessCard:
     """Wireless card dataclass."""
@@ -594,7 +660,7 @@ class WirelessCard:
     supported_protocols: str
     interface: str
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -602,22 +668,23 @@ class WirelessCard:
         check_typing(self.supported_protocols, str)
         check_typing(self.interface, str)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Monitor:
     """Monitor dataclass."""
 
     brand: str
     model: str
-    size: float
+    size: Union[float, int]
     resolution: Resolution
     refresh_rate: int
     response_time: float
     panel_type: str
     aspect_ratio: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -628,9 +695,10 @@ class Monitor:
         check_typing(self.response_time, float)
         check_typing(self.panel_type, str)
         check_typing(self.aspect_ratio, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class ExternalHDD:
     """External HDD dataclass."""
@@ -640,9 +708,9 @@ class ExternalHDD:
     type: str
     interface: str
     capacity: Bytes
-    price_per_gb: Money
+    price_per_gb: Price
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -650,11 +718,12 @@ class ExternalHDD:
         check_typing(self.type, str)
         check_typing(self.interface, str)
         check_typing(self.capacity, Bytes)
-        check_typing(self.price_per_gb, Money)
+        check_typing(self.price_per_gb, price_types)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Headphones:
     """Headphones dataclass."""
@@ -667,7 +736,7 @@ class Headphones:
     is_wireless: bool
     type: str
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -678,9 +747,10 @@ class Headphones:
         check_typing(self.is_wireless, bool)
         check_typing(self.type, str)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Keyboard:
     """Keyboard dataclass."""
@@ -693,7 +763,7 @@ class Keyboard:
     tenkeyless: bool
     connection: str
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -704,9 +774,10 @@ class Keyboard:
         check_typing(self.tenkeyless, bool)
         check_typing(self.connection, str)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Mouse:
     """Computer mouse dataclass."""
@@ -718,7 +789,7 @@ class Mouse:
     max_dpi: int
     hand_orientation: str
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -728,20 +799,21 @@ class Mouse:
         check_typing(self.max_dpi, int)
         check_typing(self.hand_orientation, str)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class Speakers:
     """Computer speakers dataclass."""
 
     brand: str
     model: str
-    channel_configuration: float
-    wattage: (float, int)
+    channel_configuration: Union[float, int]
+    wattage: Union[float, int]
     frequency_response: FrequencyResponse
     color: str
-    price: Money
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
@@ -750,9 +822,10 @@ class Speakers:
         check_typing(self.wattage, (float, int))
         check_typing(self.frequency_response, FrequencyResponse)
         check_typing(self.color, str)
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
 
 
+@validated
 @dataclass(frozen=True)
 class UPS:
     """UPS dataclass."""
@@ -760,12 +833,12 @@ class UPS:
     brand: str
     model: str
     watt_capacity: int
-    va_capacity: int
-    price: Money
+    va_capacity: Union[float, int]
+    price: Price
 
     def __post_init__(self):
         check_typing(self.brand, str)
         check_typing(self.model, str)
         check_typing(self.watt_capacity, int)
         check_typing(self.va_capacity, (float, int))
-        check_typing(self.price, Money)
+        check_typing(self.price, price_types)
@@ -0,0 +1,74 @@
+import sys
+from decimal import Decimal
+from typing import NamedTuple, Union
+
+"""
+    Compact price representation. Prices are stored as an integer number of
+    ten-thousandths of the currency unit together with an interned currency
+    code, which makes them cheap to build, compare and sort. The fixed scale is
+    finer than any currency's minor unit because values such as price_per_gb
+    carry sub-cent precision.
+"""
+
+price_digits: int = 4
+_cents = Decimal("0.01")
+
+
+class CompactPrice(NamedTuple):
+    """Price stored as integer units of 1/10000 of the currency, ordered by amount."""
+
+    units: int
+    currency: str
+
+    @classmethod
+    def from_decimal(cls, amount: Decimal, currency: str) -> "CompactPrice":
+        scaled = amount.scaleb(price_digits)
+        units = int(scaled)
+        if units != scaled:
+            raise ValueError(f"'{amount}' has more than {price_digits} decimal places and cannot be stored exactly!")
+        return cls(units, sys.intern(currency))
+
+    @classmethod
+    def from_string(cls, amount: str, currency: str) -> "CompactPrice":
+        # Plain decimal strings are converted with integer arithmetic only; anything else goes through Decimal.
+        whole, _, fraction = amount.partition(".")
+        if len(fraction) <= price_digits and fraction.isdigit() and whole.lstrip("-").isdigit():
+            return tuple.__new__(cls, (int(whole + fraction.ljust(price_digits, "0")), sys.intern(currency)))
+        return cls.from_decimal(Decimal(amount), currency)
+
+    @classmethod
+    def from_money(cls, money) -> "CompactPrice":
+        return cls.from_decimal(money.amount, money.currency.code)
+
+    @property
+    def amount(self) -> Decimal:
+        amount = Decimal(self.units).scaleb(-price_digits)
+        if amount == amount.quantize(_cents):
+            return amount.quantize(_cents)
+        return amount.normalize()
+
+    def to_money(self):
+        """
+        Function that converts this price into a moneyed Money object.
+
+        :return: Money: A Money object with the same amount and currency.
+        """
+
+        from moneyed import Money
+        return Money(self.amount, self.currency)
+
+    def __str__(self) -> str:
+        return f"{self.amount} {self.currency}"
+
+
+def price_key(price: Union["CompactPrice", object]) -> int:
+    """
+    Function that returns an integer sort key for either price representation.
+
+    :param price: Union[CompactPrice, Money]: The price.
+    :return: int: The price in units of 1/10000 of the currency.
+    """
+
+    if isinstance(price, CompactPrice):
+        return price.units
+    return CompactPrice.from_money(price).units
@@ -0,0 +1,244 @@
+import cProfile
+import contextlib
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import ContextManager, Dict, Iterator, List, Optional, Tuple
+
+"""
+    Per-stage profiling of retrieves. A Profiler runs cProfile and measures
+    tracemalloc allocations separately for each stage of a refresh: 'scrape'
+    (downloading the pages), 'extract' (finding the JSON payload in a page),
+    'decode' (JSON decoding), 'build' (converting the decoded items into part
+    objects) and 'cache' (cache lookups and stores). The results can be written
+    as a text summary, one pstats file per stage and collapsed stacks that
+    flamegraph.pl, speedscope or inferno can render.
+"""
+
+stages: Tuple[str, ...] = ("scrape", "extract", "decode", "build", "cache")
+
+_Function = Tuple[str, int, str]
+
+# tracemalloc.reset_peak was added in Python 3.9.
+_can_reset_peak: bool = hasattr(tracemalloc, "reset_peak")
+
+
+@dataclass
+class StageProfile:
+    """
+    Dataclass that holds the time, allocations and cProfile data of one profiled stage.
+
+    Before Python 3.9 the peak of a stage is only measured when it exceeds every earlier peak, and is
+    otherwise the net growth of the traced memory during the stage.
+    """
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    allocated: int = 0
+    peak: int = 0
+    profile: cProfile.Profile = field(default_factory=cProfile.Profile, repr=False)
+
+
+def _label(function: _Function) -> str:
+    file_name, line, name = function
+    if file_name == "~":
+        return name.replace(";", ":")
+    return f"{name} ({os.path.basename(file_name)}:{line})".replace(";", ":")
+
+
+def collapse(stats: Dict, root: Optional[str] = None, max_depth: int = 64) -> Dict[str, int]:
+    """
+    Function that converts cProfile statistics into collapsed stacks.
+
+    cProfile only records caller and callee pairs, so the time of a function that is called from
+    several places is split between its callers in proportion to the time spent under each of them.
+
+    :param stats: Dict: The 'stats' attribute of a pstats.Stats object.
+    :param root: Optional[str]: A frame that is put at the bottom of every stack, e.g. the stage name.
+    :param max_depth: int: The deepest stack that is followed.
+    :return: Dict[str, int]: The ';' separated stacks and the microseconds spent in their top frame.
+    """
+
+    callees: Dict[_Function, List[Tuple[_Function, float]]] = {}
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((function, edge[3]))
+    stacks: Dict[str, int] = {}
+
+    def walk(function: _Function, path: Tuple[str, ...], on_path: frozenset, fraction: float) -> None:
+        _, _, own_time, total_time, _ = stats[function]
+        path = path + (_label(function),)
+        own = int(own_time * fraction * 1e6)
+        if own > 0:
+            key = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + own
+        if len(path) >= max_depth:
+            return
+        on_path = on_path | {function}
+        for callee, edge_time in callees.get(function, ()):
+            callee_time = stats[callee][3]
+            share = fraction * edge_time / callee_time if callee_time else 0.0
+            if callee not in on_path and share * callee_time >= 1e-6:
+                walk(callee, path, on_path, share)
+
+    prefix = (root,) if root is not None else ()
+    for function, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            walk(function, prefix, frozenset(), 1.0)
+    return stacks
+
+
+class Profiler:
+    """Profiler:
+
+    This class collects cProfile and tracemalloc data for each stage of one or more retrieves.
+    tracemalloc is started when profiling starts if it is not already tracing, and stopped again
+    when profiling stops. Stages run one at a time; a stage entered on another thread waits for
+    the running one to finish.
+
+    Attributes:
+        stages: Dict[str, StageProfile]:
+            The profiled stages, in the order they were first entered.
+        seconds: float:
+            The wall time between starting and stopping the profiler.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, StageProfile] = {}
+        self.seconds: float = 0.0
+        self._lock = threading.RLock()
+        self._active: Optional[str] = None
+        self._started: Optional[float] = None
+        self._owns_tracemalloc: bool = False
+
+    def start(self) -> None:
+        if self._started is not None:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._started is None:
+            return
+        self.seconds += time.perf_counter() - self._started
+        self._started = None
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[StageProfile]:
+        """
+        Function that profiles the code run inside it as part of a stage.
+
+        :param name: str: The stage name, one of 'scrape', 'extract', 'decode', 'build' and 'cache'.
+        :return: Iterator[StageProfile]: A context manager that yields the stage.
+        """
+
+        with self._lock:
+            if self._active is not None:
+                raise RuntimeError(f"Stage '{name}' cannot be profiled inside stage '{self._active}'!")
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = StageProfile(name)
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                if _can_reset_peak:
+                    tracemalloc.reset_peak()
+                memory_before, peak_before = tracemalloc.get_traced_memory()
+            self._active = name
+            start = time.perf_counter()
+            stage.profile.enable()
+            try:
+                yield stage
+            finally:
+                stage.profile.disable()
+                stage.seconds += time.perf_counter() - start
+                stage.calls += 1
+                if tracing:
+                    memory_after, peak = tracemalloc.get_traced_memory()
+                    stage.allocated += memory_after - memory_before
+                    if not _can_reset_peak and peak == peak_before:
+                        # The stage stayed below an earlier peak, so only its net growth is known.
+                        peak = max(memory_before, memory_after)
+                    stage.peak = max(stage.peak, peak - memory_before)
+                self._active = None
+
+    def _ordered(self) -> List[StageProfile]:
+        return sorted(self.stages.values(),
+                      key=lambda stage: stages.index(stage.name) if stage.name in stages else len(stages))
+
+    def summary(self, limit: int = 15) -> str:
+        """
+        Function that describes where the profiled time and memory went.
+
+        :param limit: int: The number of functions listed for each stage, by cumulative time.
+        :return: str: A table of the stages followed by the busiest functions of each stage.
+        """
+
+        lines = [f"{'stage':<8} {'calls':>6} {'seconds':>9} {'share':>6} {'allocated':>11} {'peak':>11}"]
+        total = sum(stage.seconds for stage in self.stages.values())
+        for stage in self._ordered():
+            share = stage.seconds / total if total else 0.0
+            lines.append(f"{stage.name:<8} {stage.calls:>6} {stage.seconds:>9.3f} {share:>6.1%} "
+                         f"{stage.allocated / 1e6:>8.2f} MB {stage.peak / 1e6:>8.2f} MB")
+        lines.append(f"{'total':<8} {'':>6} {total:>9.3f}")
+        for stage in self._ordered():
+            stream = io.StringIO()
+            pstats.Stats(stage.profile, stream=stream).sort_stats("cumulative").print_stats(limit)
+            lines.append(f"\n=== {stage.name} ===")
+            lines.append(stream.getvalue().strip())
+        return "\n".join(lines) + "\n"
+
+    def collapsed(self) -> List[str]:
+        """
+        Function that returns the collapsed stacks of every stage, each rooted at its stage name.
+
+        :return: List[str]: Lines of the form 'stage;caller;callee microseconds'.
+        """
+
+        lines = []
+        for stage in self._ordered():
+            stacks = collapse(pstats.Stats(stage.profile).stats, stage.name)
+            lines.extend(f"{stack} {micros}" for stack, micros in sorted(stacks.items()))
+        return lines
+
+    def write(self, directory: str) -> List[str]:
+        """
+        Function that writes 'summary.txt', 'stacks.collapsed' and a '<stage>.prof' pstats file per stage.
+
+        :param directory: str: The output directory, which is created if needed.
+        :return: List[str]: The written paths.
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        paths = [os.path.join(directory, "summary.txt"), os.path.join(directory, "stacks.collapsed")]
+        with open(paths[0], "w") as file:
+            file.write(self.summary())
+        with open(paths[1], "w") as file:
+            file.writelines(f"{line}\n" for line in self.collapsed())
+        for stage in self._ordered():
+            path = os.path.join(directory, f"{stage.name}.prof")
+            stage.profile.dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+def profile_stage(profiler: Optional[Profiler], name: str) -> ContextManager:
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name)
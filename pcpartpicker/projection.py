@@ -0,0 +1,100 @@
+from collections import namedtuple
+from dataclasses import fields as dataclass_fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Tuple
+
+from .errors import DecodeError, UnsupportedField
+from .schema import decoder
+
+"""
+    Field projection. A Projection describes a subset of the fields of a part
+    dataclass and builds lightweight named tuple records holding only those
+    fields, so that unrequested nested objects are never constructed.
+"""
+
+
+class Projection:
+    """Projection:
+
+    This class holds the record type and field conversions for a subset of the fields of a part dataclass.
+
+    Attributes:
+        datatype: type:
+            The part dataclass that is projected.
+        fields: Tuple[str, ...]:
+            The projected field names, in record order.
+        record: type:
+            The named tuple type of the projected records.
+    """
+
+    def __init__(self, datatype: type, fields: Tuple[str, ...]) -> None:
+        known = {field.name: field for field in dataclass_fields(datatype)}
+        unknown = [field for field in fields if field not in known]
+        if unknown:
+            raise UnsupportedField(f"Field(s) {unknown} are not supported for '{datatype.__name__}'!")
+        repeated = sorted({field for field in fields if fields.count(field) > 1})
+        if repeated:
+            raise UnsupportedField(f"Field(s) {repeated} are requested more than once for '{datatype.__name__}'!")
+        self.datatype: type = datatype
+        self.fields: Tuple[str, ...] = fields
+        self.record: type = namedtuple(f"{datatype.__name__}Record", fields)
+        self._nested: Dict[str, type] = {field: known[field].type for field in fields
+                                         if is_dataclass(known[field].type)}
+        self._optional: FrozenSet[str] = frozenset(field for field, _, optional in decoder(datatype).fields
+                                                   if optional)
+
+    def from_dict(self, dictionary: dict, price) -> Any:
+        """
+        Function that builds a record from a raw part dictionary, converting only the projected fields.
+
+        :param dictionary: dict: The raw part dictionary.
+        :param price: Callable: The function that converts a raw [amount, currency] list into a price.
+        :return: Any: The record.
+        """
+
+        name = self.datatype.__name__
+        if not isinstance(dictionary, dict):
+            reason = f"expected an object, got {type(dictionary).__name__}"
+            raise DecodeError(f"Could not decode part '{name}': {reason}", name, reason=reason)
+        values = []
+        for field in self.fields:
+            try:
+                value = dictionary[field]
+            except KeyError:
+                # Missing fields are rejected like the full decoder does, unless they are optional.
+                if field not in self._optional:
+                    reason = "the field is missing"
+                    raise DecodeError(f"Could not decode field '{field}' of part '{name}': {reason}",
+                                      name, field, reason) from None
+                value = None
+            try:
+                if isinstance(value, list):
+                    value = price(value)
+                elif isinstance(value, dict) and field in self._nested:
+                    value = self._nested[field](**value)
+            except (RuntimeError, TypeError, ValueError, ArithmeticError) as error:
+                reason = f"{value!r} is malformed ({error!r})"
+                raise DecodeError(f"Could not decode field '{field}' of part '{name}': {reason}",
+                                  name, field, reason) from error
+            values.append(value)
+        return self.record._make(values)
+
+    def from_part(self, part: Any) -> Any:
+        return self.record._make([getattr(part, field) for field in self.fields])
+
+
+@lru_cache(maxsize=None)
+def _projection(datatype: type, fields: Tuple[str, ...]) -> Projection:
+    return Projection(datatype, fields)
+
+
+def projection(datatype: type, fields: Iterable[str]) -> Projection:
+    """
+    Function that returns the cached projection of a part dataclass onto the given fields.
+
+    :param datatype: type: The part dataclass.
+    :param fields: Iterable[str]: The field names to keep.
+    :return: Projection: The projection.
+    """
+
+    return _projection(datatype, tuple(fields))
@@ -0,0 +1,111 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .errors import DecodeError
+
+"""
+    Row-level quarantine. A single malformed item in a downloaded page should
+    not cost the whole category, so items that fail to decode are set aside
+    together with the reason they failed, the remaining items are kept and the
+    rejected ones are reported per region and part.
+"""
+
+
+@dataclass
+class QuarantinedItem:
+    """Dataclass that describes a raw item that could not be decoded."""
+
+    part: str
+    index: int
+    field: Optional[str]
+    reason: str
+    item: Any = field(repr=False)
+
+
+def quarantine_rows(part: str, items: Sequence, convert: Callable[[Any], Any],
+                    rejected: List[QuarantinedItem]) -> List:
+    """
+    Function that converts raw items one at a time, setting aside the items that fail to decode.
+
+    :param part: str: The part name, e.g. 'cpu'.
+    :param items: Sequence: The raw items.
+    :param convert: Callable[[Any], Any]: Converts a raw item, raising DecodeError if it is malformed.
+    :param rejected: List[QuarantinedItem]: The list that the rejected items are appended to.
+    :return: List: The converted items, in their original order.
+    """
+
+    results = []
+    first_error: Optional[DecodeError] = None
+    for index, item in enumerate(items):
+        try:
+            results.append(convert(item))
+        except DecodeError as error:
+            first_error = first_error or error
+            rejected.append(QuarantinedItem(part, index, error.field, error.reason or str(error), item))
+    if items and not results:
+        raise first_error
+    return results
+
+
+class Quarantine:
+    """Quarantine:
+
+    This class keeps the items that were rejected by the latest parse of each region and part.
+
+    Attributes:
+        max_items: int:
+            The number of rejected items that are kept per region and part. All of them are counted.
+        total: int:
+            The number of items rejected since the quarantine was created.
+    """
+
+    def __init__(self, max_items: int = 100) -> None:
+        self.max_items: int = max_items
+        self.total: int = 0
+        self._lock = threading.Lock()
+        self._items: Dict[Tuple[str, str], List[QuarantinedItem]] = {}
+        self._counts: Dict[Tuple[str, str], int] = {}
+
+    def record(self, region: str, part: str, rejected: Sequence[QuarantinedItem]) -> None:
+        """
+        Function that replaces the rejected items of a region and part with those of a new parse.
+
+        :param region: str: The region.
+        :param part: str: The part.
+        :param rejected: Sequence[QuarantinedItem]: The rejected items, which may be empty.
+        :return: None
+        """
+
+        with self._lock:
+            self.total += len(rejected)
+            if rejected:
+                self._items[(region, part)] = list(rejected[:self.max_items])
+                self._counts[(region, part)] = len(rejected)
+            else:
+                self._items.pop((region, part), None)
+                self._counts.pop((region, part), None)
+
+    def items(self, region: Optional[str] = None, part: Optional[str] = None) -> List[QuarantinedItem]:
+        with self._lock:
+            return [item for (item_region, item_part), items in self._items.items()
+                    if region in (None, item_region) and part in (None, item_part) for item in items]
+
+    def counts(self) -> Dict[Tuple[str, str], int]:
+        """
+        Function that returns how many items the latest parse of each region and part rejected.
+
+        :return: Dict[Tuple[str, str], int]: The counts keyed by region and part, for parses that rejected any.
+        """
+
+        with self._lock:
+            return dict(self._counts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._counts.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
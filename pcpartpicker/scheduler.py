@@ -0,0 +1,121 @@
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .errors import UnsupportedRegion
+from .handler import Handler
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+
+class RefreshScheduler:
+    """RefreshScheduler:
+
+    This class refreshes a configured set of (region, part) entries on a background thread so
+    that callers of the API are always served from memory. Entries are spread evenly over the
+    refresh interval, and entries of the same region that fall due together are downloaded in
+    a single batch.
+
+    Attributes:
+        interval: float:
+            The number of seconds between two refreshes of the same entry.
+        retry_interval: float:
+            The number of seconds to wait before retrying an entry whose refresh failed.
+        last_success: Dict[Tuple[str, str], float]:
+            The Unix timestamp of the last successful refresh of every entry.
+        last_error: Dict[Tuple[str, str], Exception]:
+            The error raised by the last failed refresh of every entry, if any.
+    """
+
+    def __init__(self, handler: Handler, entries: Iterable[Tuple[str, str]], interval: float = 300,
+                 retry_interval: Optional[float] = None) -> None:
+        if interval <= 0:
+            raise ValueError("Refresh interval must be a positive number!")
+        self._handler = handler
+        self._entries: List[Tuple[str, str]] = list(dict.fromkeys(entries))
+        for region, part in self._entries:
+            if region not in handler.supported_regions:
+                raise UnsupportedRegion(f"Region '{region}' is not supported for this API!")
+            handler._verify_parts([part])
+        self.interval: float = interval
+        self.retry_interval: float = retry_interval if retry_interval is not None else min(60.0, interval)
+        self.last_success: Dict[Tuple[str, str], float] = {}
+        self.last_error: Dict[Tuple[str, str], Exception] = {}
+        self._due: Dict[Tuple[str, str], float] = self._stagger()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def entries(self) -> List[Tuple[str, str]]:
+        return list(self._entries)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _stagger(self) -> Dict[Tuple[str, str], float]:
+        now = time.monotonic()
+        step = self.interval / len(self._entries) if self._entries else 0
+        return {entry: now + index * step for index, entry in enumerate(self._entries)}
+
+    def start(self) -> None:
+        """
+        Function that starts the background thread. Entries are first refreshed at staggered offsets.
+
+        :return: None
+        """
+        if self.running:
+            return
+        self._due = self._stagger()
+        self._stop.clear()
+        # Refreshed parts are built in the validation mode of the caller.
+        self._thread = threading.Thread(target=contextvars.copy_context().run, args=(self._run,),
+                                        name="pcpartpicker-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_pending(self) -> int:
+        """
+        Function that refreshes every entry that is due, grouped by region.
+
+        :return: int: The number of entries that were refreshed successfully.
+        """
+        now = time.monotonic()
+        due: Dict[str, List[str]] = defaultdict(list)
+        for (region, part), due_time in self._due.items():
+            if due_time <= now:
+                due[region].append(part)
+
+        refreshed = 0
+        for region, parts in due.items():
+            try:
+                self._handler.refresh(region, parts)
+            except Exception as error:
+                logger.warning(f"Refreshing {parts} for region '{region}' failed: {error!r}")
+                for part in parts:
+                    self.last_error[(region, part)] = error
+                    self._due[(region, part)] = time.monotonic() + self.retry_interval
+                continue
+            success_time = time.time()
+            for part in parts:
+                self.last_success[(region, part)] = success_time
+                self.last_error.pop((region, part), None)
+                self._due[(region, part)] = time.monotonic() + self.interval
+            refreshed += len(parts)
+        return refreshed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_pending()
+            if not self._due:
+                return
+            self._stop.wait(max(0.0, min(self._due.values()) - time.monotonic()))
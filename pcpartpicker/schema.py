@@ -0,0 +1,137 @@
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_type_hints
+
+from moneyed import Money
+
+from .errors import DecodeError
+from .prices import CompactPrice
+from .validation import field_types
+
+"""
+    Schema compiler for the part dataclasses. The annotations of each class are
+    inspected once and turned into a Decoder that converts a raw part
+    dictionary with a flat sequence of field reads, instead of re-inspecting
+    the type hints for every item.
+"""
+
+Converter = Callable[[Any, bool], Any]
+
+
+def price_from_list(data: list, compact_prices: bool = False):
+    if not len(data) == 2 or not isinstance(data[0], str) or not isinstance(data[1], str):
+        raise RuntimeError(f"Expected an [amount, currency] list of strings, got {data!r}!")
+    if compact_prices:
+        return CompactPrice.from_string(data[0], data[1])
+    return Money(Decimal(data[0]), data[1])
+
+
+def _convert_price(value: Any, compact_prices: bool) -> Any:
+    if isinstance(value, list):
+        return price_from_list(value, compact_prices)
+    return value
+
+
+def _is_optional(annotation: Any) -> bool:
+    return getattr(annotation, "__origin__", None) is Union and type(None) in annotation.__args__
+
+
+def is_price(annotation: Any) -> bool:
+    return Money in field_types(annotation) or CompactPrice in field_types(annotation)
+
+
+class Decoder:
+    """Decoder:
+
+    This class converts raw part dictionaries into instances of one dataclass.
+
+    Attributes:
+        datatype: type:
+            The dataclass that is decoded.
+        fields: Tuple[Tuple[str, Optional[Converter], bool], ...]:
+            The field name, value converter and whether the field may be missing, for every field.
+    """
+
+    def __init__(self, datatype: type) -> None:
+        hints = get_type_hints(datatype)
+        self.datatype: type = datatype
+        compiled = []
+        for field in fields(datatype):
+            annotation = hints.get(field.name, field.type)
+            converter: Optional[Converter] = None
+            if is_price(annotation):
+                converter = _convert_price
+            elif is_dataclass(annotation):
+                converter = _nested(decoder(annotation))
+            compiled.append((field.name, converter, _is_optional(annotation)))
+        self.fields: Tuple[Tuple[str, Optional[Converter], bool], ...] = tuple(compiled)
+
+    def _error(self, field: str, reason: str) -> DecodeError:
+        return DecodeError(f"Could not decode field '{field}' of part '{self.datatype.__name__}': {reason}",
+                           self.datatype.__name__, field, reason)
+
+    def __call__(self, dictionary: dict, compact_prices: bool = False) -> Any:
+        values = {}
+        for name, converter, optional in self.fields:
+            try:
+                value = dictionary[name]
+            except KeyError:
+                if not optional:
+                    raise self._error(name, "the field is missing") from None
+                value = None
+            except TypeError:
+                reason = f"expected an object, got {type(dictionary).__name__}"
+                raise DecodeError(f"Could not decode part '{self.datatype.__name__}': {reason}",
+                                  self.datatype.__name__, reason=reason) from None
+            if converter is not None and value is not None:
+                try:
+                    value = converter(value, compact_prices)
+                except DecodeError as error:
+                    raise self._error(f"{name}.{error.field}", error.reason) from error
+                except (RuntimeError, TypeError, ValueError, ArithmeticError) as error:
+                    raise self._error(name, f"{value!r} is malformed ({error!r})") from error
+            values[name] = value
+        try:
+            return self.datatype(**values)
+        except ValueError as error:
+            raise self._error(self._invalid_field(values), str(error)) from error
+
+    def _invalid_field(self, values: Dict[str, Any]) -> str:
+        for field in fields(self.datatype):
+            value = values[field.name]
+            if value and not isinstance(value, field_types(field.type)):
+                return field.name
+        return "?"
+
+
+def _nested(nested_decoder: Decoder) -> Converter:
+    def convert(value: Any, compact_prices: bool) -> Any:
+        if isinstance(value, dict):
+            return nested_decoder(value, compact_prices)
+        return value
+    return convert
+
+
+@lru_cache(maxsize=None)
+def decoder(datatype: type) -> Decoder:
+    """
+    Function that returns the compiled decoder for a dataclass, compiling it on first use.
+
+    :param datatype: type: The dataclass.
+    :return: Decoder: The decoder.
+    """
+
+    return Decoder(datatype)
+
+
+@lru_cache(maxsize=None)
+def part_decoders() -> Dict[str, Decoder]:
+    """
+    Function that compiles the decoders of every supported part class.
+
+    :return: Dict[str, Decoder]: The decoders keyed by part name.
+    """
+
+    from .mappings import part_classes
+    return {part: decoder(datatype) for part, datatype in part_classes.items()}
@@ -1,12 +1,39 @@
 import asyncio
+import importlib.util
 import logging
-from typing import Iterable, Dict
+import os
+import time
+from typing import (TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterable, Dict, Optional, Sequence, Set,
+                    Tuple, TypeVar, Union)
 
-import aiohttp
+from .limiter import RequestLimiter
+from .mirrors import Mirror, MirrorSet, MirrorStats
+from .page_store import PageStore
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARN)
 
+T = TypeVar("T")
+
+
+def accept_encoding() -> str:
+    """
+    Function that returns the content encodings that the installed decoders can handle.
+
+    :return: str: The value of the Accept-Encoding header.
+    """
+
+    # aiohttp decodes brotli responses with the 'brotli' package whenever it is installed.
+    if importlib.util.find_spec("brotli") is not None:
+        return "br, gzip, deflate"
+    return "gzip, deflate"
+
+
+default_base_url: str = "https://jonathanvusich.github.io/pcpartpicker-scraper/"
+
 
 class Scraper:
     """Scraper:
@@ -17,34 +44,206 @@ class Scraper:
         region: str:
             This variable holds the region that is used to build URLs for PCPartPicker.
         base_url: str:
-            This variable holds the product URL from which the actual request URLs are built.
+            This variable holds the product URL of the first mirror.
+        mirrors: MirrorSet:
+            The mirrors that requests are routed to, the fastest healthy one first.
+        limiter: RequestLimiter:
+            This variable holds the concurrency and rate limits that are applied to every request.
+        page_store: Optional[PageStore]:
+            If set, every raw page that is downloaded is also stored compressed for later replay.
+        max_retries: int:
+            The number of times a request that timed out or hit a server error is retried. With several
+            mirrors, each retry goes to the next best mirror, and every mirror is tried at least once.
 
     """
 
-    def __init__(self, region: str = "us") -> None:
+    def __init__(self, region: str = "us", limiter: Optional[RequestLimiter] = None,
+                 page_store: Optional[PageStore] = None,
+                 base_url: Union[str, Sequence[str], MirrorSet, None] = None) -> None:
         self.region: str = region
-        self.base_url: str = "https://jonathanvusich.github.io/pcpartpicker-scraper/"
+        if isinstance(base_url, MirrorSet):
+            self.mirrors: MirrorSet = base_url
+        else:
+            self.mirrors = MirrorSet(base_url if base_url is not None else default_base_url)
+        self.base_url: str = self.mirrors.mirrors[0].url
+        self.limiter: RequestLimiter = limiter if limiter is not None else RequestLimiter()
+        self.page_store: Optional[PageStore] = page_store
+        self.max_retries: int = 3
 
     def generate_product_url(self, part: str) -> str:
         return f"{self.base_url}{self.region}/{part}"
 
-    async def retrieve(self, args: Iterable[str]) -> Dict[str, str]:
-        parts = [arg for arg in args]
-        urls = [self.generate_product_url(part) for part in parts]
+    async def _fetch_from(self, session: "aiohttp.ClientSession", mirror: Mirror, path: str) -> Tuple[bytes, float]:
+        start = time.perf_counter()
+        if mirror.local:
+            data = await asyncio.get_running_loop().run_in_executor(None, mirror.read, path)
+            return data, time.perf_counter() - start
+        url = mirror.resource(path)
+        async with self.limiter.slot(url):
+            start = time.perf_counter()
+            async with session.get(url) as response:
+                latency = time.perf_counter() - start
+                response.raise_for_status()
+                return await response.read(), latency
+
+    async def _fetch_path(self, session: "aiohttp.ClientSession", path: str) -> bytes:
+        """
+        Hidden function that fetches a path such as 'us/cpu' from the best mirror, failing over to the others.
+
+        Mirrors that time out, refuse the connection or answer with a server error are marked as failing
+        and the request moves on to the next best mirror. A missing page is also looked up on the mirrors
+        that have not been tried yet.
+
+        :param session: aiohttp.ClientSession: The session for http(s) mirrors.
+        :param path: str: The path relative to the mirror roots.
+        :return: bytes: The response body.
+        """
+
+        tried: Set[Mirror] = set()
+        attempts = max(self.max_retries, len(self.mirrors) - 1) + 1
+        for attempt in range(attempts):
+            mirror = self.mirrors.best(tried)
+            try:
+                data, latency = await self._fetch_from(session, mirror, path)
+            except Exception as error:
+                unreachable = self._unreachable(error)
+                self.mirrors.record(mirror, failed=unreachable)
+                tried.add(mirror)
+                failover = len(tried) < len(self.mirrors) and (unreachable or self._missing(error))
+                if attempt == attempts - 1 or not (failover or self._retryable(error)):
+                    raise
+                logger.debug(f"Fetching {path} from {mirror.url} failed with {error!r}! Retrying...")
+                self.limiter.record_retry()
+                if len(tried) == len(self.mirrors):
+                    tried.clear()
+                continue
+            self.mirrors.record(mirror, latency)
+            return data
+
+    async def _fetch(self, session: "aiohttp.ClientSession", part: str) -> Tuple[str, bytes]:
+        page = await self._fetch_path(session, f"{self.region}/{part}")
+        if self.page_store is not None:
+            # Compressing and writing the page would stall every other download on the event loop.
+            await asyncio.get_running_loop().run_in_executor(None, self.page_store.save, self.region, part, page)
+        return part, page
+
+    @staticmethod
+    def _retryable(result) -> bool:
+        import aiohttp
+
+        if isinstance(result, asyncio.TimeoutError):
+            return True
+        return isinstance(result, aiohttp.ClientResponseError) and (result.status >= 500 or result.status == 429)
+
+    @staticmethod
+    def _missing(error: BaseException) -> bool:
+        import aiohttp
+
+        if isinstance(error, FileNotFoundError):
+            return True
+        return isinstance(error, aiohttp.ClientResponseError) and error.status == 404
+
+    def _unreachable(self, error: BaseException) -> bool:
+        import aiohttp
+
+        if self._retryable(error):
+            return True
+        return isinstance(error, (aiohttp.ClientConnectionError, OSError)) and not self._missing(error)
+
+    async def _with_retries(self, name: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await fetch()
+            except Exception as error:
+                if not self._retryable(error) or attempt == self.max_retries:
+                    raise
+                logger.debug(f"Fetching data for {name} failed with {error!r}! Retrying...")
+                self.limiter.record_retry()
+
+    async def fetch_path(self, path: str) -> bytes:
+        """
+        Function that downloads a path relative to the mirror roots, such as a page archive, from the best mirror.
+
+        :param path: str: The path, e.g. 'archive.tar.gz'.
+        :return: bytes: The response body.
+        """
+        import aiohttp
+
+        async with aiohttp.ClientSession(headers={"Accept-Encoding": accept_encoding()}) as session:
+            return await self._fetch_path(session, path)
+
+    async def _probe(self, session: "aiohttp.ClientSession", mirror: Mirror, path: str) -> None:
+        start = time.perf_counter()
+        try:
+            if mirror.local:
+                await asyncio.get_running_loop().run_in_executor(None, os.stat, mirror.resource(path))
+            else:
+                url = mirror.resource(path)
+                async with self.limiter.slot(url):
+                    start = time.perf_counter()
+                    async with session.head(url) as response:
+                        response.raise_for_status()
+        except Exception as error:
+            logger.debug(f"Probing {mirror.url} failed with {error!r}!")
+            self.mirrors.record(mirror, failed=self._unreachable(error))
+            return
+        self.mirrors.record(mirror, time.perf_counter() - start)
+
+    async def probe(self, part: str = "cpu") -> Dict[str, MirrorStats]:
+        """
+        Function that measures the latency of every mirror with a HEAD request for one page.
+
+        Probing before a large refresh lets the first requests go to the fastest mirror instead of
+        trying each mirror in turn.
+
+        :param part: str: The part whose page is requested from each mirror.
+        :return: Dict[str, MirrorStats]: The statistics of each mirror, keyed by its URL.
+        """
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
-            requests = [session.get(url) for url in urls]
-            results = await asyncio.gather(*requests, return_exceptions=True)
-            retry_parts = []
-            final_results = {}
-            for part, result in zip(parts, results):
-                if isinstance(result, asyncio.TimeoutError):
-                    logger.debug(f"Fetching data for {part} timed out! Retrying...")
-                    retry_parts.append(part)
-                elif isinstance(result, Exception):
-                    raise result
-                else:
-                    final_results.update({part: await result.text()})
-
-        if retry_parts:
-            final_results.update(await self.retrieve(retry_parts))
-        return final_results
+            await asyncio.gather(*(self._probe(session, mirror, f"{self.region}/{part}") for mirror in self.mirrors))
+        return self.mirrors.stats()
+
+    async def fetch_url(self, url: str) -> bytes:
+        """
+        Function that downloads a single URL, such as a page archive, with the usual limits and retries.
+
+        :param url: str: The URL.
+        :return: bytes: The response body.
+        """
+        import aiohttp
+
+        async def fetch() -> bytes:
+            async with self.limiter.slot(url):
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.read()
+
+        async with aiohttp.ClientSession(headers={"Accept-Encoding": accept_encoding()}) as session:
+            return await self._with_retries(url, fetch)
+
+    async def stream(self, args: Iterable[str]) -> AsyncIterator[Tuple[str, bytes]]:
+        """
+        Function that downloads parts concurrently and yields each page as soon as it has arrived.
+
+        Requests that time out or hit a server error are retried on their own, without holding up
+        the other parts. The first request that fails for good cancels the rest.
+
+        :param args: Iterable[str]: The parts to download.
+        :return: AsyncIterator[Tuple[str, bytes]]: The parts and their raw pages, in the order they complete.
+        """
+        import aiohttp
+
+        async with aiohttp.ClientSession(headers={"Accept-Encoding": accept_encoding()}) as session:
+            tasks = [asyncio.ensure_future(self._fetch(session, part)) for part in args]
+            try:
+                for completed in asyncio.as_completed(tasks):
+                    yield await completed
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def retrieve(self, args: Iterable[str]) -> Dict[str, bytes]:
+        return {part: page async for part, page in self.stream(args)}
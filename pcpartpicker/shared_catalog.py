@@ -0,0 +1,440 @@
+import importlib.util
+import json
+import os
+import sys
+import mmap
+import struct
+from array import array
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from .part_data import PartData
+from .prices import CompactPrice, price_key
+from .schema import is_price, decoder
+
+"""
+    Shared, read-only part catalog. One process encodes the part lists of any
+    number of regions into a single columnar buffer, either in a
+    multiprocessing.shared_memory segment or in a snapshot file, and every
+    worker process attaches views onto that buffer instead of holding its own
+    copy of the parsed parts. Parts are only materialized when they are read.
+    Shared memory segments require Python 3.8 or later; snapshot files work
+    on every supported version.
+"""
+
+magic: bytes = b"PCPCAT01"
+_prefix = struct.Struct("<8sQ")
+Catalog = Mapping[str, Mapping[str, Sequence]]
+
+# Segments created by this process, which its resource tracker already knows about.
+_created: Set[str] = set()
+
+
+def has_shared_memory() -> bool:
+    return importlib.util.find_spec("multiprocessing.shared_memory") is not None
+
+
+def _require_shared_memory():
+    if not has_shared_memory():
+        raise RuntimeError("Shared memory catalogs require Python 3.8 or later! "
+                           "Use SharedCatalog.save and SharedCatalog.open instead.")
+    from multiprocessing import shared_memory
+    return shared_memory
+
+
+def _align(buffer: bytearray) -> int:
+    buffer.extend(bytes(-len(buffer) % 8))
+    return len(buffer)
+
+
+def _column_kind(values: Sequence) -> str:
+    present = [value for value in values if value is not None]
+    if not present:
+        return "none"
+    if all(type(value) is bool for value in present):
+        return "bool"
+    if all(type(value) is int for value in present):
+        return "int"
+    if all(type(value) is float for value in present):
+        return "float"
+    if all(type(value) in (int, float) for value in present):
+        return "number"
+    if all(isinstance(value, str) for value in present):
+        return "str"
+    return "json"
+
+
+def _encode_column(values: Sequence, data: bytearray) -> Dict[str, Any]:
+    kind = _column_kind(values)
+    column: Dict[str, Any] = {"kind": kind, "mask": None}
+    if kind == "none":
+        return column
+    if any(value is None for value in values):
+        column["mask"] = _align(data)
+        data.extend(bytes(value is not None for value in values))
+    if kind in ("str", "json"):
+        encoded = [b"" if value is None else (value if kind == "str" else json.dumps(value)).encode()
+                   for value in values]
+        offsets = array("q", [0])
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+        column["offsets"] = _align(data)
+        data.extend(offsets.tobytes())
+        column["offset"] = _align(data)
+        data.extend(b"".join(encoded))
+        return column
+    if kind == "number":
+        # Mixed int and float values: the ints are kept exact in a separate int64 array.
+        column["integers"] = _align(data)
+        data.extend(array("q", [value if type(value) is int else 0 for value in values]).tobytes())
+        column["is_integer"] = _align(data)
+        data.extend(bytes(type(value) is int for value in values))
+        values = [float(value) if type(value) is int else value for value in values]
+    typecode = {"bool": "B", "int": "q", "float": "d", "number": "d"}[kind]
+    default = 0.0 if kind in ("float", "number") else 0
+    column["offset"] = _align(data)
+    data.extend(array(typecode, [default if value is None else value for value in values]).tobytes())
+    return column
+
+
+def _columns(datatype: type, parts: Sequence) -> Dict[str, List]:
+    columns: Dict[str, List] = {}
+    for field in fields(datatype):
+        values = [getattr(part, field.name) for part in parts]
+        if is_price(field.type):
+            columns[field.name] = [None if value is None else price_key(value) for value in values]
+            columns[f"{field.name}.currency"] = [None if value is None else
+                                                 value.currency if isinstance(value, CompactPrice) else
+                                                 value.currency.code for value in values]
+        elif is_dataclass(field.type):
+            columns[field.name] = [value is not None for value in values]
+            for nested in fields(field.type):
+                columns[f"{field.name}.{nested.name}"] = [None if value is None else getattr(value, nested.name)
+                                                          for value in values]
+        else:
+            columns[field.name] = values
+    return columns
+
+
+def encode_catalog(catalog: Catalog) -> bytes:
+    """
+    Function that encodes the part lists of several regions into one columnar catalog buffer.
+
+    :param catalog: Catalog: The part lists (e.g. PartData objects) keyed by region and then by part.
+    :return: bytes: The encoded catalog.
+    """
+
+    from .mappings import part_classes
+
+    data = bytearray()
+    entries: Dict[str, Dict[str, Any]] = {}
+    for region, part_lists in catalog.items():
+        entries[region] = {}
+        for part, parts in part_lists.items():
+            datatype = part_classes[part]
+            if any(type(item) is not datatype for item in parts):
+                raise TypeError(f"Only complete '{datatype.__name__}' objects can be added to a shared catalog!")
+            columns = {name: _encode_column(values, data) for name, values in _columns(datatype, parts).items()}
+            entries[region][part] = {"length": len(parts), "columns": columns}
+    header = json.dumps({"entries": entries}).encode()
+    prefix = bytearray(_prefix.pack(magic, len(header)) + header)
+    _align(prefix)
+    return bytes(prefix + data)
+
+
+class _Column:
+    """A read-only column of a shared catalog, read straight from the shared buffer."""
+
+    def __init__(self, buffer: memoryview, column: Dict[str, Any], length: int) -> None:
+        self.kind: str = column["kind"]
+        self._length = length
+        self._mask: Optional[memoryview] = None
+        self._values: Optional[memoryview] = None
+        self._offsets: Optional[memoryview] = None
+        self._integers: Optional[memoryview] = None
+        self._is_integer: Optional[memoryview] = None
+        if column["mask"] is not None:
+            self._mask = buffer[column["mask"]:column["mask"] + length]
+        if self.kind in ("str", "json"):
+            self._offsets = buffer[column["offsets"]:column["offsets"] + (length + 1) * 8].cast("q")
+            self._values = buffer[column["offset"]:column["offset"] + self._offsets[length]]
+        elif self.kind != "none":
+            if self.kind == "number":
+                self._integers = buffer[column["integers"]:column["integers"] + length * 8].cast("q")
+                self._is_integer = buffer[column["is_integer"]:column["is_integer"] + length]
+            typecode = {"bool": "B", "int": "q", "float": "d", "number": "d"}[self.kind]
+            size = struct.calcsize(typecode)
+            self._values = buffer[column["offset"]:column["offset"] + length * size].cast(typecode)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Any:
+        if self.kind == "none" or (self._mask is not None and not self._mask[index]):
+            return None
+        if self._offsets is not None:
+            value = str(self._values[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+            return value if self.kind == "str" else json.loads(value)
+        if self._is_integer is not None and self._is_integer[index]:
+            return self._integers[index]
+        value = self._values[index]
+        return bool(value) if self.kind == "bool" else value
+
+    def __iter__(self) -> Iterator:
+        return (self[index] for index in range(self._length))
+
+    def release(self) -> None:
+        for view in (self._values, self._offsets, self._mask, self._integers, self._is_integer):
+            if view is not None:
+                view.release()
+
+
+class SharedPartView(Sequence):
+    """SharedPartView:
+
+    This class is a read-only sequence over the parts of one region and category in a shared
+    catalog. Parts are built from the columns when they are accessed and are not kept.
+
+    Attributes:
+        datatype: type:
+            The part dataclass of the category.
+        compact_prices: bool:
+            Whether prices are returned as CompactPrice objects instead of Money.
+    """
+
+    def __init__(self, datatype: type, length: int, columns: Dict[str, _Column], compact_prices: bool) -> None:
+        self.datatype: type = datatype
+        self.compact_prices: bool = compact_prices
+        self._length = length
+        self._columns = columns
+        self._decoder = decoder(datatype)
+        self._plan: List[Tuple[str, str, Tuple[str, ...]]] = []
+        for field in fields(datatype):
+            if is_price(field.type):
+                self._plan.append((field.name, "price", ()))
+            elif is_dataclass(field.type):
+                self._plan.append((field.name, "nested", tuple(nested.name for nested in fields(field.type))))
+            else:
+                self._plan.append((field.name, "plain", ()))
+
+    def column(self, name: str) -> Sequence:
+        """
+        Function that returns one column of the category without building any parts.
+
+        Prices are integer units of 1/10000 of the currency (see CompactPrice), with their
+        currency codes in the '<field>.currency' column. The fields of unit dataclasses are
+        stored as '<field>.<name>', e.g. 'boost_clock.cycles'.
+
+        :param name: str: The column name.
+        :return: Sequence: The column values, with None for missing values.
+        """
+
+        return self._columns[name]
+
+    def _part(self, index: int) -> Any:
+        row = {}
+        for name, kind, nested in self._plan:
+            if kind == "plain":
+                row[name] = self._columns[name][index]
+            elif kind == "price":
+                units = self._columns[name][index]
+                if units is not None:
+                    price = CompactPrice(units, self._columns[f"{name}.currency"][index])
+                    row[name] = price if self.compact_prices else price.to_money()
+                else:
+                    row[name] = None
+            elif self._columns[name][index]:
+                row[name] = {field: self._columns[f"{name}.{field}"][index] for field in nested}
+            else:
+                row[name] = None
+        return self._decoder(row, self.compact_prices)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._part(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Part index out of range!")
+        return self._part(index)
+
+
+class SharedCatalog:
+    """SharedCatalog:
+
+    This class holds a columnar part catalog in shared memory or in a memory mapped snapshot
+    file. The process that loads the data creates the catalog once and worker processes attach
+    to it by name (or open the snapshot), so the memory used for part data does not grow with
+    the number of workers.
+
+    Attributes:
+        name: Optional[str]:
+            The name of the shared memory segment, or None for a snapshot file.
+        compact_prices: bool:
+            Whether prices are returned as CompactPrice objects instead of Money.
+    """
+
+    def __init__(self, buffer, name: Optional[str] = None, memory=None, owner: bool = False,
+                 compact_prices: bool = False) -> None:
+        self.name: Optional[str] = name
+        self.compact_prices: bool = compact_prices
+        self._source = buffer
+        self._memory = memory
+        self._owner = owner
+        view = memoryview(buffer)
+        # memoryview.toreadonly was added in Python 3.8, which shared memory needs anyway; snapshot
+        # files are mapped read-only.
+        self._buffer = view.toreadonly() if hasattr(view, "toreadonly") else view
+        found, header_length = _prefix.unpack_from(self._buffer)
+        if found != magic:
+            raise ValueError("The buffer does not contain a part catalog!")
+        header_end = _prefix.size + header_length
+        self._entries: Dict[str, Dict[str, Any]] = json.loads(bytes(self._buffer[_prefix.size:header_end]))["entries"]
+        self._data = self._buffer[header_end + -header_end % 8:]
+        self._columns: Dict[Tuple[str, str], Dict[str, _Column]] = {}
+
+    @classmethod
+    def create(cls, catalog: Catalog, name: Optional[str] = None, compact_prices: bool = False) -> "SharedCatalog":
+        """
+        Function that encodes a catalog into a new shared memory segment. Requires Python 3.8 or later.
+
+        The returned catalog owns the segment and removes it when it is closed.
+
+        :param catalog: Catalog: The part lists keyed by region and then by part.
+        :param name: Optional[str]: The segment name, or None for a random name.
+        :param compact_prices: bool: Whether to return prices as CompactPrice objects.
+        :return: SharedCatalog: The catalog. Workers attach to it with SharedCatalog.attach(catalog.name).
+        """
+
+        shared_memory = _require_shared_memory()
+        encoded = encode_catalog(catalog)
+        memory = shared_memory.SharedMemory(name=name, create=True, size=len(encoded))
+        memory.buf[:len(encoded)] = encoded
+        _created.add(memory.name)
+        return cls(memory.buf, memory.name, memory, True, compact_prices)
+
+    @classmethod
+    def attach(cls, name: str, compact_prices: bool = False) -> "SharedCatalog":
+        """
+        Function that attaches to a catalog created by another process. Requires Python 3.8 or later.
+
+        :param name: str: The name of the shared memory segment.
+        :param compact_prices: bool: Whether to return prices as CompactPrice objects.
+        :return: SharedCatalog: A read-only view of the catalog.
+        """
+
+        import multiprocessing
+
+        shared_memory = _require_shared_memory()
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Before Python 3.13 attaching registers the segment with this process's resource
+            # tracker, which would remove it when an unrelated process exits. The creating process
+            # and the processes it starts with multiprocessing share one tracker and keep the
+            # registration, which the creator removes when it unlinks the segment.
+            memory = shared_memory.SharedMemory(name=name)
+            if os.name == "posix" and memory.name not in _created and multiprocessing.parent_process() is None:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(f"/{memory.name}", "shared_memory")
+        return cls(memory.buf, memory.name, memory, False, compact_prices)
+
+    @staticmethod
+    def save(catalog: Catalog, path: str) -> None:
+        """
+        Function that writes a catalog snapshot file that workers can open with SharedCatalog.open.
+
+        :param catalog: Catalog: The part lists keyed by region and then by part.
+        :param path: str: The snapshot path.
+        :return: None
+        """
+
+        with open(path, "wb") as file:
+            file.write(encode_catalog(catalog))
+
+    @classmethod
+    def open(cls, path: str, compact_prices: bool = False) -> "SharedCatalog":
+        """
+        Function that memory maps a catalog snapshot file, sharing its pages with every other process that opens it.
+
+        :param path: str: The snapshot path.
+        :param compact_prices: bool: Whether to return prices as CompactPrice objects.
+        :return: SharedCatalog: A read-only view of the catalog.
+        """
+
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, compact_prices=compact_prices)
+
+    @property
+    def regions(self) -> List[str]:
+        return list(self._entries)
+
+    def parts(self, region: str) -> List[str]:
+        return list(self._entries[region])
+
+    def view(self, region: str, part: str) -> SharedPartView:
+        """
+        Function that returns the parts of one region and category.
+
+        :param region: str: The region.
+        :param part: str: The part category.
+        :return: SharedPartView: A read-only sequence of the parts.
+        """
+
+        from .mappings import part_classes
+
+        entry = self._entries[region][part]
+        columns = self._columns.get((region, part))
+        if columns is None:
+            columns = self._columns[(region, part)] = {
+                name: _Column(self._data, column, entry["length"]) for name, column in entry["columns"].items()}
+        return SharedPartView(part_classes[part], entry["length"], columns, self.compact_prices)
+
+    def part_data(self, region: str) -> PartData:
+        """
+        Function that returns every category of a region as a PartData object backed by the catalog.
+
+        :param region: str: The region.
+        :return: PartData: The parts keyed by category.
+        """
+
+        results = PartData()
+        for part in self._entries[region]:
+            results[part] = self.view(region, part)
+        return results
+
+    def close(self) -> None:
+        """
+        Function that detaches from the catalog. The process that created it also removes the shared memory segment.
+
+        Parts and views obtained from the catalog must not be used afterwards.
+
+        :return: None
+        """
+
+        if self._buffer is None:
+            return
+        for columns in self._columns.values():
+            for column in columns.values():
+                column.release()
+        self._columns.clear()
+        self._data.release()
+        self._buffer.release()
+        self._buffer = None
+        if self._memory is not None:
+            self._memory.close()
+            if self._owner:
+                self._memory.unlink()
+                _created.discard(self._memory.name)
+        else:
+            self._source.close()
+
+    def __enter__(self) -> "SharedCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,116 @@
+import heapq
+import importlib.util
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .arrow import select_columns
+
+"""
+    Similar part search. A SimilarityIndex turns the numeric fields of a part
+    category (unit values such as 'vram.total', plain numbers such as 'length'
+    and the price amount) into a standardized feature matrix and answers
+    k-nearest-neighbour queries over it. The distances are computed with numpy
+    when it is installed and with plain Python otherwise.
+"""
+
+numeric_kinds: Tuple[str, ...] = ("int", "float", "bool")
+
+
+def has_numpy() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+class SimilarityIndex:
+    """SimilarityIndex:
+
+    This class answers 'most similar parts' queries for one part category. Each feature is
+    standardized to zero mean and unit variance, missing values count as the mean, and the
+    squared distance of every feature is multiplied by its weight.
+
+    Attributes:
+        features: Tuple[str, ...]:
+            The feature column names, e.g. ('vram.total', 'boost_clock.cycles', 'price.amount').
+        weights: Tuple[float, ...]:
+            The weight of each feature.
+    """
+
+    def __init__(self, datatype: type, parts: Sequence, features: Optional[Sequence[str]] = None,
+                 weights: Optional[Dict[str, float]] = None, use_numpy: Optional[bool] = None) -> None:
+        field_names = parts[0]._fields if parts and not isinstance(parts[0], datatype) else None
+        columns = [column for column in select_columns(datatype, field_names) if column[1] in numeric_kinds]
+        if features is not None:
+            wanted = set(features)
+            columns = [column for column in columns if column[0] in wanted or column[0].split(".")[0] in wanted]
+            if not columns:
+                raise ValueError(f"None of the features {list(features)} are numeric fields of "
+                                 f"'{datatype.__name__}'!")
+        weights = weights or {}
+        self.datatype: type = datatype
+        self.features: Tuple[str, ...] = tuple(column[0] for column in columns)
+        self.weights: Tuple[float, ...] = tuple(weights.get(name, weights.get(name.split(".")[0], 1.0))
+                                                for name in self.features)
+        self._getters = [column[2] for column in columns]
+        self._parts = parts
+        self._scales: List[Tuple[float, float]] = []
+        for get, weight in zip(self._getters, self.weights):
+            values = [float(value) for value in map(get, parts) if value is not None]
+            mean = math.fsum(values) / len(values) if values else 0.0
+            variance = math.fsum((value - mean) ** 2 for value in values) / len(values) if values else 0.0
+            scale = math.sqrt(weight / variance) if variance else 0.0
+            self._scales.append((mean, scale))
+        self._numpy = has_numpy() if use_numpy is None else use_numpy
+        rows = [self.vector(part) for part in parts]
+        if self._numpy:
+            import numpy
+            self._matrix = numpy.array(rows, dtype=numpy.float64).reshape(len(rows), len(self.features))
+        else:
+            self._matrix = rows
+
+    def vector(self, part: Any) -> array:
+        """
+        Function that returns the standardized and weighted feature vector of a part.
+
+        :param part: Any: A part of the indexed category, which does not need to be in the index.
+        :return: array: The feature vector.
+        """
+
+        vector = array("d")
+        for get, (mean, scale) in zip(self._getters, self._scales):
+            value = get(part)
+            vector.append(0.0 if value is None else (float(value) - mean) * scale)
+        return vector
+
+    def _distances(self, vector: array, k: int) -> List[Tuple[float, int]]:
+        if self._numpy:
+            import numpy
+            distances = ((self._matrix - numpy.frombuffer(vector, dtype=numpy.float64)) ** 2).sum(axis=1)
+            if k < len(distances):
+                candidates = numpy.argpartition(distances, k)[:k]
+            else:
+                candidates = numpy.arange(len(distances))
+            return sorted((float(distances[index]), int(index)) for index in candidates)
+        scored = ((sum((a - b) ** 2 for a, b in zip(row, vector)), index) for index, row in enumerate(self._matrix))
+        return heapq.nsmallest(k, scored)
+
+    def nearest(self, part: Any, k: int = 5) -> List[Tuple[float, Any]]:
+        """
+        Function that returns the k indexed parts closest to a part, leaving out the part itself.
+
+        :param part: Any: The part to find alternatives for.
+        :param k: int: The number of parts to return.
+        :return: List[Tuple[float, Any]]: The distances and parts, closest first.
+        """
+
+        if k <= 0 or not self._parts:
+            return []
+        candidates = self._distances(self.vector(part), min(k + 1, len(self._parts)))
+        results = [(math.sqrt(distance), self._parts[index]) for distance, index in candidates
+                   if self._parts[index] is not part and not (distance == 0 and self._parts[index] == part)]
+        return results[:k]
+
+    def similar(self, part: Any, k: int = 5) -> List:
+        return [found for _, found in self.nearest(part, k)]
+
+    def __len__(self) -> int:
+        return len(self._parts)
@@ -0,0 +1,174 @@
+import gzip
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Mapping, Optional, Tuple, Union
+
+from .archive import ArchiveEntry, archive_bytes, archive_format
+from .page_store import PageStore
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+Pages = Union[PageStore, Mapping[Tuple[str, str], bytes]]
+
+
+@dataclass
+class StandInMetrics:
+    """Dataclass that stores counters for the requests served by a StandInServer."""
+
+    requests: int = 0
+    injected_errors: int = 0
+    not_found: int = 0
+    bytes_sent: int = 0
+
+
+class StandInServer:
+    """StandInServer:
+
+    This class serves recorded part pages over HTTP from a background thread, using the same
+    '<region>/<part>' layout as the real origin, so that the scraper can be exercised end to end
+    on an offline machine. Point an API or Scraper at it through base_url. All pages are also
+    served as one archive from any '<name>.tar.gz', '.tar.xz', '.tar' or '.zip' path.
+
+    Attributes:
+        pages: Pages:
+            A PageStore or a mapping of (region, part) to raw page bytes.
+        latency: float:
+            The number of seconds each response is delayed by.
+        error_rate: float:
+            The fraction of requests that are answered with a 503 error.
+        fail_requests: int:
+            The number of initial requests that are answered with a 503 error.
+        bandwidth: Optional[float]:
+            The maximum number of bytes per second sent for each response, or None for no limit.
+        compress: bool:
+            Whether to gzip responses for clients that accept it.
+        metrics: StandInMetrics:
+            Counters for the requests served so far.
+    """
+
+    chunk_size: int = 16384
+
+    def __init__(self, pages: Pages, latency: float = 0.0, error_rate: float = 0.0, fail_requests: int = 0,
+                 bandwidth: Optional[float] = None, compress: bool = True, seed: Optional[int] = None,
+                 host: str = "127.0.0.1", port: int = 0) -> None:
+        if not 0 <= error_rate <= 1:
+            raise ValueError("Error rate must be between 0 and 1!")
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError("Bandwidth must be a positive number!")
+        self.pages: Pages = pages
+        self.latency: float = latency
+        self.error_rate: float = error_rate
+        self.fail_requests: int = fail_requests
+        self.bandwidth: Optional[float] = bandwidth
+        self.compress: bool = compress
+        self.metrics: StandInMetrics = StandInMetrics()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._request_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _load(self, region: str, part: str) -> Optional[bytes]:
+        if isinstance(self.pages, PageStore):
+            return self.pages.load(region, part) if self.pages.contains(region, part) else None
+        return self.pages.get((region, part))
+
+    def _entries(self) -> Iterator[ArchiveEntry]:
+        keys = self.pages.keys() if isinstance(self.pages, PageStore) else sorted(self.pages)
+        for region, part in keys:
+            yield (region, part), self._load(region, part)
+
+    def _archive(self, name: str) -> Optional[bytes]:
+        try:
+            requested_format = archive_format(name)
+        except ValueError:
+            return None
+        return archive_bytes(self._entries(), requested_format)
+
+    def _inject_error(self) -> bool:
+        with self._lock:
+            self.metrics.requests += 1
+            if self.metrics.requests <= self.fail_requests or self._random.random() < self.error_rate:
+                self.metrics.injected_errors += 1
+                return True
+            return False
+
+    def _request_handler(self) -> type:
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args) -> None:
+                logger.debug(format % args)
+
+            def do_HEAD(self) -> None:
+                self.do_GET(send_body=False)
+
+            def do_GET(self, send_body: bool = True) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._inject_error():
+                    self._respond(503, b"Service Unavailable", send_body)
+                    return
+                path = self.path.strip("/").split("/")
+                if len(path) == 2:
+                    page = server._load(*path)
+                else:
+                    page = server._archive(path[0]) if len(path) == 1 else None
+                if page is None:
+                    with server._lock:
+                        server.metrics.not_found += 1
+                    self._respond(404, b"Not Found", send_body)
+                    return
+                self._respond(200, page, send_body)
+
+            def _respond(self, status: int, body: bytes, send_body: bool = True) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                if server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body, compresslevel=1)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if not send_body:
+                    return
+                for start in range(0, len(body), server.chunk_size):
+                    chunk = body[start:start + server.chunk_size]
+                    self.wfile.write(chunk)
+                    if server.bandwidth is not None:
+                        time.sleep(len(chunk) / server.bandwidth)
+                with server._lock:
+                    server.metrics.bytes_sent += len(body)
+
+        return RequestHandler
+
+    def start(self) -> "StandInServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                                            name="pcpartpicker-stand-in", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,175 @@
+import math
+from types import MappingProxyType
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .arrow import select_columns
+from .errors import UnsupportedField
+from .similarity import has_numpy
+from .views import Key
+
+"""
+    Aggregate statistics. The numeric columns of a part category (the same
+    flattened columns as the Arrow export, e.g. 'price.amount' or
+    'boost_clock.cycles') are extracted once and summarized per group, e.g.
+    per brand or socket. With numpy every column is sorted once by group and
+    value, and the count, min, max, mean and percentiles of all groups are
+    read from the sorted values together; without numpy the same statistics
+    are computed in plain Python.
+"""
+
+GroupBy = Union[Key, Sequence[str], None]
+
+default_percentiles: Tuple[float, ...] = (25, 50, 75, 90)
+
+
+@dataclass(frozen=True)
+class ColumnStats:
+    """Dataclass that stores the statistics of one numeric column. Missing values are not counted."""
+
+    count: int
+    min: Optional[float]
+    max: Optional[float]
+    mean: Optional[float]
+    percentiles: Mapping[float, Optional[float]]
+
+
+@dataclass(frozen=True)
+class GroupStats:
+    """Dataclass that stores the number of parts in a group and the statistics of their numeric columns."""
+
+    count: int
+    columns: Mapping[str, ColumnStats]
+
+    def __getitem__(self, column: str) -> ColumnStats:
+        return self.columns[column]
+
+
+def _group_value(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _group_key(datatype: type, parts: Sequence, group_by: GroupBy):
+    if group_by is None:
+        return lambda part: None
+    if callable(group_by):
+        return group_by
+    names = (group_by,) if isinstance(group_by, str) else tuple(group_by)
+    known = parts[0]._fields if parts and not isinstance(parts[0], datatype) else \
+        [field.name for field in dataclass_fields(datatype)]
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise UnsupportedField(f"Field(s) {unknown} cannot be grouped by for '{datatype.__name__}'!")
+    if isinstance(group_by, str):
+        return lambda part: _group_value(getattr(part, group_by))
+    return lambda part: tuple(_group_value(getattr(part, name)) for name in names)
+
+
+def _interpolate(values: List[float], percentile: float) -> float:
+    # Linear interpolation between the closest ranks, the default method of numpy.percentile.
+    position = percentile / 100 * (len(values) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def _column_stats(values: List[float], percentiles: Sequence[float]) -> ColumnStats:
+    if not values:
+        return ColumnStats(0, None, None, None, MappingProxyType({percentile: None for percentile in percentiles}))
+    values = sorted(values)
+    return ColumnStats(len(values), values[0], values[-1], math.fsum(values) / len(values),
+                       MappingProxyType({percentile: _interpolate(values, percentile) for percentile in percentiles}))
+
+
+def _python_stats(codes: List[int], groups: int, column: List[Optional[float]],
+                  percentiles: Sequence[float]) -> List[ColumnStats]:
+    grouped: List[List[float]] = [[] for _ in range(groups)]
+    for code, value in zip(codes, column):
+        if value is not None:
+            grouped[code].append(float(value))
+    return [_column_stats(values, percentiles) for values in grouped]
+
+
+def _numpy_stats(codes: Any, groups: int, column: List[Optional[float]],
+                 percentiles: Sequence[float]) -> List[ColumnStats]:
+    import numpy
+
+    values = numpy.array(column, dtype=numpy.float64)
+    valid = ~numpy.isnan(values)
+    counts = numpy.bincount(codes[valid], minlength=groups)
+    if not counts.any():
+        return [_column_stats([], percentiles) for _ in range(groups)]
+    sums = numpy.bincount(codes[valid], weights=values[valid], minlength=groups)
+    # Sorted by group and then by value, with the missing values of each group last.
+    order = numpy.lexsort((values, codes))
+    ordered = values[order]
+    starts = numpy.searchsorted(codes[order], numpy.arange(groups))
+    last = starts + numpy.maximum(counts - 1, 0)
+    quantiles = []
+    for percentile in percentiles:
+        position = starts + percentile / 100 * numpy.maximum(counts - 1, 0)
+        lower = numpy.floor(position).astype(numpy.int64)
+        upper = numpy.minimum(lower + 1, last)
+        quantiles.append((ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)).tolist())
+    minimums, maximums = ordered[starts].tolist(), ordered[last].tolist()
+    means = (sums / numpy.maximum(counts, 1)).tolist()
+    results = []
+    for group, count in enumerate(counts.tolist()):
+        if not count:
+            results.append(_column_stats([], percentiles))
+            continue
+        group_percentiles = {percentile: quantile[group] for percentile, quantile in zip(percentiles, quantiles)}
+        results.append(ColumnStats(count, minimums[group], maximums[group], means[group],
+                                   MappingProxyType(group_percentiles)))
+    return results
+
+
+def summarize(datatype: type, parts: Sequence, fields: Optional[Sequence[str]] = None, group_by: GroupBy = None,
+              percentiles: Sequence[float] = default_percentiles,
+              use_numpy: Optional[bool] = None) -> Union[GroupStats, Mapping[Any, GroupStats]]:
+    """
+    Function that computes the count, min, max, mean and percentiles of the numeric columns of a part list.
+
+    :param datatype: type: The part dataclass.
+    :param parts: Sequence: The parts or projected records.
+    :param fields: Optional[Sequence[str]]: The fields or columns to summarize, e.g. ['price', 'boost_clock'],
+    or None for every numeric column.
+    :param group_by: GroupBy: A field name such as 'brand' or 'socket', a sequence of field names, a key function,
+    or None to summarize all parts together.
+    :param percentiles: Sequence[float]: The percentiles to compute, between 0 and 100.
+    :param use_numpy: Optional[bool]: Whether to use numpy, or None to use it when it is installed.
+    :return: Union[GroupStats, Mapping[Any, GroupStats]]: The statistics of all parts, or of each group keyed by its
+    value (a tuple for several fields) in order of first appearance if group_by is given. The results are read-only.
+    """
+
+    if any(not 0 <= percentile <= 100 for percentile in percentiles):
+        raise ValueError(f"Percentiles {list(percentiles)} must be between 0 and 100!")
+    field_names = parts[0]._fields if parts and not isinstance(parts[0], datatype) else None
+    columns = [column for column in select_columns(datatype, field_names) if column[1] in ("int", "float")]
+    if fields is not None:
+        wanted = set(fields)
+        columns = [column for column in columns if column[0] in wanted or column[0].split(".")[0] in wanted]
+        if not columns:
+            raise ValueError(f"None of the fields {list(fields)} are numeric fields of '{datatype.__name__}'!")
+
+    key = _group_key(datatype, parts, group_by)
+    group_codes: Dict[Any, int] = {}
+    codes = [group_codes.setdefault(key(part), len(group_codes)) for part in parts]
+    if group_by is None and not group_codes:
+        group_codes[None] = 0
+    sizes = [0] * len(group_codes)
+    for code in codes:
+        sizes[code] += 1
+
+    if has_numpy() if use_numpy is None else use_numpy:
+        import numpy
+        codes = numpy.array(codes, dtype=numpy.int64)
+        column_stats = _numpy_stats
+    else:
+        column_stats = _python_stats
+    per_column = {name: column_stats(codes, len(group_codes), [get(part) for part in parts], percentiles)
+                  for name, _, get in columns}
+    results = {group: GroupStats(sizes[code], MappingProxyType({name: stats[code]
+                                                                for name, stats in per_column.items()}))
+               for group, code in group_codes.items()}
+    return results[None] if group_by is None else MappingProxyType(results)
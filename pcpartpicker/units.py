@@ -0,0 +1,111 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Sequence, Union
+
+from .parts import Bytes, ClockSpeed, NetworkSpeed
+from .utils import build_many, scale_many
+
+"""
+    Array-backed collections of unit values. A UnitArray stores the base unit
+    counts of many Bytes, ClockSpeed or NetworkSpeed values in one signed 64-bit
+    integer array, converts whole batches of numbers or numeric strings at
+    once, and only builds unit objects when they are read.
+"""
+
+
+class UnitArray(Sequence):
+    """UnitArray:
+
+    Base class for the array-backed unit collections.
+
+    Attributes:
+        unit: type:
+            The single field unit dataclass that the collection holds.
+        scales: Dict[str, int]:
+            The number of base units in each supported unit name.
+        strings: bool:
+            Whether numeric strings are accepted by from_scaled.
+        values: array:
+            The base unit counts.
+    """
+
+    unit: type
+    scales: Dict[str, int]
+    strings: bool = True
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self.values: array = values if isinstance(values, array) and values.typecode == "q" else array("q", values)
+
+    @classmethod
+    def from_scaled(cls, numbers: Iterable[Union[str, float, int]], unit: str) -> "UnitArray":
+        """
+        Function that converts many numbers given in one unit into a collection.
+
+        :param numbers: Iterable[Union[str, float, int]]: The numbers, e.g. [8, "16 GB"].
+        :param unit: str: The unit name, e.g. 'gb'.
+        :return: UnitArray: The collection.
+        """
+
+        if unit not in cls.scales:
+            raise ValueError(f"Unit '{unit}' must be one of {tuple(cls.scales)}!")
+        return cls(scale_many(numbers, cls.scales[unit], cls.strings))
+
+    @classmethod
+    def from_units(cls, units: Iterable[Any]) -> "UnitArray":
+        (field,) = cls.unit.__dataclass_fields__
+        return cls(getattr(unit, field) for unit in units)
+
+    def to_scaled(self, unit: str) -> array:
+        """
+        Function that returns every value in the given unit, e.g. 'gb'.
+
+        :param unit: str: The unit name.
+        :return: array: The values as a double precision array.
+        """
+
+        scale = float(self.scales[unit])
+        return array("d", [value / scale for value in self.values])
+
+    def units(self) -> list:
+        return build_many(self.unit, self.values)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return type(self)(self.values[index])
+        return build_many(self.unit, (self.values[index],))[0]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.units())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, UnitArray):
+            return self.unit is other.unit and self.values == other.values
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.values.tolist()!r})"
+
+
+class BytesArray(UnitArray):
+    """Array-backed collection of Bytes values."""
+
+    unit = Bytes
+    scales = {"b": 1, "kb": 1000, "mb": 1000000, "gb": 1000000000, "tb": 1000000000000,
+              "pb": 1000000000000000}
+
+
+class ClockSpeedArray(UnitArray):
+    """Array-backed collection of ClockSpeed values."""
+
+    unit = ClockSpeed
+    scales = {"hz": 1, "mhz": 1000000, "ghz": 1000000000}
+
+
+class NetworkSpeedArray(UnitArray):
+    """Array-backed collection of NetworkSpeed values."""
+
+    unit = NetworkSpeed
+    scales = {"bits": 1, "mbits": 1000000, "gbits": 1000000000}
+    strings = False
@@ -1,7 +1,9 @@
 import re
-from typing import Union
+from array import array
+from typing import Any, Iterable, List, Union
 
 num_pattern = r"(?<![a-zA-Z:])[-+]?\d*\.?\d+"
+num_regex = re.compile(num_pattern)
 
 
 def retrieve_float(data: str) -> float:
@@ -12,8 +14,8 @@ def retrieve_float(data: str) -> float:
     """
 
     try:
-        return float(re.findall(num_pattern, data)[0])
-    except IndexError:
+        return float(num_regex.search(data).group())
+    except AttributeError:
         raise ValueError
 
 
@@ -25,8 +27,8 @@ def retrieve_int(data: str) -> int:
     """
 
     try:
-        return int(re.findall(num_pattern, data)[0])
-    except IndexError:
+        return int(num_regex.search(data).group())
+    except AttributeError:
         raise ValueError
 
 
@@ -41,3 +43,59 @@ def num(string: str) -> Union[float, int]:
     if "." not in string:
         return retrieve_int(string)
     return retrieve_float(string)
+
+
+def scale_many(numbers: Iterable[Union[str, float, int]], factor: int,
+               strings: bool = True) -> Union[array, List[int]]:
+    """
+    Function that converts many numbers in a larger unit into integer counts of the base unit.
+
+    Each value is converted exactly like the scalar from_* constructors of the unit dataclasses do.
+
+    :param numbers: Iterable[Union[str, float, int]]: The numbers, or numeric strings if strings is True.
+    :param factor: int: The number of base units in one unit.
+    :param strings: bool: Whether numeric strings are accepted.
+    :return: Union[array, List[int]]: The converted values as a signed 64-bit integer array, or as a list if a
+    value does not fit into 64 bits.
+    """
+
+    search = num_regex.search
+    values = array("q")
+    append = values.append
+    for number in numbers:
+        kind = type(number)
+        if kind is str and strings:
+            match = search(number)
+            if match is None:
+                raise ValueError
+            number = float(match.group()) if "." in number else int(match.group())
+        elif kind is not int and kind is not float and number and not isinstance(number, (float, int)):
+            raise ValueError(f"'{number}' must be of type '{(float, int)}'!")
+        value = int(number * factor)
+        try:
+            append(value)
+        except OverflowError:
+            # Only the array is limited to 64 bits, so the rest of the values go into a list.
+            values = values.tolist()
+            append = values.append
+            append(value)
+    return values
+
+
+def build_many(cls: type, values: Iterable[int]) -> List[Any]:
+    """
+    Function that builds many single field unit dataclasses from integer values that are already known to be valid.
+
+    :param cls: type: The frozen unit dataclass, e.g. Bytes.
+    :param values: Iterable[int]: The values of its only field.
+    :return: List[Any]: The unit objects.
+    """
+
+    (field,) = cls.__dataclass_fields__
+    new, setter = object.__new__, object.__setattr__
+    results = []
+    for value in values:
+        unit = new(cls)
+        setter(unit, field, value)
+        results.append(unit)
+    return results
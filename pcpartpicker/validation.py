@@ -0,0 +1,152 @@
+import itertools
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterator, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARN)
+
+"""
+    These functions control how much type checking the part dataclasses perform
+    when they are constructed. Strict validation is the default; trusted input
+    (such as our own snapshots) can be loaded with sampled or no validation and
+    then checked column by column with the batch validators. The mode is kept
+    per thread and asyncio task.
+"""
+
+validation_modes: Tuple[str, ...] = ("strict", "sampled", "off")
+
+_Settings = Tuple[str, int, Dict[type, Iterator[int]]]
+
+# The mode, the sample interval and the sample counter of each class. A context variable keeps the
+# mode of each thread and asyncio task separate, so APIs that load data on different threads with
+# different modes do not see each other's setting.
+_settings: ContextVar[_Settings] = ContextVar("validation_settings", default=("strict", 100, {}))
+
+
+def _post_init(cls: type, original: Callable) -> Callable:
+    get_settings = _settings.get
+
+    def __post_init__(self) -> None:
+        mode, sample_every, counters = get_settings()
+        if mode == "strict":
+            original(self)
+        elif mode == "sampled":
+            counter = counters.get(cls)
+            if counter is None:
+                counter = counters.setdefault(cls, itertools.count())
+            if not next(counter) % sample_every:
+                original(self)
+    return __post_init__
+
+
+def validated(cls: type) -> type:
+    """
+    Class decorator that registers a dataclass so that its __post_init__ checks follow the validation mode.
+
+    :param cls: type: A dataclass that defines __post_init__.
+    :return: type: The same class.
+    """
+
+    cls.__post_init__ = _post_init(cls, cls.__dict__["__post_init__"])
+    return cls
+
+
+def get_validation_mode() -> str:
+    return _settings.get()[0]
+
+
+def _checked(mode: str, sample_every: int) -> _Settings:
+    if mode not in validation_modes:
+        raise ValueError(f"Validation mode '{mode}' must be one of {validation_modes}!")
+    if sample_every < 1:
+        raise ValueError("Sample interval must be a positive integer!")
+    return mode, sample_every, {}
+
+
+def set_validation_mode(mode: str, sample_every: int = 100) -> None:
+    """
+    Function that changes how part dataclasses validate their attributes on construction.
+
+    The mode applies to the current thread or asyncio task only. New threads start in strict
+    mode, except for the background threads of an API, which inherit the mode of the call that
+    started them.
+
+    :param mode: str: One of 'strict', 'sampled' or 'off'.
+    :param sample_every: int: In sampled mode, one out of every sample_every objects of each class is checked.
+    :return: None
+    """
+
+    _settings.set(_checked(mode, sample_every))
+    logger.debug(f"Validation mode set to {mode}")
+
+
+@contextmanager
+def validation_mode(mode: str, sample_every: int = 100) -> Iterator[None]:
+    """
+    Context manager that temporarily changes the validation mode of the current thread or asyncio task.
+
+    :param mode: str: One of 'strict', 'sampled' or 'off'.
+    :param sample_every: int: In sampled mode, one out of every sample_every objects of each class is checked.
+    :return: Iterator[None]
+    """
+
+    token = _settings.set(_checked(mode, sample_every))
+    try:
+        yield
+    finally:
+        _settings.reset(token)
+
+
+def field_types(annotation: Any) -> Tuple[type, ...]:
+    """
+    Function that converts a dataclass field annotation into a tuple usable with isinstance.
+
+    :param annotation: Any: The annotation, e.g. int, Union[float, int, None] or (float, int).
+    :return: Tuple[type, ...]: The accepted types.
+    """
+
+    if isinstance(annotation, tuple):
+        return annotation
+    if getattr(annotation, "__origin__", None) is Union:
+        return tuple(arg for arg in annotation.__args__ if arg is not type(None))
+    return (annotation,)
+
+
+def validate_column(values: Sequence, class_type: Union[type, Tuple[type, ...]], name: str = "column") -> None:
+    """
+    Function that applies the check_typing rules to a whole column of values at once.
+
+    The type of every value is collected in a single pass, so the isinstance check runs
+    once per distinct type instead of once per value.
+
+    :param values: Sequence: The column values.
+    :param class_type: Union[type, Tuple[type, ...]]: The accepted type or types.
+    :param name: str: The column name used in error messages.
+    :return: None
+    """
+
+    bad_types = {value_type for value_type in set(map(type, values)) if not issubclass(value_type, class_type)}
+    if not bad_types:
+        return
+    for index, value in enumerate(values):
+        if value and type(value) in bad_types:
+            raise ValueError(f"'{value}' at row {index} of '{name}' must be of type '{class_type}'!")
+
+
+def validate_parts(parts: Sequence, datatype: type) -> None:
+    """
+    Function that validates a list of part objects column by column.
+
+    This is intended for parts that were constructed with validation disabled.
+
+    :param parts: Sequence: The part objects, all of the same class.
+    :param datatype: type: The part dataclass.
+    :return: None
+    """
+
+    for field in fields(datatype):
+        column = [getattr(part, field.name) for part in parts]
+        validate_column(column, field_types(field.type), f"{datatype.__name__}.{field.name}")
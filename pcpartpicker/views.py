@@ -0,0 +1,279 @@
+import bisect
+import heapq
+import itertools
+import threading
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .prices import CompactPrice
+
+"""
+    Cached rankings of part lists. A RankedView keeps the parts of one category
+    ordered by a key, either completely or only the best k of them, and is
+    patched with the difference between the old and new lists when a category
+    is refreshed instead of being sorted again.
+"""
+
+Key = Union[str, Callable[[Any], Any]]
+
+
+def rank_value(value: Any) -> Any:
+    """
+    Function that converts a field value into a cheaply comparable sort value.
+
+    Prices become integer units, single field unit dataclasses (Bytes, ClockSpeed, ...) become
+    their numeric value and everything else is returned unchanged.
+
+    :param value: Any: The field value.
+    :return: Any: The sort value.
+    """
+
+    if isinstance(value, CompactPrice):
+        return value.units
+    if hasattr(value, "currency") and hasattr(value, "amount"):
+        return CompactPrice.from_money(value).units
+    if is_dataclass(value):
+        value_fields = fields(value)
+        if len(value_fields) == 1:
+            return getattr(value, value_fields[0].name)
+    return value
+
+
+class RankedView:
+    """RankedView:
+
+    This class keeps parts ordered by a key. Parts whose key value is None are left out.
+
+    Attributes:
+        key: Callable:
+            The function that extracts the raw key value from a part.
+        reverse: bool:
+            Whether the view is ordered from the largest key value to the smallest.
+        limit: Optional[int]:
+            The number of parts that the view keeps, or None to keep every part.
+    """
+
+    def __init__(self, parts: Sequence, key: Key, reverse: bool = False, limit: Optional[int] = None) -> None:
+        self.key: Callable[[Any], Any] = attrgetter(key) if isinstance(key, str) else key
+        self.reverse: bool = reverse
+        self.limit: Optional[int] = limit
+        self._counter = itertools.count()
+        self._entries: List[Tuple[Any, int, Any]] = []
+        self.rebuild(parts)
+
+    def _entry(self, part: Any) -> Optional[Tuple[Any, int, Any]]:
+        value = self.key(part)
+        if value is None:
+            return None
+        value = rank_value(value)
+        if self.reverse:
+            value = -value
+        return value, next(self._counter), part
+
+    def rebuild(self, parts: Sequence) -> None:
+        entries = (entry for entry in map(self._entry, parts) if entry is not None)
+        if self.limit is None:
+            self._entries = sorted(entries)
+        else:
+            self._entries = heapq.nsmallest(self.limit, entries)
+
+    def update(self, old_parts: Sequence, new_parts: Sequence) -> None:
+        """
+        Function that patches the view with the difference between two versions of a part list.
+
+        :param old_parts: Sequence: The parts that the view currently reflects.
+        :param new_parts: Sequence: The refreshed parts.
+        :return: None
+        """
+
+        try:
+            old_set, new_set = set(old_parts), set(new_parts)
+        except TypeError:
+            self.rebuild(new_parts)
+            return
+        if len(old_set) != len(old_parts) or len(new_set) != len(new_parts):
+            # Equal duplicate parts cannot be told apart by a set difference.
+            self.rebuild(new_parts)
+            return
+        removed = old_set - new_set
+        if removed:
+            kept = [entry for entry in self._entries if entry[2] not in removed]
+            if self.limit is not None and len(kept) < len(self._entries):
+                self.rebuild(new_parts)
+                return
+            self._entries = kept
+        for part in new_parts:
+            if part in old_set:
+                continue
+            entry = self._entry(part)
+            if entry is None:
+                continue
+            if self.limit is not None and len(self._entries) >= self.limit:
+                if entry >= self._entries[-1]:
+                    continue
+                self._entries.pop()
+            bisect.insort(self._entries, entry)
+
+    def top(self, k: Optional[int] = None) -> List:
+        entries = self._entries if k is None else self._entries[:k]
+        return [entry[2] for entry in entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ViewCache:
+    """ViewCache:
+
+    This class stores the ranked views, similarity indexes and statistics of every category of one region
+    and keeps them current when a category is replaced.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._parts: Dict[str, Sequence] = {}
+        self._views: Dict[Tuple[str, Key, bool, Optional[int]], RankedView] = {}
+        self._indexes: Dict[Tuple, Any] = {}
+
+    def view(self, part: str, parts: Sequence, key: Key, reverse: bool = False,
+             limit: Optional[int] = None) -> RankedView:
+        """
+        Function that returns a cached view of a part list, building it on first use.
+
+        Only views of the current part list of a category with a field name key are cached. Views of
+        another list, e.g. of an older PartData after a refresh, and views with a key function are built
+        for the call alone.
+
+        :param part: str: The part category.
+        :param parts: Sequence: The part list the view should reflect.
+        :param key: Key: A field name or a key function.
+        :param reverse: bool: Whether to order from the largest key value to the smallest.
+        :param limit: Optional[int]: Keep only this many parts, or None for a fully sorted view.
+        :return: RankedView: The view.
+        """
+
+        if not isinstance(key, str):
+            return RankedView(parts, key, reverse, limit)
+        with self._lock:
+            if self._current(part, parts):
+                view_key = (part, key, reverse, limit)
+                view = self._views.get(view_key)
+                if view is None:
+                    if limit is not None:
+                        # A larger cached view of the same ordering can answer smaller requests.
+                        for (other_part, other_key, other_reverse, other_limit), other in self._views.items():
+                            if (other_part, other_key, other_reverse) == (part, key, reverse) and \
+                                    (other_limit is None or other_limit >= limit):
+                                return other
+                    view = self._views[view_key] = RankedView(parts, key, reverse, limit)
+                return view
+        return RankedView(parts, key, reverse, limit)
+
+    def similarity(self, part: str, parts: Sequence, features: Optional[Sequence[str]] = None,
+                   weights: Optional[Dict[str, float]] = None) -> Any:
+        """
+        Function that returns a cached similarity index of a part list, building it on first use.
+
+        Indexes are rebuilt lazily after their category is replaced.
+
+        :param part: str: The part category.
+        :param parts: Sequence: The part list the index should reflect.
+        :param features: Optional[Sequence[str]]: The feature columns or fields, or None for every numeric field.
+        :param weights: Optional[Dict[str, float]]: Weights for some features, 1 by default.
+        :return: SimilarityIndex: The index.
+        """
+
+        from .mappings import part_classes
+        from .similarity import SimilarityIndex
+
+        index_key = (part, "similarity", None if features is None else tuple(features),
+                     None if weights is None else tuple(sorted(weights.items())))
+        return self._cached(part, parts, index_key,
+                            lambda: SimilarityIndex(part_classes[part], parts, features, weights))
+
+    def stats(self, part: str, parts: Sequence, fields: Optional[Sequence[str]] = None, group_by: Any = None,
+              percentiles: Optional[Sequence[float]] = None) -> Any:
+        """
+        Function that returns the cached statistics of a part list, computing them on first use.
+
+        Statistics are recomputed lazily after their category is replaced. Statistics grouped by a key
+        function are computed for the call alone.
+
+        :param part: str: The part category.
+        :param parts: Sequence: The part list the statistics should reflect.
+        :param fields: Optional[Sequence[str]]: The fields or columns to summarize, or None for every numeric column.
+        :param group_by: GroupBy: A field name, a sequence of field names, a key function or None.
+        :param percentiles: Optional[Sequence[float]]: The percentiles to compute, or None for the defaults.
+        :return: Union[GroupStats, Dict[Any, GroupStats]]: The statistics, see stats.summarize.
+        """
+
+        from .mappings import part_classes
+        from .stats import default_percentiles, summarize
+
+        percentiles = default_percentiles if percentiles is None else tuple(percentiles)
+        if callable(group_by):
+            # Key functions are usually new objects on every call, so their results would never be reused.
+            return summarize(part_classes[part], parts, fields, group_by, percentiles)
+        stats_key = (part, "stats", None if fields is None else tuple(fields),
+                     group_by if group_by is None or isinstance(group_by, str) else tuple(group_by), percentiles)
+        return self._cached(part, parts, stats_key,
+                            lambda: summarize(part_classes[part], parts, fields, group_by, percentiles))
+
+    def _cached(self, part: str, parts: Sequence, index_key: Tuple, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            index = self._indexes.get(index_key) if self._current(part, parts) else None
+        if index is None:
+            index = build()
+            with self._lock:
+                if self._parts.get(part) is parts:
+                    self._indexes[index_key] = index
+        return index
+
+    def _current(self, part: str, parts: Sequence) -> bool:
+        # The first list seen for a category becomes its current list; later lists only through replace().
+        if part not in self._parts:
+            self._replace(part, parts)
+        return self._parts[part] is parts
+
+    def _replace(self, part: str, parts: Sequence) -> None:
+        old_parts = self._parts.get(part)
+        if old_parts is parts:
+            return
+        self._parts[part] = parts
+        for index_key in [index_key for index_key in self._indexes if index_key[0] == part]:
+            del self._indexes[index_key]
+        for view_key, view in self._views.items():
+            if view_key[0] == part:
+                if old_parts is None:
+                    view.rebuild(parts)
+                else:
+                    view.update(old_parts, parts)
+
+    def replace(self, part: str, parts: Sequence) -> None:
+        """
+        Function that swaps in a refreshed part list and patches every view of that category.
+
+        :param part: str: The part category.
+        :param parts: Sequence: The refreshed part list.
+        :return: None
+        """
+
+        with self._lock:
+            if part in self._parts:
+                self._replace(part, parts)
+
+    def discard(self, part: str) -> None:
+        """
+        Function that drops a category and all of its views, e.g. when its parts leave the cache.
+
+        :param part: str: The part category.
+        :return: None
+        """
+
+        with self._lock:
+            self._parts.pop(part, None)
+            for view_key in [view_key for view_key in self._views if view_key[0] == part]:
+                del self._views[view_key]
+            for index_key in [index_key for index_key in self._indexes if index_key[0] == part]:
+                del self._indexes[index_key]
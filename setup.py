@@ -19,6 +19,12 @@ setup(
     url="https://github.com/JonathanVusich/pcpartpicker",
     packages=find_packages(exclude=["*.tests", "*.tests.*", "tests.*", "tests", "utils"]),
     install_requires=read("requirements.txt"),
+    extras_require={
+        "brotli": ["brotli"],
+        "zstd": ["zstandard"],
+        "arrow": ["pyarrow"],
+        "pandas": ["pyarrow", "pandas"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Topic :: Utilities",
@@ -0,0 +1,65 @@
+import json
+import threading
+from collections import Counter
+
+sample_items = {
+    "cpu": [
+        {"brand": "AMD", "model": "Ryzen 5 3600", "cores": 6, "base_clock": {"cycles": 3600000000},
+         "boost_clock": {"cycles": 4200000000}, "tdp": 65, "integrated_graphics": "", "multithreading": True,
+         "price": ["199.99", "USD"]},
+        {"brand": "Intel", "model": "Core i9-9900K", "cores": 8, "base_clock": {"cycles": 3600000000},
+         "boost_clock": {"cycles": 5000000000}, "tdp": 95, "integrated_graphics": "Intel UHD Graphics 630",
+         "multithreading": True, "price": ["488.99", "USD"]},
+    ],
+    "video-card": [
+        {"brand": "EVGA", "model": "GeForce RTX 2070 Super", "chipset": "GeForce RTX 2070 SUPER",
+         "vram": {"total": 8000000000}, "core_clock": {"cycles": 1605000000}, "boost_clock": {"cycles": 1770000000},
+         "color": "Black", "length": 267.0, "price": ["499.99", "USD"]},
+        {"brand": "MSI", "model": "Radeon RX 580", "chipset": "Radeon RX 580", "vram": {"total": 8000000000},
+         "core_clock": {"cycles": 1257000000}, "boost_clock": {"cycles": 1366000000}, "color": "Black / Red",
+         "length": 227.0, "price": ["189.99", "USD"]},
+    ],
+    "memory": [
+        {"brand": "Corsair", "model": "Vengeance LPX 16 GB", "module_type": "DDR4", "speed": {"cycles": 3200000000},
+         "number_of_modules": 2, "module_size": {"total": 8000000000}, "price_per_gb": ["4.87", "USD"],
+         "color": "Black", "first_word_latency": 10.0, "cas_timing": 16, "error_correction": "Non-ECC / Unbuffered",
+         "price": ["77.99", "USD"]},
+    ],
+}
+
+
+def make_page(items: list) -> str:
+    return f"<html><head></head><body>\n{json.dumps(items)}\n</body></html>"
+
+
+def make_pages(parts=None, encoded: bool = True) -> dict:
+    parts = sample_items if parts is None else parts
+    pages = {part: make_page(sample_items[part]) for part in parts}
+    if encoded:
+        return {part: page.encode() for part, page in pages.items()}
+    return pages
+
+
+def region_pages(regions, parts=None) -> dict:
+    # Pages for a StandInServer, with every model prefixed by its region, e.g. 'us:Ryzen 5 3600'.
+    parts = sample_items if parts is None else parts
+    return {(region, part): make_page([dict(item, model=f"{region}:{item['model']}")
+                                       for item in sample_items[part]]).encode()
+            for region in regions for part in parts}
+
+
+class RecordingPages(dict):
+    """Pages for a StandInServer that count how often each (region, part) page is requested."""
+
+    def __init__(self, pages: dict, hook=None):
+        super().__init__(pages)
+        self.loads = Counter()
+        self.hook = hook
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            self.loads[key] += 1
+        if self.hook is not None:
+            self.hook(*key)
+        return super().get(key, default)
@@ -0,0 +1,100 @@
+import unittest
+
+from moneyed import Money
+
+from pcpartpicker.alerts import AlertEngine
+from pcpartpicker.errors import UnsupportedPart
+from pcpartpicker.handler import Handler
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.prices import CompactPrice
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_page, sample_items
+
+
+def memory_kits(*prices, compact_prices=False) -> list:
+    template = sample_items["memory"][0]
+    items = [dict(template, price=[price, "USD"]) for price in prices]
+    return parse({"memory": make_page(items)}, compact_prices)["memory"]
+
+
+class AlertEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = AlertEngine()
+        self.kit = sample_items["memory"][0]["model"]
+
+    def subscribe(self, threshold, **options):
+        return self.engine.subscribe("us", "memory", self.kit, threshold, "USD", **options)
+
+    def test_fires_crossed_thresholds_once(self):
+        low, mid, high = self.subscribe("60"), self.subscribe("70"), self.subscribe("75.50")
+        self.assertEqual(self.engine.evaluate("us", "memory", memory_kits("77.99")), [])
+        events = self.engine.evaluate("us", "memory", memory_kits("80.00", "70.00"))
+        self.assertEqual([event.alert for event in events], [mid, high])
+        self.assertEqual(events[0].price, Money("70.00", "USD"))
+        self.assertEqual(events[0].item.price, Money("70.00", "USD"))
+        self.assertEqual(self.engine.evaluate("us", "memory", memory_kits("65.00")), [])
+        self.assertEqual(self.engine.alerts(), [low])
+        self.assertEqual(self.engine.drain(), events)
+        self.assertEqual(self.engine.drain(), [])
+
+    def test_above(self):
+        alert = self.subscribe(Money("90", "USD"), above=True)
+        self.assertEqual(self.engine.evaluate("us", "memory", memory_kits("77.99")), [])
+        self.assertEqual([event.alert for event in self.engine.evaluate("us", "memory", memory_kits("90.00"))],
+                         [alert])
+
+    def test_matching(self):
+        self.subscribe("100", brand="Kingston")
+        branded = self.subscribe("100", brand="corsair")
+        spaced = self.engine.subscribe("us", "memory", f"  {self.kit.upper()} ", "100", "USD")
+        self.engine.subscribe("us", "memory", self.kit, "100", "EUR")
+        self.engine.subscribe("de", "memory", self.kit, "100", "USD")
+        per_gb = self.subscribe("5", field="price_per_gb")
+        events = self.engine.evaluate("us", "memory", memory_kits("77.99", compact_prices=True))
+        self.assertEqual({event.alert for event in events}, {branded, spaced, per_gb})
+        self.assertEqual(len(self.engine), 3)
+
+    def test_unsubscribe(self):
+        alert = self.subscribe("100")
+        kept = self.subscribe(CompactPrice(1000000, "USD"))
+        self.assertTrue(self.engine.unsubscribe(alert))
+        self.assertFalse(self.engine.unsubscribe(alert.id))
+        self.assertEqual([event.alert for event in self.engine.evaluate("us", "memory", memory_kits("80.00"))],
+                         [kept])
+        self.assertFalse(self.engine.watches("us", "memory"))
+        self.assertEqual(self.engine._names, {})
+
+    def test_listeners(self):
+        received = []
+        self.engine.add_listener(lambda event: 1 / 0)
+        self.engine.add_listener(received.append)
+        self.subscribe("100")
+        with self.assertLogs("pcpartpicker.alerts", "ERROR"):
+            self.engine.evaluate("us", "memory", memory_kits("80.00"))
+        self.assertEqual(len(received), 1)
+
+    def test_invalid_subscriptions(self):
+        with self.assertRaises(ValueError):
+            self.engine.subscribe("us", "memory", self.kit, "100")
+        with self.assertRaises(UnsupportedPart):
+            self.engine.subscribe("us", "ram", self.kit, "100", "USD")
+
+
+class HandlerAlertTest(unittest.TestCase):
+
+    def test_refresh_evaluates_alerts(self):
+        template = sample_items["memory"][0]
+        pages = {("us", "memory"): make_page([dict(template, price=["90.00", "USD"])]).encode()}
+        with StandInServer(pages) as server:
+            handler = Handler(base_url=server.base_url)
+            alert = handler.alerts.subscribe("us", "memory", template["model"], "75", "USD")
+            handler.retrieve("memory")
+            self.assertEqual(handler.alerts.drain(), [])
+            pages[("us", "memory")] = make_page([dict(template, price=["70.00", "USD"])]).encode()
+            handler.retrieve("memory", force_refresh=True)
+        self.assertEqual([event.alert for event in handler.alerts.drain()], [alert])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+
+from pcpartpicker import API
+from pcpartpicker.archive import archive_bytes, archive_format, read_archive, write_archive
+from pcpartpicker.errors import UnsupportedRegion
+from pcpartpicker.page_store import PageStore
+from pcpartpicker.parts import CPU
+from pcpartpicker.stand_in import StandInServer
+from tests.test_stand_in import recorded_pages
+
+
+class ArchiveTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        pages = recorded_pages()
+        for name in ("tar", "tar.gz", "tar.bz2", "tar.xz", "zip"):
+            data = archive_bytes(sorted(pages.items()), name)
+            self.assertEqual({(region, part): page for region, part, page in read_archive(data)}, pages, name)
+
+    def test_paths(self):
+        pages = recorded_pages(("us",))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pages.zip")
+            write_archive(pages.items(), path, archive_format(path))
+            self.assertEqual(len(list(read_archive(path))), len(pages))
+
+    def test_member_names(self):
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            for name in ("./us/cpu.html", "README", "us/", "us/memory/extra"):
+                info = tarfile.TarInfo(name)
+                if name.endswith("/"):
+                    info.type = tarfile.DIRTYPE
+                else:
+                    info.size = 4
+                archive.addfile(info, io.BytesIO(b"page") if info.isfile() else None)
+        self.assertEqual(list(read_archive(buffer.getvalue())), [("us", "cpu", b"page")])
+
+    def test_archive_format(self):
+        self.assertEqual(archive_format("https://example.com/all.tar.gz"), "tar.gz")
+        self.assertEqual(archive_format("all.tgz"), "tar.gz")
+        self.assertEqual(archive_format("all.tar"), "tar")
+        with self.assertRaises(ValueError):
+            archive_format("all.rar")
+
+
+class SyncArchiveTest(unittest.TestCase):
+
+    def test_sync_from_stand_in(self):
+        with StandInServer(recorded_pages()) as server:
+            api = API(base_url=server.base_url)
+            results = api.sync_archive()
+            self.assertEqual(server.metrics.requests, 1)
+            self.assertEqual(set(results), {"us", "de"})
+            self.assertIsInstance(results["de"]["cpu"][0], CPU)
+            self.assertIs(api.retrieve("cpu")["cpu"], results["us"]["cpu"])
+            self.assertEqual(server.metrics.requests, 1)
+            self.assertIsNotNone(api.last_refresh("memory", "de"))
+
+            results = api.sync_archive(f"{server.base_url}pages.zip", regions=["de"], parts=["memory"])
+            self.assertEqual({region: set(data) for region, data in results.items()}, {"de": {"memory"}})
+            self.assertEqual(api.parse_metrics.unchanged, 1)
+            with self.assertRaises(UnsupportedRegion):
+                api.sync_archive(regions=["mars"])
+
+    def test_sync_from_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = PageStore(os.path.join(directory, "pages"))
+            for (region, part), page in recorded_pages(("uk",)).items():
+                store.save(region, part, page)
+            path = os.path.join(directory, "snapshot.tar.xz")
+            write_archive(((key, store.load(*key)) for key in store.keys()), path, "tar.xz")
+            results = API().sync_archive(path)
+        self.assertEqual(set(results), {"uk"})
+        self.assertEqual(set(results["uk"]), {part for _, part in recorded_pages(("uk",))})
+
+
+if __name__ == "__main__":
+    unittest.main()
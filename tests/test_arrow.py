@@ -0,0 +1,86 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+from pcpartpicker.arrow import arrow_schema, columns, has_pyarrow
+from pcpartpicker.mappings import part_classes
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.part_data import PartData
+from pcpartpicker.parts import GPU
+from tests.sample_pages import make_pages
+
+
+def part_data(parsed: dict) -> PartData:
+    data = PartData()
+    data.update(parsed)
+    return data
+
+
+def has_pandas() -> bool:
+    return importlib.util.find_spec("pandas") is not None
+
+
+class ColumnTest(unittest.TestCase):
+
+    def test_flattened_columns(self):
+        names = [name for name, _, _ in columns(GPU)]
+        self.assertEqual(names, ["brand", "model", "chipset", "vram.total", "core_clock.cycles",
+                                 "boost_clock.cycles", "color", "length", "price.amount", "price.currency"])
+        kinds = {name: kind for name, kind, _ in columns(GPU)}
+        self.assertEqual((kinds["vram.total"], kinds["length"], kinds["price.currency"]), ("int", "float", "currency"))
+
+
+@unittest.skipUnless(has_pyarrow(), "pyarrow is not installed")
+class ArrowTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data = part_data(parse(make_pages()))
+
+    def test_schemas(self):
+        import pyarrow
+        for part, datatype in part_classes.items():
+            schema = arrow_schema(datatype)
+            self.assertEqual(schema.metadata[b"pcpartpicker.part"], datatype.__name__.encode())
+        self.assertEqual(arrow_schema(GPU).field("boost_clock.cycles").type, pyarrow.int64())
+
+    def test_to_arrow(self):
+        table = self.data.to_arrow("video-card")
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.column("price.amount").to_pylist(), [499.99, 189.99])
+        self.assertEqual(table.column("price.currency").to_pylist(), ["USD", "USD"])
+        self.assertEqual(table.column("boost_clock.cycles").to_pylist(), [1770000000, 1366000000])
+        self.assertTrue(table.schema.equals(arrow_schema(GPU), check_metadata=True))
+
+    def test_compact_prices_and_records(self):
+        compact = part_data(parse(make_pages(["memory"]), compact_prices=True))
+        table = compact.to_arrow("memory")
+        self.assertEqual(table.column("price_per_gb.amount").to_pylist(), [4.87])
+        records = part_data(parse(make_pages(["video-card"]), fields=["model", "vram", "price"]))
+        table = records.to_arrow("video-card")
+        self.assertEqual(table.column_names, ["model", "vram.total", "price.amount", "price.currency"])
+
+    def test_empty_category(self):
+        self.data["case-fan"] = []
+        table = self.data.to_arrow("case-fan")
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema, arrow_schema(part_classes["case-fan"]))
+
+    def test_to_parquet(self):
+        import pyarrow.parquet
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.data.to_parquet(directory, compression="zstd")
+            self.assertEqual(sorted(os.path.basename(path) for path in paths),
+                             ["cpu.parquet", "memory.parquet", "video-card.parquet"])
+            table = pyarrow.parquet.read_table(os.path.join(directory, "cpu.parquet"))
+            self.assertEqual(table.column("cores").to_pylist(), [6, 8])
+
+    @unittest.skipUnless(has_pandas(), "pandas is not installed")
+    def test_to_pandas(self):
+        frame = self.data.to_pandas("memory")
+        self.assertEqual(frame["speed.cycles"].tolist(), [3200000000])
+        self.assertEqual(frame["price.amount"].dtype.kind, "f")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from pcpartpicker.cache import PartCache, estimate_size
+from pcpartpicker.handler import Handler
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import RecordingPages, make_page, make_pages, sample_items
+
+
+class PartCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parsed = parse(make_pages())
+        self.size = estimate_size(self.parsed["cpu"])
+
+    def test_estimate_size(self):
+        self.assertGreater(self.size, 0)
+        many = parse({"cpu": make_page(sample_items["cpu"] * 100)})["cpu"]
+        self.assertGreater(estimate_size(many), 30 * self.size)
+        self.assertLess(estimate_size([]), self.size)
+
+    def test_lru_eviction(self):
+        evicted = []
+        cache = PartCache(int(self.size * 2.5), on_evict=evicted.append)
+        cache.put(("us", "cpu"), self.parsed["cpu"])
+        cache.put(("de", "cpu"), self.parsed["cpu"])
+        self.assertIsNotNone(cache.get(("us", "cpu")))
+        cache.put(("uk", "cpu"), self.parsed["cpu"])
+        self.assertEqual(evicted, [("de", "cpu")])
+        self.assertIsNone(cache.get(("de", "cpu")))
+        info = cache.info()
+        self.assertEqual((info.entries, info.evictions, info.hits, info.misses), (2, 1, 1, 1))
+        self.assertEqual(set(info.regions), {"us", "uk"})
+        self.assertLessEqual(info.size, info.max_size)
+
+    def test_oversized_entry_is_kept(self):
+        cache = PartCache(1)
+        cache.put(("us", "cpu"), self.parsed["cpu"])
+        self.assertIs(cache.get(("us", "cpu")), self.parsed["cpu"])
+
+    def test_replacing_an_entry_is_not_an_eviction(self):
+        evicted = []
+        cache = PartCache(on_evict=evicted.append)
+        cache.put(("us", "cpu"), self.parsed["cpu"])
+        cache.put(("us", "cpu"), self.parsed["cpu"][:1])
+        self.assertEqual(evicted, [])
+        self.assertEqual(cache.info().entries, 1)
+
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PartCache(int(self.size * 1.5), directory)
+            cache.put(("us", "cpu"), self.parsed["cpu"])
+            cache.put(("de", "cpu"), self.parsed["cpu"])
+            self.assertTrue(os.path.isfile(os.path.join(directory, "us", "cpu.pickle")))
+            self.assertIn(("us", "cpu"), cache)
+            self.assertEqual(cache.info().spilled, 1)
+            self.assertEqual(cache.get(("us", "cpu")), self.parsed["cpu"])
+            info = cache.info()
+            self.assertEqual((info.spilled, info.spill_loads, info.evictions), (1, 1, 2))
+            self.assertFalse(os.path.isfile(os.path.join(directory, "us", "cpu.pickle")))
+            cache.clear()
+            self.assertEqual(os.listdir(os.path.join(directory, "de")), [])
+
+
+class HandlerCacheTest(unittest.TestCase):
+
+    def test_bounded_handler(self):
+        pages = RecordingPages({("us", part): page for part, page in make_pages(["cpu", "memory"]).items()})
+        with StandInServer(pages) as server:
+            handler = Handler(cache_size=1, base_url=server.base_url)
+            handler.retrieve("cpu")
+            handler.retrieve("memory")
+            data = handler.retrieve("memory")
+            self.assertEqual(data.top_k("memory", 1), data["memory"])
+            handler.retrieve("cpu")
+        self.assertEqual(pages.loads, Counter({("us", "cpu"): 2, ("us", "memory"): 1}))
+        self.assertNotIn("memory", handler._view_caches["us"]._parts)
+        info = handler.cache_info()
+        self.assertEqual((info.entries, info.evictions), (1, 2))
+
+    def test_evicted_parts_forget_their_refresh(self):
+        pages = {("us", part): page for part, page in make_pages(["cpu", "memory"]).items()}
+        with StandInServer(pages) as server:
+            handler = Handler(base_url=server.base_url, cache_size=1)
+            handler.retrieve("cpu")
+            handler.retrieve("memory")
+        self.assertIsNone(handler.last_refresh("cpu"))
+        self.assertIsNotNone(handler.last_refresh("memory"))
+        self.assertEqual(set(handler._refresh_times), {("us", "memory")})
+        self.assertEqual(set(handler._page_digests), {("us", "memory")})
+
+    def test_spilled_parts_keep_their_refresh(self):
+        pages = RecordingPages({("us", part): page for part, page in make_pages(["cpu", "memory"]).items()})
+        with tempfile.TemporaryDirectory() as directory, StandInServer(pages) as server:
+            handler = Handler(cache_size=1, spill_dir=directory, base_url=server.base_url)
+            handler.retrieve("cpu", "memory")
+            self.assertIsNotNone(handler.last_refresh("cpu"))
+            self.assertEqual(len(handler.retrieve("cpu")["cpu"]), 2)
+        self.assertEqual(pages.loads, Counter({("us", "cpu"): 1, ("us", "memory"): 1}))
+
+
+if __name__ == "__main__":
+    unittest.main()
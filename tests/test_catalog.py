@@ -0,0 +1,87 @@
+import unittest
+
+from moneyed import Money
+
+from pcpartpicker.api import API
+from pcpartpicker.catalog import GlobalCatalog, normalize_name
+from pcpartpicker.errors import UnsupportedField, UnsupportedPart
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.prices import CompactPrice
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_page, make_pages, sample_items
+
+
+def regional_items(currency: str, markup: float) -> dict:
+    items = {}
+    for part, part_items in sample_items.items():
+        items[part] = [dict(item, price=[f"{float(item['price'][0]) * markup:.2f}", currency])
+                       for item in part_items]
+    return items
+
+
+class GlobalCatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.us = parse(make_pages())
+        self.de = parse({part: make_page(items) for part, items in regional_items("EUR", 1.1).items()})
+        self.catalog = GlobalCatalog()
+        self.catalog.add_all({"us": self.us, "de": self.de})
+
+    def test_specs_are_stored_once(self):
+        info = self.catalog.info()
+        self.assertEqual((info.products, info.listings, info.regions), (5, 10, 2))
+        self.assertEqual(info.sharing, 2.0)
+        self.assertIsNone(self.catalog.products("cpu")[0].price)
+
+    def test_views_rebuild_parts(self):
+        for region, parsed in (("us", self.us), ("de", self.de)):
+            for part, parts in parsed.items():
+                self.assertEqual(list(self.catalog.view(region, part)), parts)
+        view = self.catalog.view("de", "cpu")
+        self.assertIsNot(view[0], view[0])
+        self.assertEqual(view[-1].price, Money("537.89", "EUR"))
+        self.assertEqual(self.catalog.part_data("de").top_k("cpu", 1)[0].model, "Ryzen 5 3600")
+
+    def test_prices_across_regions(self):
+        prices = self.catalog.prices("video-card", " msi ", "Radeon  RX 580")
+        self.assertEqual(prices, {"us": [Money("189.99", "USD")], "de": [Money("208.99", "EUR")]})
+        self.assertEqual(self.catalog.prices("memory", "Corsair", "Vengeance LPX 16 GB", "price_per_gb")["de"],
+                         [Money("4.87", "USD")])
+        with self.assertRaises(UnsupportedField):
+            self.catalog.prices("video-card", "MSI", "Radeon RX 580", "price_per_gb")
+        with self.assertRaises(UnsupportedField):
+            self.catalog.prices("video-card", "MSI", "Radeon RX 580", "model")
+        with self.assertRaises(UnsupportedPart):
+            self.catalog.prices("gpu", "MSI", "Radeon RX 580")
+        self.assertEqual(len(self.catalog.find("cpu", "AMD", "ryzen 5 3600")), 1)
+        self.assertEqual(normalize_name("EVGA ", " GeForce  RTX"), "evga geforce rtx")
+
+    def test_different_specs_are_separate_products(self):
+        variant = dict(sample_items["video-card"][1], color="White")
+        self.catalog.add("uk", "video-card", parse({"video-card": make_page([variant])})["video-card"])
+        self.assertEqual(len(self.catalog.find("video-card", "MSI", "Radeon RX 580")), 2)
+        self.assertEqual(self.catalog.view("uk", "video-card")[0].color, "White")
+
+    def test_replace_and_prune(self):
+        self.catalog.add("de", "cpu", self.de["cpu"][:1])
+        self.catalog.add("us", "cpu", self.us["cpu"][:1])
+        self.assertEqual(self.catalog.prune(), 1)
+        self.assertEqual(list(self.catalog.view("us", "cpu")), self.us["cpu"][:1])
+        self.assertEqual(self.catalog.regions("cpu"), ["us", "de"])
+
+    def test_compact_prices(self):
+        catalog = GlobalCatalog(compact_prices=True)
+        catalog.add("us", "cpu", self.us["cpu"])
+        self.assertEqual(catalog.view("us", "cpu")[0].price, CompactPrice(1999900, "USD"))
+
+    def test_api_global_catalog(self):
+        pages = {(region, part): page for region in ("us", "uk", "fr")
+                 for part, page in make_pages(["cpu", "memory"]).items()}
+        with StandInServer(pages) as server:
+            catalog = API(base_url=server.base_url).global_catalog("cpu", "memory", regions=["us", "uk", "fr"])
+        self.assertEqual(catalog.info().products, 3)
+        self.assertEqual(catalog.info().listings, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
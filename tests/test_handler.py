@@ -0,0 +1,99 @@
+import threading
+import unittest
+from collections import Counter
+
+import aiohttp
+
+from pcpartpicker.handler import Handler
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import RecordingPages, region_pages, sample_items
+
+
+class ConcurrentHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pages = RecordingPages(region_pages(["us", "uk"], ["cpu", "memory", "video-card"]))
+        self.server = StandInServer(self.pages, latency=0.05).start()
+        self.addCleanup(self.server.stop)
+        self.handler = Handler(base_url=self.server.base_url)
+
+    def run_threads(self, requests, expected_error=None):
+        results, errors = [], []
+
+        def worker(parts):
+            try:
+                results.append(self.handler.retrieve(*parts))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(parts,)) for parts in requests]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if expected_error is None:
+            self.assertEqual(errors, [])
+            return results
+        self.assertEqual(len(errors), len(requests))
+        for error in errors:
+            self.assertIsInstance(error, expected_error)
+        return errors
+
+    def test_burst_downloads_each_part_once(self):
+        requests = [("cpu", "memory"), ("memory",), ("cpu", "video-card"), ("video-card", "memory")] * 13
+        results = self.run_threads(requests[:50])
+        self.assertEqual(len(results), 50)
+        self.assertEqual(self.pages.loads, Counter({("us", "cpu"): 1, ("us", "memory"): 1, ("us", "video-card"): 1}))
+        for parts, result in zip(requests, results):
+            for part, data in result.items():
+                self.assertTrue(all(item.model.startswith("us:") for item in data))
+                self.assertEqual(len(data), len(sample_items[part]))
+        self.assertEqual(self.handler._flights, {})
+
+    def test_failed_download_is_shared_and_not_cached(self):
+        self.pages.clear()
+        self.run_threads([("cpu",)] * 10, aiohttp.ClientResponseError)
+        self.assertEqual(self.pages.loads, Counter({("us", "cpu"): 1}))
+        self.assertIsNone(self.handler.last_refresh("cpu"))
+        self.assertEqual(self.handler._flights, {})
+
+    def test_region_is_read_once_per_request(self):
+        started, release = threading.Event(), threading.Event()
+
+        def block(region, part):
+            started.set()
+            release.wait()
+        self.pages.hook = block
+        results = {}
+        thread = threading.Thread(target=lambda: results.update(self.handler.retrieve("cpu")))
+        thread.start()
+        self.assertTrue(started.wait(5))
+        self.handler.set_region("uk")
+        release.set()
+        thread.join()
+        self.pages.hook = None
+        self.assertEqual(results["cpu"][0].model, "us:Ryzen 5 3600")
+        self.assertIsNotNone(self.handler.last_refresh("cpu", "us"))
+        self.assertIsNone(self.handler.last_refresh("cpu", "uk"))
+        self.assertEqual(self.handler.retrieve("cpu")["cpu"][0].model, "uk:Ryzen 5 3600")
+        self.assertEqual(self.handler.retrieve("cpu", force_refresh=True)["cpu"][0].model, "uk:Ryzen 5 3600")
+        self.assertEqual(self.pages.loads, Counter({("us", "cpu"): 1, ("uk", "cpu"): 2}))
+
+
+class UnchangedPageTest(unittest.TestCase):
+
+    def test_unchanged_pages_are_not_parsed(self):
+        from tests.sample_pages import make_page, make_pages
+
+        pages = {("us", part): page for part, page in make_pages(["cpu", "memory"]).items()}
+        with StandInServer(pages) as server:
+            handler = Handler(base_url=server.base_url)
+            first = handler.retrieve("cpu", "memory")
+            pages[("us", "memory")] = make_page(sample_items["memory"] * 2).encode()
+            second = handler.retrieve("cpu", "memory", force_refresh=True)
+        self.assertIs(second["cpu"], first["cpu"])
+        self.assertEqual(len(second["memory"]), 2)
+        metrics = handler.parse_metrics
+        self.assertEqual((metrics.pages, metrics.parsed, metrics.unchanged), (4, 3, 1))
+        self.assertEqual(metrics.bytes_skipped, len(pages[("us", "cpu")]))
+        self.assertIsNotNone(handler.last_refresh("cpu"))
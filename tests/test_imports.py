@@ -0,0 +1,39 @@
+import subprocess
+import sys
+import unittest
+
+import pcpartpicker
+from pcpartpicker import mappings
+
+
+def loaded_modules(statement: str) -> set:
+    script = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_package_import_is_light(self):
+        modules = loaded_modules("import pcpartpicker")
+        for heavy in ("aiohttp", "pcpartpicker.schema", "moneyed", "pcpartpicker.parts", "pcpartpicker.api"):
+            self.assertNotIn(heavy, modules)
+
+    def test_api_construction_is_light(self):
+        modules = loaded_modules("from pcpartpicker import API\napi = API('de')")
+        self.assertIn("pcpartpicker.api", modules)
+        for heavy in ("aiohttp", "pcpartpicker.schema", "moneyed", "pcpartpicker.parts"):
+            self.assertNotIn(heavy, modules)
+
+    def test_lazy_attributes(self):
+        from pcpartpicker.api import API
+        self.assertIs(pcpartpicker.API, API)
+        self.assertIn("API", dir(pcpartpicker))
+        with self.assertRaises(AttributeError):
+            _ = pcpartpicker.Scraper
+
+    def test_part_classes(self):
+        from pcpartpicker.parts import GPU
+        self.assertIs(mappings.part_classes["video-card"], GPU)
+        self.assertEqual({part: cls.__name__ for part, cls in mappings.part_classes.items()},
+                         mappings.part_class_names)
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from pcpartpicker import API
+from pcpartpicker.limiter import RequestLimiter, SharedSemaphore, TokenBucket
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_pages
+
+
+async def hold(limiter: RequestLimiter, url: str, duration: float = 0.01) -> None:
+    async with limiter.slot(url):
+        await asyncio.sleep(duration)
+
+
+class LimiterTest(unittest.TestCase):
+
+    def test_concurrency_limit(self):
+        limiter = RequestLimiter(concurrency_limit=3)
+
+        async def run():
+            await asyncio.gather(*[hold(limiter, "https://example.com/cpu") for _ in range(10)])
+
+        asyncio.run(run())
+        self.assertEqual(limiter.metrics.requests, 10)
+        self.assertEqual(limiter.metrics.max_in_flight, 3)
+        self.assertEqual(limiter.metrics.max_waiting, 7)
+        self.assertEqual(limiter.metrics.in_flight, 0)
+        self.assertEqual(limiter.metrics.waiting, 0)
+        self.assertGreater(limiter.metrics.mean_wait_time, 0)
+
+    def test_unlimited_concurrency(self):
+        limiter = RequestLimiter(concurrency_limit=None)
+
+        async def run():
+            await asyncio.gather(*[hold(limiter, "https://example.com/cpu") for _ in range(10)])
+
+        asyncio.run(run())
+        self.assertEqual(limiter.metrics.max_in_flight, 10)
+
+    def test_limiter_reused_across_event_loops(self):
+        limiter = RequestLimiter(concurrency_limit=2)
+        for _ in range(2):
+            asyncio.run(asyncio.wait_for(hold(limiter, "https://example.com/cpu"), 1))
+        self.assertEqual(limiter.metrics.requests, 2)
+
+    def test_concurrency_limit_across_threads(self):
+        pages = {(region, part): page for region in ("us", "de", "uk") for part, page in make_pages().items()}
+        with StandInServer(pages, latency=0.05) as server:
+            api = API(concurrency_limit=2, base_url=server.base_url)
+            threads = [threading.Thread(target=api._handler.refresh, args=(region, list(make_pages())))
+                       for region in ("us", "de", "uk")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(api.request_metrics.requests, 9)
+        self.assertEqual(api.request_metrics.max_in_flight, 2)
+        self.assertEqual(api.request_metrics.in_flight, 0)
+        self.assertEqual(api.request_metrics.waiting, 0)
+        self.assertEqual(server.metrics.requests, 9)
+
+    def test_shared_semaphore_cancelled_waiter(self):
+        semaphore = SharedSemaphore(1)
+
+        async def run():
+            await semaphore.acquire()
+            waiter = asyncio.ensure_future(semaphore.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            semaphore.release()
+            await asyncio.wait_for(semaphore.acquire(), 1)
+            semaphore.release()
+
+        asyncio.run(run())
+        self.assertEqual(semaphore._available, 1)
+
+    def test_rate_limit_per_host(self):
+        limiter = RequestLimiter(concurrency_limit=None, rate_limit=50, burst=2)
+
+        async def run():
+            urls = ["https://a.example.com/cpu"] * 4 + ["https://b.example.com/cpu"] * 2
+            await asyncio.gather(*[hold(limiter, url, 0) for url in urls])
+
+        start = time.perf_counter()
+        asyncio.run(run())
+        self.assertGreaterEqual(time.perf_counter() - start, 0.03)
+        self.assertEqual(limiter.metrics.throttled, 2)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        self.assertEqual(bucket.try_acquire(), 0.0)
+        self.assertGreater(bucket.try_acquire(), 0.0)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            RequestLimiter(concurrency_limit=0)
+        with self.assertRaises(ValueError):
+            RequestLimiter(rate_limit=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+
+    def test_api_request_metrics(self):
+        api = API(concurrency_limit=4, rate_limit=10)
+        api.set_region("de")
+        self.assertEqual(api.request_metrics.requests, 0)
+        self.assertIs(api._handler.scraper.limiter, api._handler._limiter)
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+
+import aiohttp
+
+from pcpartpicker import API
+from pcpartpicker.mirrors import MirrorSet, local_path
+from pcpartpicker.parts import CPU
+from pcpartpicker.scraper import Scraper
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_pages
+from tests.test_stand_in import recorded_pages
+
+
+def closed_port_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}/"
+
+
+class MirrorSetTest(unittest.TestCase):
+
+    def test_local_path(self):
+        self.assertIsNone(local_path("https://example.com/pages/"))
+        self.assertEqual(local_path("file:///srv/pages/"), os.path.normpath("/srv/pages") + os.sep)
+        self.assertEqual(local_path("pages/"), "pages/")
+        self.assertEqual(local_path("C:\\pages\\"), "C:\\pages\\")
+        for source in ("ftp://host/pages/", "htps://host/pages/"):
+            with self.assertRaises(ValueError):
+                local_path(source)
+        with self.assertRaises(ValueError):
+            MirrorSet(["https://host/pages/", "ftp://host/pages/"])
+
+    def test_ranking(self):
+        mirrors = MirrorSet(["http://a", "http://b", "http://c"])
+        a, b, c = mirrors
+        self.assertEqual(a.url, "http://a/")
+        self.assertEqual(mirrors.ranked(), [a, b, c])
+        mirrors.record(a, 0.2)
+        mirrors.record(b, 0.1)
+        self.assertEqual(mirrors.ranked(), [c, b, a])
+        mirrors.record(c, 0.3)
+        self.assertEqual(mirrors.ranked(), [b, a, c])
+        self.assertEqual(mirrors.best(exclude=[b]), a)
+        mirrors.record(b, failed=True)
+        self.assertEqual(mirrors.ranked(), [a, c, b])
+        mirrors.record(a, 0.4)
+        self.assertAlmostEqual(mirrors.stats()["http://a/"].latency, 0.2 + 0.3 * 0.2)
+        self.assertEqual(mirrors.stats()["http://b/"].error_rate, 0.5)
+
+    def test_cooldown(self):
+        mirrors = MirrorSet(["http://a", "http://b"], cooldown=0)
+        a, b = mirrors
+        mirrors.record(a, failed=True)
+        self.assertEqual(mirrors.ranked(), [a, b])
+        with self.assertRaises(ValueError):
+            MirrorSet([])
+
+
+class FailoverTest(unittest.TestCase):
+
+    def test_failing_mirror(self):
+        with StandInServer(recorded_pages(), error_rate=1.0) as broken, StandInServer(recorded_pages()) as healthy:
+            scraper = Scraper("us", base_url=[broken.base_url, healthy.base_url])
+            pages = asyncio.run(scraper.retrieve(["cpu"]))
+            self.assertEqual(pages, {"cpu": make_pages()["cpu"]})
+            self.assertEqual(broken.metrics.requests, 1)
+            stats = scraper.mirrors.stats()
+            self.assertEqual((stats[broken.base_url].errors, stats[healthy.base_url].errors), (1, 0))
+
+            asyncio.run(scraper.retrieve(["memory"]))
+            self.assertEqual(broken.metrics.requests, 1)
+
+    def test_unreachable_mirror(self):
+        with StandInServer(recorded_pages()) as healthy:
+            api = API(base_url=[closed_port_url(), healthy.base_url])
+            self.assertIsInstance(api.retrieve("cpu")["cpu"][0], CPU)
+        self.assertEqual([stats.errors for stats in api.mirror_stats().values()], [1, 0])
+
+    def test_missing_page_on_local_mirror(self):
+        with tempfile.TemporaryDirectory() as directory, StandInServer(recorded_pages()) as server:
+            os.makedirs(os.path.join(directory, "us"))
+            with open(os.path.join(directory, "us", "cpu"), "wb") as file:
+                file.write(make_pages()["cpu"])
+            scraper = Scraper("us", base_url=[f"file://{directory}", server.base_url])
+            pages = asyncio.run(scraper.retrieve(["cpu", "memory"]))
+            self.assertEqual(set(pages), {"cpu", "memory"})
+            self.assertEqual(server.metrics.requests, 1)
+            self.assertEqual(scraper.mirrors.stats()[server.base_url].requests, 1)
+
+    def test_missing_everywhere(self):
+        with tempfile.TemporaryDirectory() as directory, StandInServer(recorded_pages()) as server:
+            scraper = Scraper("uk", base_url=[directory, server.base_url])
+            with self.assertRaises(aiohttp.ClientResponseError):
+                asyncio.run(scraper.retrieve(["cpu"]))
+            self.assertEqual(server.metrics.requests, 1)
+            self.assertEqual(sum(stats.errors for stats in scraper.mirrors.stats().values()), 0)
+
+    def test_probe_routes_to_fastest(self):
+        with StandInServer(recorded_pages(), latency=0.1) as slow, StandInServer(recorded_pages()) as fast:
+            api = API(base_url=[slow.base_url, fast.base_url])
+            stats = api.probe_mirrors()
+            self.assertLess(stats[fast.base_url].latency, stats[slow.base_url].latency)
+            api.retrieve("cpu", "memory", "video-card")
+            self.assertEqual(slow.metrics.requests, 1)
+            self.assertEqual(fast.metrics.requests, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
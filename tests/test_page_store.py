@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from pcpartpicker.page_store import PageStore, has_zstandard
+from pcpartpicker.parse_utils import extract_body, parse
+from pcpartpicker.parts import CPU, GPU
+from tests.sample_pages import make_pages
+
+
+class PageStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_gzip_round_trip(self):
+        store = PageStore(self.directory.name, codec="gzip")
+        pages = make_pages()
+        for part, page in pages.items():
+            store.save("us", part, page)
+        self.assertTrue(store.contains("us", "cpu"))
+        self.assertFalse(store.contains("uk", "cpu"))
+        self.assertTrue(store.path("us", "cpu").endswith(os.path.join("us", "cpu.gz")))
+        self.assertLess(os.path.getsize(store.path("us", "cpu")), len(pages["cpu"]))
+        self.assertEqual(store.replay("us", pages.keys()), pages)
+
+    @unittest.skipUnless(has_zstandard(), "zstandard is not installed")
+    def test_zstd_round_trip(self):
+        store = PageStore(self.directory.name, codec="zstd")
+        page = make_pages(["cpu"])["cpu"]
+        store.save("us", "cpu", page)
+        self.assertEqual(store.load("us", "cpu"), page)
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            PageStore(self.directory.name, codec="lz4")
+
+    def test_replayed_pages_parse(self):
+        store = PageStore(self.directory.name, codec="gzip")
+        for part, page in make_pages(["cpu", "video-card"]).items():
+            store.save("de", part, page)
+        parsed = parse(store.replay("de", ["cpu", "video-card"]))
+        self.assertIsInstance(parsed["cpu"][0], CPU)
+        self.assertIsInstance(parsed["video-card"][1], GPU)
+
+
+class ExtractBodyTest(unittest.TestCase):
+
+    def test_bytes_and_str_pages(self):
+        encoded = make_pages(["cpu"])["cpu"]
+        decoded = make_pages(["cpu"], encoded=False)["cpu"]
+        self.assertIsInstance(extract_body(encoded), bytes)
+        self.assertEqual(extract_body(encoded).decode(), extract_body(decoded))
+        self.assertEqual(parse({"cpu": encoded}), parse({"cpu": decoded}))
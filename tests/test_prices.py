@@ -0,0 +1,45 @@
+import json
+import unittest
+from decimal import Decimal
+
+from moneyed import Money
+
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.part_data import PartData
+from pcpartpicker.prices import CompactPrice, price_key
+from pcpartpicker.parts import Memory
+from tests.sample_pages import make_pages
+
+
+class CompactPriceTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        for amount in ("199.99", "4.87", "0.0247", "1980", "0"):
+            money = Money(amount, "USD")
+            price = CompactPrice.from_money(money)
+            self.assertEqual(price.to_money(), money)
+            self.assertEqual(price.amount, Decimal(amount))
+        self.assertEqual(str(CompactPrice.from_string("4.8", "EUR").amount), "4.80")
+
+    def test_inexact_amount(self):
+        with self.assertRaises(ValueError):
+            CompactPrice.from_string("0.00001", "USD")
+
+    def test_ordering_and_interning(self):
+        prices = [CompactPrice.from_string(amount, "USD") for amount in ("77.99", "4.87", "199.99")]
+        self.assertEqual([str(price.amount) for price in sorted(prices)], ["4.87", "77.99", "199.99"])
+        self.assertIs(prices[0].currency, prices[1].currency)
+        self.assertEqual(price_key(Money("4.87", "USD")), price_key(prices[1]))
+
+    def test_parse_compact_prices(self):
+        parsed = parse(make_pages(["memory"]), compact_prices=True)
+        memory = parsed["memory"][0]
+        self.assertIsInstance(memory, Memory)
+        self.assertEqual(memory.price, CompactPrice(779900, "USD"))
+        self.assertEqual(memory.price_per_gb.to_money(), Money("4.87", "USD"))
+
+    def test_compact_prices_serialize_like_money(self):
+        compact, money = PartData(), PartData()
+        compact.update(parse(make_pages(["memory"]), compact_prices=True))
+        money.update(parse(make_pages(["memory"])))
+        self.assertEqual(json.loads(compact.to_json()), json.loads(money.to_json()))
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import time
+import tracemalloc
+import unittest
+from unittest import mock
+
+from pcpartpicker import API
+from pcpartpicker.parts import CPU
+from pcpartpicker.profiling import Profiler, collapse
+from pcpartpicker.stand_in import StandInServer
+from tests.test_stand_in import recorded_pages
+
+
+def busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def allocate() -> list:
+    return [str(i) for i in range(20000)]
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def test_stages(self):
+        with Profiler() as profiler:
+            self.assertTrue(tracemalloc.is_tracing())
+            with profiler.stage("decode"):
+                busy(0.02)
+            with profiler.stage("build"):
+                kept = allocate()
+            with profiler.stage("build"):
+                pass
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(list(profiler.stages), ["decode", "build"])
+        self.assertEqual(profiler.stages["build"].calls, 2)
+        self.assertGreaterEqual(profiler.stages["decode"].seconds, 0.02)
+        self.assertGreater(profiler.stages["build"].allocated, 500000)
+        self.assertGreater(profiler.stages["build"].peak, 500000)
+        self.assertEqual(len(kept), 20000)
+
+    def test_stages_without_reset_peak(self):
+        with mock.patch("pcpartpicker.profiling._can_reset_peak", False), Profiler() as profiler:
+            with profiler.stage("decode"):
+                allocate()
+            with profiler.stage("build"):
+                kept = allocate()
+        self.assertGreater(profiler.stages["decode"].peak, 500000)
+        self.assertLess(profiler.stages["decode"].allocated, 100000)
+        self.assertGreater(profiler.stages["build"].peak, 500000)
+        self.assertEqual(len(kept), 20000)
+
+    def test_nested_stages(self):
+        profiler = Profiler()
+        with profiler.stage("decode"):
+            with self.assertRaises(RuntimeError):
+                with profiler.stage("build"):
+                    pass
+        with profiler.stage("build"):
+            pass
+
+    def test_collapsed_stacks(self):
+        profiler = Profiler()
+        with profiler.stage("decode"):
+            busy(0.02)
+        lines = profiler.collapsed()
+        busy_lines = [line for line in lines if "busy (test_profiling.py" in line]
+        self.assertTrue(busy_lines)
+        for line in lines:
+            stack, micros = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith("decode;"))
+            self.assertGreater(int(micros), 0)
+        self.assertGreater(sum(int(line.rsplit(" ", 1)[1]) for line in lines), 15000)
+
+    def test_collapse_splits_shared_callees(self):
+        a, b, c, root = ("a.py", 1, "a"), ("b.py", 1, "b"), ("c.py", 1, "c"), ("r.py", 1, "root")
+        stats = {
+            root: (1, 1, 0.0, 4.0, {}),
+            a: (1, 1, 1.0, 3.0, {root: (1, 1, 1.0, 3.0)}),
+            b: (1, 1, 0.0, 1.0, {root: (1, 1, 0.0, 1.0)}),
+            c: (2, 2, 3.0, 3.0, {a: (1, 1, 2.0, 2.0), b: (1, 1, 1.0, 1.0)}),
+        }
+        self.assertEqual(collapse(stats, "stage"), {"stage;root (r.py:1);a (a.py:1)": 1000000,
+                                                    "stage;root (r.py:1);a (a.py:1);c (c.py:1)": 2000000,
+                                                    "stage;root (r.py:1);b (b.py:1);c (c.py:1)": 1000000})
+
+
+class ProfiledRetrieveTest(unittest.TestCase):
+
+    def test_retrieve_profile(self):
+        with StandInServer(recorded_pages()) as server:
+            api = API(base_url=server.base_url)
+            data = api.retrieve("cpu", "memory", profile=True)
+            self.assertIsInstance(data["cpu"][0], CPU)
+            profiler = api.last_profile
+            self.assertEqual(set(profiler.stages), {"scrape", "extract", "decode", "build", "cache"})
+            self.assertEqual(profiler.stages["scrape"].calls, 1)
+            self.assertEqual(profiler.stages["decode"].calls, 2)
+            self.assertEqual(api.parse_metrics.parsed, 2)
+
+            with tempfile.TemporaryDirectory() as directory:
+                with api.profile(directory) as profiler:
+                    self.assertEqual(api.retrieve("cpu"), {"cpu": data["cpu"]})
+                self.assertIs(api.last_profile, profiler)
+                self.assertEqual(set(profiler.stages), {"cache"})
+                self.assertEqual(sorted(os.listdir(directory)), ["cache.prof", "stacks.collapsed", "summary.txt"])
+                with open(os.path.join(directory, "summary.txt")) as file:
+                    self.assertTrue(file.read().startswith("stage"))
+
+    def test_projected_retrieve_profile(self):
+        with StandInServer(recorded_pages()) as server:
+            api = API(base_url=server.base_url)
+            data = api.retrieve("cpu", fields=["brand", "price"], profile=True)
+        self.assertEqual(data["cpu"][0]._fields, ("brand", "price"))
+        self.assertEqual(set(api.last_profile.stages), {"scrape", "extract", "decode", "build", "cache"})
+
+
+if __name__ == "__main__":
+    unittest.main()
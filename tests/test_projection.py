@@ -0,0 +1,116 @@
+import json
+import threading
+import time
+import unittest
+from collections import Counter
+
+from moneyed import Money
+
+from pcpartpicker.errors import DecodeError, UnsupportedField
+from pcpartpicker.handler import Handler
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.part_data import PartData
+from pcpartpicker.parts import GPU, ClockSpeed
+from pcpartpicker.prices import CompactPrice
+from pcpartpicker.projection import projection
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import RecordingPages, make_page, make_pages, sample_items
+
+
+class ProjectionTest(unittest.TestCase):
+
+    def test_parse_projected(self):
+        records = parse(make_pages(["video-card"]), fields=["brand", "model", "price"])["video-card"]
+        self.assertEqual(records[0]._fields, ("brand", "model", "price"))
+        self.assertEqual(records[0].brand, "EVGA")
+        self.assertEqual(records[0].price, Money("499.99", "USD"))
+        self.assertFalse(hasattr(records[0], "__dict__"))
+
+    def test_nested_fields_and_compact_prices(self):
+        records = parse(make_pages(["video-card"]), compact_prices=True, fields=["boost_clock", "price"])
+        record = records["video-card"][1]
+        self.assertEqual(record.boost_clock, ClockSpeed(1366000000))
+        self.assertEqual(record.price, CompactPrice(1899900, "USD"))
+
+    def test_unknown_field(self):
+        with self.assertRaises(UnsupportedField):
+            projection(GPU, ["brand", "socket"])
+        with self.assertRaises(UnsupportedField):
+            parse(make_pages(["cpu"]), fields=["vram"])
+
+    def test_duplicate_fields(self):
+        with self.assertRaises(UnsupportedField):
+            projection(GPU, ["brand", "brand"])
+        with self.assertRaises(UnsupportedField):
+            parse(make_pages(["cpu"]), fields=["model", "price", "model"])
+
+    def test_missing_fields_are_rejected(self):
+        item = dict(sample_items["cpu"][0])
+        del item["price"]
+        page = make_page([sample_items["cpu"][1], item])
+        with self.assertRaises(DecodeError) as excinfo:
+            parse({"cpu": page}, fields=["model", "price"])
+        self.assertEqual(excinfo.exception.field, "price")
+        with self.assertRaises(DecodeError):
+            parse({"cpu": page})
+        rejected = []
+        records = parse({"cpu": page}, fields=["model", "price"], rejected=rejected)["cpu"]
+        self.assertEqual([record.model for record in records], ["Core i9-9900K"])
+        self.assertEqual([(item.index, item.field) for item in rejected], [(1, "price")])
+        self.assertEqual(len(parse({"cpu": page}, fields=["model", "cores"])["cpu"]), 2)
+
+    def test_projection_is_cached(self):
+        self.assertIs(projection(GPU, ["brand", "price"]), projection(GPU, ("brand", "price")))
+
+    def test_projected_json(self):
+        data = PartData()
+        data.update(parse(make_pages(["cpu"]), fields=["model", "price"]))
+        self.assertEqual(json.loads(data.to_json())["cpu"][0], {"model": "Ryzen 5 3600", "price": ["USD", "199.99"]})
+
+    def test_handler_projects_cached_parts(self):
+        pages = RecordingPages({("us", "cpu"): make_pages(["cpu"])["cpu"]})
+        with StandInServer(pages) as server:
+            handler = Handler(base_url=server.base_url)
+            projected = handler.retrieve("cpu", fields=["model"])
+            self.assertEqual([record.model for record in projected["cpu"]], ["Ryzen 5 3600", "Core i9-9900K"])
+            self.assertIsNone(handler.last_refresh("cpu"))
+            handler.retrieve("cpu")
+            projected = handler.retrieve("cpu", fields=["model", "cores"])
+        self.assertEqual(projected["cpu"][1].cores, 8)
+        self.assertEqual(pages.loads, Counter({("us", "cpu"): 2}))
+
+    def test_projected_downloads_are_coalesced(self):
+        pages = RecordingPages({("us", "cpu"): make_pages(["cpu"])["cpu"]})
+        server = StandInServer(pages, latency=0.05).start()
+        self.addCleanup(server.stop)
+        handler = Handler(base_url=server.base_url)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(handler.retrieve("cpu", fields=["model"])))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(pages.loads, Counter({("us", "cpu"): 1}))
+        self.assertEqual([result["cpu"][0].model for result in results], ["Ryzen 5 3600"] * 5)
+        self.assertEqual(handler._flights, {})
+
+        started, release = threading.Event(), threading.Event()
+
+        def block(region, part):
+            started.set()
+            release.wait()
+        pages.hook = block
+        full = threading.Thread(target=handler.retrieve, args=("cpu",), kwargs={"force_refresh": True})
+        full.start()
+        self.assertTrue(started.wait(5))
+        projected = {}
+        thread = threading.Thread(target=lambda: projected.update(handler.retrieve("cpu", fields=["cores"],
+                                                                                   force_refresh=True)))
+        thread.start()
+        time.sleep(0.1)
+        release.set()
+        full.join()
+        thread.join()
+        self.assertEqual(pages.loads, Counter({("us", "cpu"): 2}))
+        self.assertEqual([record.cores for record in projected["cpu"]], [6, 8])
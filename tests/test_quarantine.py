@@ -0,0 +1,79 @@
+import unittest
+
+from pcpartpicker import API
+from pcpartpicker.errors import DecodeError
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.parts import CPU
+from pcpartpicker.quarantine import QuarantinedItem, Quarantine
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_page, sample_items
+
+
+def broken_cpu_page() -> str:
+    good, other = sample_items["cpu"][0], sample_items["cpu"][1]
+    return make_page([good, dict(good, price=["199.99"]), "not a part", other, dict(other, cores="six")])
+
+
+class QuarantineParseTest(unittest.TestCase):
+
+    def test_bad_items_are_quarantined(self):
+        rejected = []
+        cpus = parse({"cpu": broken_cpu_page()}, rejected=rejected)["cpu"]
+        self.assertEqual([cpu.model for cpu in cpus], [item["model"] for item in sample_items["cpu"][:2]])
+        self.assertTrue(all(isinstance(cpu, CPU) for cpu in cpus))
+        self.assertEqual([(item.part, item.index, item.field) for item in rejected],
+                         [("cpu", 1, "price"), ("cpu", 2, None), ("cpu", 4, "cores")])
+        self.assertEqual(rejected[2].item["cores"], "six")
+        self.assertIn("199.99", rejected[0].reason)
+
+    def test_strict_parse_raises(self):
+        with self.assertRaises(DecodeError):
+            parse({"cpu": broken_cpu_page()})
+
+    def test_projected_items_are_quarantined(self):
+        rejected = []
+        records = parse({"cpu": broken_cpu_page()}, fields=["model", "price"], rejected=rejected)["cpu"]
+        self.assertEqual(len(records), 3)
+        self.assertEqual([(item.index, item.field) for item in rejected], [(1, "price"), (2, None)])
+
+    def test_all_items_bad(self):
+        item = dict(sample_items["cpu"][0], price=["1"])
+        rejected = []
+        with self.assertRaises(DecodeError):
+            parse({"cpu": make_page([item, item])}, rejected=rejected)
+        self.assertEqual(parse({"cpu": make_page([])}, rejected=rejected), {"cpu": []})
+
+
+class QuarantineTest(unittest.TestCase):
+
+    def test_record(self):
+        quarantine = Quarantine(max_items=2)
+        items = [QuarantinedItem("cpu", index, "price", "malformed", {}) for index in range(3)]
+        quarantine.record("us", "cpu", items)
+        quarantine.record("de", "cpu", items[:1])
+        self.assertEqual(quarantine.counts(), {("us", "cpu"): 3, ("de", "cpu"): 1})
+        self.assertEqual(len(quarantine.items("us")), 2)
+        self.assertEqual(len(quarantine.items(part="cpu")), 3)
+        self.assertEqual(len(quarantine), 4)
+        quarantine.record("us", "cpu", [])
+        self.assertEqual(quarantine.counts(), {("de", "cpu"): 1})
+        self.assertEqual(quarantine.total, 4)
+
+    def test_api_keeps_good_items(self):
+        pages = {("us", "cpu"): broken_cpu_page().encode()}
+        with StandInServer(pages) as server:
+            api = API(base_url=server.base_url)
+            with self.assertLogs("pcpartpicker.handler", "WARNING"):
+                cpus = api.retrieve("cpu")["cpu"]
+            self.assertEqual(len(cpus), 2)
+            self.assertEqual(api.quarantine.counts(), {("us", "cpu"): 3})
+            self.assertEqual(api.parse_metrics.quarantined, 3)
+
+            strict_api = API(base_url=server.base_url, strict=True)
+            with self.assertRaises(DecodeError):
+                strict_api.retrieve("cpu")
+            self.assertEqual(len(strict_api.quarantine), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
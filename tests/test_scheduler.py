@@ -0,0 +1,67 @@
+import time
+import unittest
+from collections import Counter
+
+import aiohttp
+
+from pcpartpicker import API
+from pcpartpicker.errors import UnsupportedPart, UnsupportedRegion
+from pcpartpicker.handler import Handler
+from pcpartpicker.scheduler import RefreshScheduler
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import RecordingPages, region_pages
+
+
+def serve_pages(test: unittest.TestCase, regions) -> StandInServer:
+    server = StandInServer(RecordingPages(region_pages(regions, ["cpu", "memory"]))).start()
+    test.addCleanup(server.stop)
+    return server
+
+
+class SchedulerTest(unittest.TestCase):
+
+    def test_staggered_entries(self):
+        handler = Handler()
+        scheduler = RefreshScheduler(handler, [("us", "cpu"), ("uk", "cpu"), ("us", "memory")], interval=30)
+        due = sorted(scheduler._due.values())
+        self.assertAlmostEqual(due[1] - due[0], 10, places=2)
+        self.assertAlmostEqual(due[2] - due[1], 10, places=2)
+
+    def test_run_pending_groups_regions(self):
+        server = serve_pages(self, ["us", "uk"])
+        handler = Handler(base_url=server.base_url)
+        scheduler = RefreshScheduler(handler, [("us", "cpu"), ("uk", "cpu"), ("us", "memory")], interval=30)
+        scheduler._due = dict.fromkeys(scheduler._due, 0)
+        self.assertEqual(scheduler.run_pending(), 3)
+        self.assertEqual(server.pages.loads, Counter({("us", "cpu"): 1, ("uk", "cpu"): 1, ("us", "memory"): 1}))
+        self.assertEqual(set(scheduler.last_success), {("us", "cpu"), ("uk", "cpu"), ("us", "memory")})
+        self.assertEqual(scheduler.run_pending(), 0)
+        self.assertEqual(handler.retrieve("cpu")["cpu"][0].model, "us:Ryzen 5 3600")
+        self.assertEqual(sum(server.pages.loads.values()), 3)
+
+    def test_failed_refresh_is_retried(self):
+        # The stand-in server has no pages for 'uk', so refreshing them fails with a 404.
+        handler = Handler(base_url=serve_pages(self, ["us"]).base_url)
+        scheduler = RefreshScheduler(handler, [("us", "cpu"), ("uk", "cpu")], interval=30, retry_interval=5)
+        scheduler._due = dict.fromkeys(scheduler._due, 0)
+        self.assertEqual(scheduler.run_pending(), 1)
+        self.assertIsInstance(scheduler.last_error[("uk", "cpu")], aiohttp.ClientResponseError)
+        self.assertNotIn(("uk", "cpu"), scheduler.last_success)
+        self.assertLess(scheduler._due[("uk", "cpu")], scheduler._due[("us", "cpu")])
+
+    def test_invalid_entries(self):
+        with self.assertRaises(UnsupportedRegion):
+            RefreshScheduler(Handler(), [("oc", "cpu")])
+        with self.assertRaises(UnsupportedPart):
+            RefreshScheduler(Handler(), [("us", "gpu")])
+
+    def test_api_background_refresh(self):
+        api = API("de", base_url=serve_pages(self, ["de", "fr"]).base_url)
+        scheduler = api.start_refresh("cpu", "memory", regions=["de", "fr"], interval=60)
+        deadline = time.time() + 5
+        while ("de", "cpu") not in scheduler.last_success and time.time() < deadline:
+            time.sleep(0.01)
+        api.stop_refresh()
+        self.assertFalse(scheduler.running)
+        self.assertIsNotNone(api.last_refresh("cpu"))
+        self.assertEqual(api.retrieve("cpu")["cpu"][0].model, "de:Ryzen 5 3600")
@@ -0,0 +1,68 @@
+import unittest
+
+from moneyed import Money
+
+from pcpartpicker.errors import DecodeError
+from pcpartpicker.mappings import part_classes
+from pcpartpicker.parse_utils import dataclass_from_dict, parse
+from pcpartpicker.parts import CPU, GPU, RPM, Bytes, ClockSpeed
+from pcpartpicker.prices import CompactPrice
+from pcpartpicker.schema import decoder, part_decoders
+from tests.sample_pages import make_pages, sample_items
+
+
+class SchemaTest(unittest.TestCase):
+
+    def test_decode(self):
+        gpu = decoder(GPU)(sample_items["video-card"][0])
+        self.assertIsInstance(gpu, GPU)
+        self.assertEqual(gpu.vram, Bytes(8000000000))
+        self.assertEqual(gpu.core_clock, ClockSpeed(1605000000))
+        self.assertEqual(gpu.price, Money("499.99", "USD"))
+        self.assertEqual(decoder(GPU)(sample_items["video-card"][0], True).price, CompactPrice(4999900, "USD"))
+
+    def test_parse_uses_compiled_decoders(self):
+        parsed = parse(make_pages())
+        for part, items in sample_items.items():
+            self.assertEqual(parsed[part], [dataclass_from_dict(part_classes[part], item) for item in items])
+
+    def test_decoders_are_cached(self):
+        self.assertIs(decoder(GPU), decoder(GPU))
+        self.assertIs(part_decoders()["cpu"], decoder(CPU))
+        self.assertEqual(set(part_decoders()), set(part_classes))
+
+    def test_optional_fields(self):
+        fan = decoder(RPM)({"min": 10})
+        self.assertEqual((fan.min, fan.max, fan.default), (10, None, None))
+
+    def test_missing_field(self):
+        item = dict(sample_items["cpu"][0])
+        del item["cores"]
+        with self.assertRaises(DecodeError) as context:
+            decoder(CPU)(item)
+        self.assertEqual((context.exception.part, context.exception.field), ("CPU", "cores"))
+        self.assertIn("'cores'", str(context.exception))
+
+    def test_malformed_price(self):
+        item = dict(sample_items["cpu"][0], price=["199.99"])
+        with self.assertRaises(DecodeError) as context:
+            decoder(CPU)(item)
+        self.assertEqual(context.exception.field, "price")
+        with self.assertRaises(RuntimeError):
+            dataclass_from_dict(CPU, item)
+
+    def test_malformed_nested_field(self):
+        item = dict(sample_items["video-card"][0], vram={"bytes": 8})
+        with self.assertRaises(DecodeError) as context:
+            decoder(GPU)(item)
+        self.assertEqual((context.exception.part, context.exception.field), ("GPU", "vram.total"))
+
+    def test_invalid_value(self):
+        item = dict(sample_items["cpu"][0], cores="six")
+        with self.assertRaises(DecodeError) as context:
+            decoder(CPU)(item)
+        self.assertEqual(context.exception.field, "cores")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from moneyed import Money
+
+from pcpartpicker.api import API
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.parts import SoundCard
+from pcpartpicker.prices import CompactPrice
+from pcpartpicker.shared_catalog import SharedCatalog
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_pages
+
+
+def read_price(name: str, queue) -> None:
+    catalog = SharedCatalog.attach(name)
+    queue.put((catalog.regions, str(catalog.view("de", "video-card")[1].price.amount)))
+    catalog.close()
+
+
+class SharedCatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parsed = parse(make_pages())
+        self.catalog = SharedCatalog.create({"us": self.parsed, "de": {"video-card": self.parsed["video-card"]}})
+
+    def tearDown(self):
+        self.catalog.close()
+
+    def test_round_trip(self):
+        attached = SharedCatalog.attach(self.catalog.name)
+        try:
+            self.assertEqual(attached.regions, ["us", "de"])
+            self.assertEqual(attached.parts("de"), ["video-card"])
+            for part, parts in self.parsed.items():
+                view = attached.view("us", part)
+                self.assertEqual(len(view), len(parts))
+                self.assertEqual(list(view), parts)
+            self.assertEqual(attached.view("de", "video-card")[-1], self.parsed["video-card"][-1])
+            with self.assertRaises(IndexError):
+                _ = attached.view("de", "video-card")[2]
+        finally:
+            attached.close()
+
+    def test_columns(self):
+        view = self.catalog.view("us", "video-card")
+        self.assertEqual(list(view.column("price")), [4999900, 1899900])
+        self.assertEqual(list(view.column("price.currency")), ["USD", "USD"])
+        self.assertEqual(view.column("boost_clock.cycles")[1], 1366000000)
+        self.assertEqual(list(self.catalog.view("us", "cpu").column("multithreading")), [True, True])
+
+    def test_unrelated_process_does_not_remove_segment(self):
+        script = ("import sys; from pcpartpicker.shared_catalog import SharedCatalog; "
+                  "catalog = SharedCatalog.attach(sys.argv[1]); print(catalog.regions); catalog.close()")
+        result = subprocess.run([sys.executable, "-c", script, self.catalog.name], capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), "['us', 'de']")
+        self.assertNotIn("leaked", result.stderr)
+        attached = SharedCatalog.attach(self.catalog.name)
+        attached.close()
+
+    def test_mixed_numbers_keep_their_type(self):
+        cards = [SoundCard("Creative", f"Card {i}", channels, 24, 120, 192.0, "", "PCIe", Money("99.99", "USD"))
+                 for i, channels in enumerate([2, 5.1, None, 2 ** 60])]
+        catalog = SharedCatalog.create({"us": {"sound-card": cards}})
+        try:
+            channels = [card.channels for card in catalog.view("us", "sound-card")]
+            self.assertEqual(channels, [2, 5.1, None, 2 ** 60])
+            self.assertEqual([type(value) for value in channels], [int, float, type(None), int])
+        finally:
+            catalog.close()
+
+    def test_compact_prices(self):
+        attached = SharedCatalog.attach(self.catalog.name, compact_prices=True)
+        try:
+            self.assertEqual(attached.view("us", "memory")[0].price_per_gb, CompactPrice(48700, "USD"))
+        finally:
+            attached.close()
+
+    def test_part_data(self):
+        data = self.catalog.part_data("us")
+        self.assertEqual(set(data), set(self.parsed))
+        self.assertEqual(data.top_k("video-card", 1)[0].price, Money("189.99", "USD"))
+
+    def test_worker_process(self):
+        queue = multiprocessing.Queue()
+        worker = multiprocessing.Process(target=read_price, args=(self.catalog.name, queue))
+        worker.start()
+        worker.join(10)
+        self.assertEqual(queue.get(timeout=1), (["us", "de"], "189.99"))
+
+    def test_snapshot_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "catalog.bin")
+            SharedCatalog.save({"us": self.parsed}, path)
+            with SharedCatalog.open(path) as catalog:
+                self.assertIsNone(catalog.name)
+                self.assertEqual(list(catalog.view("us", "memory")), self.parsed["memory"])
+
+    def test_only_complete_parts(self):
+        records = parse(make_pages(["cpu"]), fields=["brand"])
+        with self.assertRaises(TypeError):
+            SharedCatalog.create({"us": records})
+
+    def test_shared_memory_unavailable(self):
+        with mock.patch("pcpartpicker.shared_catalog.has_shared_memory", return_value=False):
+            with self.assertRaises(RuntimeError):
+                SharedCatalog.create({"us": self.parsed})
+            with self.assertRaises(RuntimeError):
+                SharedCatalog.attach("pcpartpicker-missing")
+            with self.assertRaises(RuntimeError):
+                API().share_catalog("cpu")
+
+    def test_api_share_catalog(self):
+        pages = {(region, part): page for region in ("de", "uk")
+                 for part, page in make_pages(["cpu", "memory"]).items()}
+        with StandInServer(pages) as server:
+            api = API("de", base_url=server.base_url)
+            with api.share_catalog("cpu", "memory", regions=["de", "uk"]) as catalog:
+                self.assertEqual(catalog.regions, ["de", "uk"])
+                self.assertEqual(list(catalog.view("uk", "cpu")), self.parsed["cpu"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.part_data import PartData
+from pcpartpicker.parts import GPU
+from pcpartpicker.similarity import SimilarityIndex, has_numpy
+from pcpartpicker.views import ViewCache
+from tests.sample_pages import make_page, sample_items
+
+
+def make_cards() -> list:
+    template = sample_items["video-card"][0]
+    items = []
+    for i in range(40):
+        items.append(dict(template, model=f"Card {i}", vram={"total": (4 + i % 3 * 4) * 1000000000},
+                          boost_clock={"cycles": 1500000000 + i * 10000000}, length=200.0 + i,
+                          price=[f"{200 + i * i}.00", "USD"]))
+    items[5]["length"] = None
+    return parse({"video-card": make_page(items)})["video-card"]
+
+
+class SimilarityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cards = make_cards()
+
+    def test_features(self):
+        index = SimilarityIndex(GPU, self.cards, use_numpy=False)
+        self.assertEqual(index.features, ("vram.total", "core_clock.cycles", "boost_clock.cycles", "length",
+                                          "price.amount"))
+        index = SimilarityIndex(GPU, self.cards, features=["vram", "price.amount"], weights={"vram": 4})
+        self.assertEqual((index.features, index.weights), (("vram.total", "price.amount"), (4, 1.0)))
+        with self.assertRaises(ValueError):
+            SimilarityIndex(GPU, self.cards, features=["brand"])
+
+    def test_nearest(self):
+        index = SimilarityIndex(GPU, self.cards, features=["vram", "price"], use_numpy=False)
+        found = index.nearest(self.cards[10], 2)
+        self.assertEqual([card.model for _, card in found], ["Card 7", "Card 13"])
+        self.assertLess(found[0][0], found[1][0])
+        self.assertNotIn(self.cards[10], index.similar(self.cards[10], 39))
+        self.assertEqual(len(index.similar(self.cards[10], 100)), 39)
+        self.assertEqual(index.similar(self.cards[10], 0), [])
+
+    @unittest.skipUnless(has_numpy(), "numpy is not installed")
+    def test_numpy_matches_python(self):
+        python = SimilarityIndex(GPU, self.cards, use_numpy=False)
+        vectorized = SimilarityIndex(GPU, self.cards, use_numpy=True)
+        for card in self.cards[::7]:
+            expected = python.nearest(card, 5)
+            actual = vectorized.nearest(card, 5)
+            self.assertEqual([found for _, found in actual], [found for _, found in expected])
+            for (a, _), (b, _) in zip(actual, expected):
+                self.assertAlmostEqual(a, b)
+
+    def test_part_data_similar_is_cached(self):
+        views = ViewCache()
+        data = PartData(views)
+        data["video-card"] = self.cards
+        self.assertEqual(len(data.similar("video-card", self.cards[0], 3)), 3)
+        index = views.similarity("video-card", self.cards)
+        self.assertIs(views.similarity("video-card", self.cards), index)
+        views.replace("video-card", self.cards[:10])
+        self.assertIsNot(views.similarity("video-card", self.cards[:10]), index)
+
+    def test_records(self):
+        records = parse({"video-card": make_page(sample_items["video-card"])}, fields=["model", "vram", "price"])
+        index = SimilarityIndex(GPU, records["video-card"])
+        self.assertEqual(index.features, ("vram.total", "price.amount"))
+        self.assertEqual(index.similar(records["video-card"][0], 1), records["video-card"][1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
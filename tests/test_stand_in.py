@@ -0,0 +1,142 @@
+import asyncio
+import importlib.util
+import tempfile
+import threading
+import unittest
+
+import aiohttp
+
+from pcpartpicker import API
+from pcpartpicker.limiter import RequestLimiter
+from pcpartpicker.page_store import PageStore
+from pcpartpicker.parts import CPU, GPU
+from pcpartpicker.scraper import Scraper, accept_encoding, default_base_url
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_pages
+
+
+def recorded_pages(regions=("us", "de")) -> dict:
+    return {(region, part): page for region in regions for part, page in make_pages().items()}
+
+
+class StandInServerTest(unittest.TestCase):
+
+    def test_default_base_url(self):
+        self.assertEqual(Scraper().generate_product_url("cpu"), f"{default_base_url}us/cpu")
+        self.assertEqual(Scraper("de", base_url="http://localhost:1").generate_product_url("cpu"),
+                         "http://localhost:1/de/cpu")
+
+    def test_accept_encoding(self):
+        expected = "br, gzip, deflate" if importlib.util.find_spec("brotli") else "gzip, deflate"
+        self.assertEqual(accept_encoding(), expected)
+
+    def test_scraper_retrieve(self):
+        with StandInServer(recorded_pages()) as server:
+            pages = asyncio.run(Scraper("de", base_url=server.base_url).retrieve(["cpu", "memory"]))
+        self.assertEqual(pages, {part: make_pages()[part] for part in ("cpu", "memory")})
+        self.assertEqual(server.metrics.requests, 2)
+        self.assertLess(server.metrics.bytes_sent, sum(len(page) for page in pages.values()))
+
+    def test_api_retrieve(self):
+        with StandInServer(recorded_pages(), latency=0.01) as server:
+            api = API("de", base_url=server.base_url)
+            data = api.retrieve("cpu", "video-card")
+        self.assertIsInstance(data["cpu"][0], CPU)
+        self.assertIsInstance(data["video-card"][1], GPU)
+        self.assertEqual(api.request_metrics.requests, 2)
+
+    def test_server_errors_are_retried(self):
+        limiter = RequestLimiter(concurrency_limit=1)
+        with StandInServer(recorded_pages(), fail_requests=2) as server:
+            pages = asyncio.run(Scraper("us", limiter, base_url=server.base_url).retrieve(["cpu", "memory"]))
+        self.assertEqual(set(pages), {"cpu", "memory"})
+        self.assertEqual(server.metrics.injected_errors, 2)
+        self.assertEqual(limiter.metrics.retries, 2)
+
+    def test_retries_are_bounded(self):
+        with StandInServer(recorded_pages(), error_rate=1.0) as server:
+            scraper = Scraper("us", base_url=server.base_url)
+            scraper.max_retries = 2
+            with self.assertRaises(aiohttp.ClientResponseError) as excinfo:
+                asyncio.run(scraper.retrieve(["cpu"]))
+        self.assertEqual(excinfo.exception.status, 503)
+        self.assertEqual(server.metrics.requests, 3)
+
+    def test_pages_are_saved_off_the_event_loop(self):
+        threads = []
+
+        class RecordingStore(PageStore):
+            def save(self, region, part, page):
+                threads.append(threading.get_ident())
+                super().save(region, part, page)
+
+        with tempfile.TemporaryDirectory() as root, StandInServer(recorded_pages()) as server:
+            store = RecordingStore(root, codec="gzip")
+            asyncio.run(Scraper("us", page_store=store, base_url=server.base_url).retrieve(["cpu", "memory"]))
+            self.assertEqual(store.load("us", "cpu"), make_pages()["cpu"])
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_missing_page(self):
+        with StandInServer(recorded_pages()) as server:
+            with self.assertRaises(aiohttp.ClientResponseError) as excinfo:
+                asyncio.run(Scraper("uk", base_url=server.base_url).retrieve(["cpu"]))
+        self.assertEqual(excinfo.exception.status, 404)
+        self.assertEqual(server.metrics.not_found, 1)
+
+    def test_serves_page_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = PageStore(directory, codec="gzip")
+            store.save("us", "cpu", make_pages(["cpu"])["cpu"])
+            with StandInServer(store, compress=False, bandwidth=10 ** 6) as server:
+                pages = asyncio.run(Scraper(base_url=server.base_url).retrieve(["cpu"]))
+        self.assertEqual(pages["cpu"], make_pages(["cpu"])["cpu"])
+
+
+class PipelineTest(unittest.TestCase):
+
+    def test_iter_retrieve(self):
+        with StandInServer(recorded_pages(), latency=0.01) as server:
+            api = API("de", base_url=server.base_url)
+            api.retrieve("memory")
+            results = list(api.iter_retrieve("cpu", "memory", "video-card"))
+            self.assertEqual(results[0][0], "memory")
+            self.assertEqual({part for part, _ in results}, {"cpu", "memory", "video-card"})
+            self.assertIsInstance(dict(results)["cpu"][0], CPU)
+            self.assertIs(api.retrieve("cpu")["cpu"], dict(results)["cpu"])
+            records = dict(api.iter_retrieve("cpu", "memory", fields=["brand"]))
+            self.assertEqual(records["memory"][0].brand, "Corsair")
+            records = dict(api.iter_retrieve("cpu", fields=["brand"], force_refresh=True))
+            self.assertEqual(records["cpu"][0].brand, "AMD")
+        self.assertEqual(server.metrics.requests, 4)
+
+    def test_abandoned_iteration(self):
+        with StandInServer(recorded_pages(), latency=0.05) as server:
+            api = API("us", base_url=server.base_url)
+            iterator = api.iter_retrieve("cpu", "memory")
+            next(iterator)
+            iterator.close()
+            data = api.retrieve("cpu", "memory")
+        self.assertEqual(set(data), {"cpu", "memory"})
+
+    def test_paused_iteration_does_not_block_retrieve(self):
+        with StandInServer(recorded_pages(), latency=0.05) as server:
+            api = API("us", base_url=server.base_url)
+            iterator = api.iter_retrieve("cpu", "memory")
+            first, _ = next(iterator)
+            results = {}
+            thread = threading.Thread(target=lambda: results.update(api.retrieve("cpu", "memory")))
+            thread.start()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(set(results), {"cpu", "memory"})
+            self.assertEqual(set(api.retrieve("cpu", "memory")), {"cpu", "memory"})
+            self.assertEqual({part for part, _ in iterator}, {"cpu", "memory"} - {first})
+        self.assertEqual(server.metrics.requests, 2)
+
+    def test_failures_are_raised(self):
+        with StandInServer(recorded_pages()) as server:
+            api = API("us", base_url=server.base_url)
+            with self.assertRaises(aiohttp.ClientResponseError):
+                list(api.iter_retrieve("cpu", "monitor"))
+            self.assertIsInstance(api.retrieve("cpu")["cpu"][0], CPU)
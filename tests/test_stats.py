@@ -0,0 +1,118 @@
+import unittest
+
+from pcpartpicker.errors import UnsupportedField
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.part_data import PartData
+from pcpartpicker.parts import GPU
+from pcpartpicker.similarity import has_numpy
+from pcpartpicker.stats import summarize
+from pcpartpicker.views import ViewCache
+from tests.sample_pages import make_page, sample_items
+
+
+def make_cards() -> list:
+    template = sample_items["video-card"][0]
+    items = []
+    for i in range(30):
+        items.append(dict(template, brand=["EVGA", "MSI", "ASUS"][i % 3], model=f"Card {i}",
+                          vram={"total": (4 + i % 2 * 4) * 1000000000}, length=200.0 + i,
+                          price=[f"{100 + i * 10}.00", "USD"]))
+    items[4]["length"] = None
+    return parse({"video-card": make_page(items)})["video-card"]
+
+
+class StatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cards = make_cards()
+
+    def test_summary(self):
+        stats = summarize(GPU, self.cards, use_numpy=False)
+        self.assertEqual(stats.count, 30)
+        self.assertEqual(list(stats.columns), ["vram.total", "core_clock.cycles", "boost_clock.cycles", "length",
+                                               "price.amount"])
+        price = stats["price.amount"]
+        self.assertEqual((price.count, price.min, price.max, price.mean), (30, 100.0, 390.0, 245.0))
+        self.assertEqual(price.percentiles, {25: 172.5, 50: 245.0, 75: 317.5, 90: 361.0})
+        self.assertEqual((stats["length"].count, stats["length"].min), (29, 200.0))
+
+    def test_group_by(self):
+        stats = summarize(GPU, self.cards, fields=["price"], group_by="brand", percentiles=[0, 100], use_numpy=False)
+        self.assertEqual(list(stats), ["EVGA", "MSI", "ASUS"])
+        self.assertEqual(list(stats["MSI"].columns), ["price.amount"])
+        msi = stats["MSI"]["price.amount"]
+        self.assertEqual((stats["MSI"].count, msi.min, msi.max, msi.mean), (10, 110.0, 380.0, 245.0))
+        self.assertEqual(msi.percentiles, {0: 110.0, 100: 380.0})
+        both = summarize(GPU, self.cards, fields=["price"], group_by=["brand", "vram"], use_numpy=False)
+        self.assertEqual(len(both), 6)
+        self.assertEqual(both[("EVGA", self.cards[0].vram)].count, 5)
+        by_key = summarize(GPU, self.cards, fields=["length"], group_by=lambda card: card.length is None)
+        self.assertEqual((by_key[True].count, by_key[True]["length"].count), (1, 0))
+        self.assertIsNone(by_key[True]["length"].mean)
+
+    def test_errors(self):
+        with self.assertRaises(UnsupportedField):
+            summarize(GPU, self.cards, group_by="socket")
+        with self.assertRaises(ValueError):
+            summarize(GPU, self.cards, fields=["brand"])
+        with self.assertRaises(ValueError):
+            summarize(GPU, self.cards, percentiles=[101])
+        self.assertEqual(summarize(GPU, [], group_by="brand"), {})
+        self.assertEqual(summarize(GPU, [])["price.amount"].count, 0)
+
+    @unittest.skipUnless(has_numpy(), "numpy is not installed")
+    def test_numpy_matches_python(self):
+        import numpy
+        for group_by in (None, "brand", ["brand", "vram"]):
+            python = summarize(GPU, self.cards, group_by=group_by, use_numpy=False)
+            vectorized = summarize(GPU, self.cards, group_by=group_by, use_numpy=True)
+            if group_by is None:
+                python, vectorized = {None: python}, {None: vectorized}
+            self.assertEqual(list(vectorized), list(python))
+            for group, expected in python.items():
+                self.assertEqual(vectorized[group].count, expected.count)
+                for name, column in expected.columns.items():
+                    actual = vectorized[group][name]
+                    self.assertEqual((actual.count, actual.min, actual.max), (column.count, column.min, column.max))
+                    self.assertAlmostEqual(actual.mean, column.mean)
+                    for percentile, value in column.percentiles.items():
+                        self.assertAlmostEqual(actual.percentiles[percentile], value)
+        prices = [float(card.price.amount) for card in self.cards]
+        stats = summarize(GPU, self.cards, fields=["price"], use_numpy=True)["price.amount"]
+        for percentile, value in stats.percentiles.items():
+            self.assertAlmostEqual(value, numpy.percentile(prices, percentile))
+
+    def test_records(self):
+        records = parse({"video-card": make_page(sample_items["video-card"])}, fields=["brand", "price"])
+        stats = summarize(GPU, records["video-card"], group_by="brand")
+        self.assertEqual(list(stats["MSI"].columns), ["price.amount"])
+        self.assertAlmostEqual(stats["MSI"]["price.amount"].mean, 189.99)
+        with self.assertRaises(UnsupportedField):
+            summarize(GPU, records["video-card"], group_by="chipset")
+
+    def test_part_data_stats_are_cached(self):
+        views = ViewCache()
+        data = PartData(views)
+        data["video-card"] = self.cards
+        stats = data.stats("video-card", group_by="brand")
+        self.assertIs(data.stats("video-card", group_by="brand"), stats)
+        self.assertIsNot(data.stats("video-card", group_by=["brand"]), stats)
+        self.assertEqual(data.stats("video-card").count, 30)
+        by_key = data.stats("video-card", group_by=lambda card: card.brand)
+        self.assertIsNot(data.stats("video-card", group_by=lambda card: card.brand), by_key)
+        self.assertEqual(len(views._indexes), 3)
+        with self.assertRaises(TypeError):
+            stats["MSI"] = stats["EVGA"]
+        with self.assertRaises(TypeError):
+            stats["MSI"].columns["length"] = None
+        with self.assertRaises(TypeError):
+            stats["MSI"]["price.amount"].percentiles[50] = 0.0
+        views.replace("video-card", self.cards[:3])
+        data["video-card"] = self.cards[:3]
+        refreshed = data.stats("video-card", group_by="brand")
+        self.assertIsNot(refreshed, stats)
+        self.assertEqual(refreshed["MSI"].count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
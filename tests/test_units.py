@@ -0,0 +1,75 @@
+import unittest
+from array import array
+
+from pcpartpicker.parts import Bytes, ClockSpeed, NetworkSpeed
+from pcpartpicker.units import BytesArray, ClockSpeedArray, NetworkSpeedArray
+from pcpartpicker.utils import num
+
+
+class BatchConstructorTest(unittest.TestCase):
+
+    def test_matches_scalar_constructors(self):
+        numbers = [8, 0.5, "16 GB", "1.5 TB", "-2", 1.3]
+        for unit in ("kb", "mb", "gb", "tb", "pb"):
+            self.assertEqual(getattr(Bytes, f"from_{unit}_many")(numbers),
+                             [getattr(Bytes, f"from_{unit}")(number) for number in numbers])
+        for unit in ("ghz", "mhz"):
+            self.assertEqual(getattr(ClockSpeed, f"from_{unit}_many")(numbers),
+                             [getattr(ClockSpeed, f"from_{unit}")(number) for number in numbers])
+        for unit in ("gbits", "mbits"):
+            self.assertEqual(getattr(NetworkSpeed, f"from_{unit}_many")([1, 2.5]),
+                             [getattr(NetworkSpeed, f"from_{unit}")(number) for number in [1, 2.5]])
+
+    def test_values_beyond_64_bits(self):
+        numbers = [8, 100000, "20000 PB", 1.5]
+        self.assertEqual(Bytes.from_pb_many(numbers), [Bytes.from_pb(number) for number in numbers])
+        with self.assertRaises(OverflowError):
+            BytesArray.from_scaled(numbers, "pb")
+
+    def test_batch_objects_behave_like_scalar_objects(self):
+        batch = Bytes.from_gb_many([8])[0]
+        self.assertEqual(hash(batch), hash(Bytes(8000000000)))
+        self.assertLess(batch, Bytes.from_gb(9))
+        with self.assertRaises(AttributeError):
+            batch.total = 5
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            Bytes.from_gb_many(["none"])
+        with self.assertRaises(ValueError):
+            Bytes.from_gb_many([8, [1]])
+        with self.assertRaises(ValueError):
+            NetworkSpeed.from_mbits_many(["100"])
+
+    def test_num(self):
+        self.assertEqual(num("Speed: 3.6 GHz"), 3.6)
+        self.assertEqual(num("16 GB"), 16)
+        with self.assertRaises(ValueError):
+            num("none")
+
+
+class UnitArrayTest(unittest.TestCase):
+
+    def test_bytes_array(self):
+        sizes = BytesArray.from_scaled(["8 GB", 16, 0.5], "gb")
+        self.assertEqual(len(sizes), 3)
+        self.assertEqual(sizes.values, array("q", [8000000000, 16000000000, 500000000]))
+        self.assertEqual(sizes[1], Bytes.from_gb(16))
+        self.assertEqual(list(sizes), Bytes.from_gb_many(["8 GB", 16, 0.5]))
+        self.assertEqual(list(sizes.to_scaled("mb")), [8000.0, 16000.0, 500.0])
+        self.assertEqual(sizes[1:], BytesArray([16000000000, 500000000]))
+
+    def test_from_units(self):
+        speeds = ClockSpeedArray.from_units([ClockSpeed.from_ghz(3.6), ClockSpeed.from_mhz(800)])
+        self.assertEqual(list(speeds.to_scaled("ghz")), [3.6, 0.8])
+        self.assertNotEqual(speeds, BytesArray(speeds.values))
+
+    def test_unknown_unit(self):
+        with self.assertRaises(ValueError):
+            NetworkSpeedArray.from_scaled([1], "gb")
+        with self.assertRaises(ValueError):
+            NetworkSpeedArray.from_scaled(["1"], "gbits")
+
+
+if __name__ == "__main__":
+    unittest.main()
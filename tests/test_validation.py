@@ -0,0 +1,100 @@
+import threading
+import unittest
+
+from moneyed import Money
+
+from pcpartpicker.handler import Handler
+from pcpartpicker.parts import GPU, Bytes, ClockSpeed, Resolution
+from pcpartpicker.stand_in import StandInServer
+from pcpartpicker.validation import get_validation_mode, set_validation_mode, validation_mode, validate_column, \
+    validate_parts
+from tests.sample_pages import make_page, sample_items
+
+
+def make_gpu(brand="EVGA", length=267.0):
+    return GPU(brand, "GeForce RTX 2070", "GeForce RTX 2070", Bytes.from_gb(8), ClockSpeed.from_mhz(1410),
+               ClockSpeed.from_mhz(1710), "Black", length, Money("499.99", "USD"))
+
+
+class ValidationTest(unittest.TestCase):
+
+    def tearDown(self):
+        set_validation_mode("strict")
+
+    def test_default_mode(self):
+        self.assertEqual(get_validation_mode(), "strict")
+        with self.assertRaises(ValueError):
+            _ = Resolution("1920", "1080")
+
+    def test_off_mode(self):
+        set_validation_mode("off")
+        resolution = Resolution("1920", "1080")
+        self.assertEqual(resolution.width, "1920")
+
+    def test_sampled_mode(self):
+        set_validation_mode("sampled", sample_every=2)
+        with self.assertRaises(ValueError):
+            _ = Resolution("1920", "1080")
+        _ = Resolution("1920", "1080")
+        with self.assertRaises(ValueError):
+            _ = Resolution("1920", "1080")
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            set_validation_mode("lenient")
+        with self.assertRaises(ValueError):
+            set_validation_mode("sampled", sample_every=0)
+        self.assertEqual(get_validation_mode(), "strict")
+
+    def test_context_manager_restores_mode(self):
+        with validation_mode("off"):
+            self.assertEqual(get_validation_mode(), "off")
+            _ = Bytes("50")
+        self.assertEqual(get_validation_mode(), "strict")
+        with self.assertRaises(ValueError):
+            _ = Bytes("50")
+
+    def test_mode_is_per_thread(self):
+        entered, checked = threading.Event(), threading.Event()
+        results = []
+
+        def lenient():
+            with validation_mode("off"):
+                entered.set()
+                checked.wait(5)
+                results.append(Resolution("1920", "1080").width)
+
+        thread = threading.Thread(target=lenient)
+        thread.start()
+        self.assertTrue(entered.wait(5))
+        self.assertEqual(get_validation_mode(), "strict")
+        with self.assertRaises(ValueError):
+            _ = Resolution("1920", "1080")
+        checked.set()
+        thread.join()
+        self.assertEqual(results, ["1920"])
+
+    def test_api_threads_inherit_mode(self):
+        item = dict(sample_items["cpu"][0], cores="six")
+        pages = {("us", "cpu"): make_page([item]).encode()}
+        with StandInServer(pages) as server:
+            handler = Handler(base_url=server.base_url, strict=True)
+            with validation_mode("off"):
+                parts = dict(handler.iter_retrieve("cpu"))
+        self.assertEqual(parts["cpu"][0].cores, "six")
+
+    def test_validate_column(self):
+        self.assertIsNone(validate_column([1, 2, None, 0], int))
+        self.assertIsNone(validate_column([1.5, 2, None], (float, int)))
+        self.assertIsNone(validate_column(["", 0], str))
+        with self.assertRaises(ValueError) as excinfo:
+            validate_column([1, 2, 3.5], int, "test")
+        self.assertIn("row 2 of 'test'", str(excinfo.exception))
+
+    def test_validate_parts(self):
+        with validation_mode("off"):
+            parts = [make_gpu(), make_gpu(length=300.0), make_gpu(brand=12)]
+        validate_parts(parts[:2], GPU)
+        with self.assertRaises(ValueError) as excinfo:
+            validate_parts(parts, GPU)
+        self.assertIn("GPU.brand", str(excinfo.exception))
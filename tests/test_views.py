@@ -0,0 +1,133 @@
+import random
+import unittest
+
+from moneyed import Money
+
+from pcpartpicker.handler import Handler
+from pcpartpicker.part_data import PartData
+from pcpartpicker.parts import ClockSpeed, CPU
+from pcpartpicker.stand_in import StandInServer
+from pcpartpicker.views import RankedView, ViewCache, rank_value
+from tests.sample_pages import make_page, sample_items
+
+
+def cpu_page(cpus) -> bytes:
+    template = sample_items["cpu"][0]
+    items = [dict(template, model=f"CPU #{index}", price=[str(price), "USD"]) for index, price in cpus]
+    return make_page(items).encode()
+
+
+def make_cpu(index: int, price, boost: int = 4000):
+    price = Money(str(price), "USD") if price is not None else None
+    return CPU("AMD", f"CPU #{index}", 8, ClockSpeed.from_mhz(3000), ClockSpeed.from_mhz(boost), 65, "", True, price)
+
+
+class RankedViewTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+        self.cpus = [make_cpu(i, random.randint(50, 900), random.randint(3000, 5000)) for i in range(200)]
+
+    def test_rank_value(self):
+        self.assertEqual(rank_value(Money("1.5", "USD")), 15000)
+        self.assertEqual(rank_value(ClockSpeed(10)), 10)
+        self.assertEqual(rank_value("text"), "text")
+
+    def test_sorted_and_top_k(self):
+        expected = sorted(self.cpus, key=lambda cpu: cpu.price.amount)
+        self.assertEqual(RankedView(self.cpus, "price").top(), expected)
+        self.assertEqual(RankedView(self.cpus, "price", limit=10).top(), expected[:10])
+        fastest = sorted(self.cpus, key=lambda cpu: cpu.boost_clock.cycles, reverse=True)
+        self.assertEqual([cpu.boost_clock for cpu in RankedView(self.cpus, "boost_clock", True, 5).top()],
+                         [cpu.boost_clock for cpu in fastest[:5]])
+
+    def test_missing_values_are_skipped(self):
+        cpus = self.cpus[:3] + [make_cpu(999, None)]
+        self.assertEqual(len(RankedView(cpus, "price")), 3)
+
+    def test_incremental_update_matches_rebuild(self):
+        for limit in (None, 10):
+            old = self.cpus[:150]
+            new = self.cpus[20:] + [make_cpu(1000 + i, random.randint(1, 900)) for i in range(30)]
+            view = RankedView(old, "price", limit=limit)
+            view.update(old, new)
+            self.assertEqual(view.top(), RankedView(new, "price", limit=limit).top())
+
+
+class PartDataViewTest(unittest.TestCase):
+
+    def test_views_are_cached(self):
+        part_data = PartData()
+        part_data["cpu"] = [make_cpu(i, 100 - i) for i in range(20)]
+        self.assertEqual([cpu.model for cpu in part_data.top_k("cpu", 3)], ["CPU #19", "CPU #18", "CPU #17"])
+        view = part_data._views.view("cpu", part_data["cpu"], "price", limit=3)
+        self.assertIs(part_data._views.view("cpu", part_data["cpu"], "price", limit=2), view)
+        self.assertEqual(len(part_data.sorted_view("cpu")), 20)
+
+    def test_views_follow_handler_refresh(self):
+        pages = {("us", "cpu"): cpu_page((i, 100 + i) for i in range(20))}
+        with StandInServer(pages) as server:
+            handler = Handler(base_url=server.base_url)
+            first = handler.retrieve("cpu")
+            self.assertEqual(first.top_k("cpu", 2)[0].model, "CPU #0")
+            view = first._views.view("cpu", first["cpu"], "price", limit=2)
+            pages[("us", "cpu")] = cpu_page([(i, 100 + i) for i in range(1, 20)] + [(50, 10)])
+            second = handler.retrieve("cpu", force_refresh=True)
+        self.assertIs(second._views, first._views)
+        self.assertEqual([cpu.model for cpu in second.top_k("cpu", 2)], ["CPU #50", "CPU #1"])
+        self.assertIs(second._views.view("cpu", second["cpu"], "price", limit=2), view)
+
+    def test_duplicate_parts_are_updated(self):
+        old = [make_cpu(1, 10), make_cpu(1, 10), make_cpu(2, 20)]
+        new = [make_cpu(1, 10), make_cpu(2, 20)]
+        view = RankedView(old, "price")
+        view.update(old, new)
+        self.assertEqual(view.top(), new)
+
+    def test_key_functions_are_not_cached(self):
+        part_data = PartData()
+        part_data["cpu"] = [make_cpu(i, 100 - i) for i in range(20)]
+        for _ in range(3):
+            self.assertEqual(part_data.top_k("cpu", 1, key=lambda cpu: cpu.model)[0].model, "CPU #0")
+        self.assertEqual(part_data._views._views, {})
+
+    def test_stale_part_data_does_not_replace_views(self):
+        pages = {("us", "cpu"): cpu_page((i, 100 + i) for i in range(20))}
+        with StandInServer(pages) as server:
+            handler = Handler(base_url=server.base_url)
+            first = handler.retrieve("cpu")
+            first.top_k("cpu", 2)
+            pages[("us", "cpu")] = cpu_page([(50, 10)])
+            second = handler.retrieve("cpu", force_refresh=True)
+        view = second._views.view("cpu", second["cpu"], "price", limit=2)
+        self.assertEqual(first.top_k("cpu", 1)[0].model, "CPU #0")
+        self.assertIs(second._views._parts["cpu"], second["cpu"])
+        self.assertIs(second._views.view("cpu", second["cpu"], "price", limit=2), view)
+        self.assertEqual(second.top_k("cpu", 1)[0].model, "CPU #50")
+
+    def test_part_data_assignment_replaces_views(self):
+        part_data = PartData()
+        part_data["cpu"] = [make_cpu(i, 100 - i) for i in range(20)]
+        view = part_data._views.view("cpu", part_data["cpu"], "price")
+        part_data["cpu"] = [make_cpu(99, 1)]
+        self.assertIs(part_data._views.view("cpu", part_data["cpu"], "price"), view)
+        self.assertEqual(part_data.top_k("cpu", 1)[0].model, "CPU #99")
+
+    def test_part_data_update_replaces_views(self):
+        part_data = PartData()
+        part_data["cpu"] = [make_cpu(i, 100 - i) for i in range(20)]
+        view = part_data._views.view("cpu", part_data["cpu"], "price")
+        refreshed = [make_cpu(98, 2)]
+        part_data.update({"cpu": refreshed})
+        self.assertIs(part_data._views._parts["cpu"], refreshed)
+        self.assertIs(part_data._views.view("cpu", part_data["cpu"], "price"), view)
+        self.assertEqual(part_data.top_k("cpu", 1)[0].model, "CPU #98")
+        part_data |= {"cpu": [make_cpu(99, 1)]}
+        self.assertEqual(part_data.top_k("cpu", 1)[0].model, "CPU #99")
+        memory = part_data.setdefault("memory", [])
+        self.assertIs(part_data.setdefault("memory", [make_cpu(0, 1)]), memory)
+
+    def test_view_cache_replace_ignores_unused_parts(self):
+        views = ViewCache()
+        views.replace("cpu", [make_cpu(0, 1)])
+        self.assertEqual(views._parts, {})
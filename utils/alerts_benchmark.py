@@ -0,0 +1,61 @@
+import json
+import random
+import time
+
+from pcpartpicker.alerts import AlertEngine
+from pcpartpicker.catalog import normalize_name
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.prices import price_key
+from tests.sample_pages import sample_items
+
+KITS = 5000
+
+
+def memory_page(discount: int) -> str:
+    template = sample_items["memory"][0]
+    items = [dict(template, model=f"Kit {i}", price=[f"{100 - (discount if i % 50 == 0 else 0)}.00", "USD"])
+             for i in range(KITS)]
+    return f"<body>{json.dumps(items)}</body>"
+
+
+def subscriptions(count: int) -> list:
+    generator = random.Random(1)
+    return [dict(region="us", part="memory", model=f"Kit {generator.randrange(KITS)}",
+                 threshold=str(generator.randrange(50, 100)), currency="USD") for _ in range(count)]
+
+
+def loop_over_alerts(alerts: list, kits: list) -> int:
+    lowest = {}
+    for kit in kits:
+        name = normalize_name(None, kit.model)
+        lowest[name] = min(lowest.get(name, price_key(kit.price)), price_key(kit.price))
+    fired = 0
+    for alert in alerts:
+        units = lowest.get(normalize_name(None, alert["model"]))
+        if units is not None and units <= int(alert["threshold"]) * 10000:
+            fired += 1
+    return fired
+
+
+def main():
+    before = parse({"memory": memory_page(0)}, compact_prices=True)["memory"]
+    after = parse({"memory": memory_page(20)}, compact_prices=True)["memory"]
+    for count in (10000, 100000, 1000000):
+        alerts = subscriptions(count)
+        print(f"{count} subscriptions on {KITS} kits:")
+        start = time.perf_counter()
+        fired = loop_over_alerts(alerts, before) + loop_over_alerts(alerts, after)
+        print(f"  loop over alerts: {(time.perf_counter() - start) * 500:7.1f} ms per refresh, {fired} matches")
+
+        engine = AlertEngine()
+        start = time.perf_counter()
+        engine.subscribe_all(alerts)
+        subscribe_time = time.perf_counter() - start
+        start = time.perf_counter()
+        fired = len(engine.evaluate("us", "memory", before)) + len(engine.evaluate("us", "memory", after))
+        print(f"      alert engine: {(time.perf_counter() - start) * 500:7.1f} ms per refresh, {fired} fired "
+              f"({subscribe_time * 1000:.0f} ms to subscribe)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import time
+
+from pcpartpicker.api import API
+from pcpartpicker.handler import Handler
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_page, sample_items
+
+ITEMS_PER_PAGE = 200
+LATENCY = 0.05
+
+
+def recorded_pages() -> dict:
+    return {(region, part): make_page([dict(item, model=f"{item['model']} #{i}")
+                                       for i in range(ITEMS_PER_PAGE) for item in items[:1]]).encode()
+            for region in sorted(Handler._supported_regions) for part, items in sample_items.items()}
+
+
+def per_page(base_url: str) -> float:
+    start = time.perf_counter()
+    for region in sorted(Handler._supported_regions):
+        API(region, base_url=base_url).retrieve(*sample_items)
+    return time.perf_counter() - start
+
+
+def archive(base_url: str) -> float:
+    start = time.perf_counter()
+    API(base_url=base_url).sync_archive(parts=sample_items)
+    return time.perf_counter() - start
+
+
+def main():
+    pages = recorded_pages()
+    with StandInServer(pages, latency=LATENCY) as server:
+        print(f"{len(pages)} pages, {LATENCY * 1000:.0f} ms latency per request")
+        print(f" per page: {per_page(server.base_url) * 1000:8.1f} ms, {server.metrics.requests} requests")
+        requests = server.metrics.requests
+        print(f"  archive: {archive(server.base_url) * 1000:8.1f} ms, {server.metrics.requests - requests} requests")
+
+
+if __name__ == "__main__":
+    main()
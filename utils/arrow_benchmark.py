@@ -0,0 +1,34 @@
+import json
+import time
+import tracemalloc
+
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.part_data import PartData
+from tests.sample_pages import sample_items
+
+ITEMS = 20000
+
+
+def timed(name: str, function) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    frame = function()
+    total_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>16}: {total_time * 1000:8.1f} ms, peak {peak / 1e6:6.1f} MB for {len(frame)} rows")
+
+
+def main():
+    import pandas
+
+    template = sample_items["video-card"][0]
+    items = [dict(template, model=f"{template['model']} #{i}") for i in range(ITEMS)]
+    data = PartData()
+    data.update(parse({"video-card": f"<body>{json.dumps(items)}</body>"}))
+    timed("to_json + pandas", lambda: pandas.DataFrame(json.loads(data.to_json())["video-card"]))
+    timed("to_pandas", lambda: data.to_pandas("video-card"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import gc
+import json
+import time
+import tracemalloc
+
+from pcpartpicker.catalog import GlobalCatalog
+from pcpartpicker.parse_utils import parse
+from tests.sample_pages import sample_items
+
+ITEMS = 5000
+REGIONS = 13
+
+
+def regional_page(region: int) -> str:
+    template = sample_items["video-card"][0]
+    items = [dict(template, model=f"{template['model']} #{i}", price=[f"{400 + region + i % 100}.99", "USD"])
+             for i in range(ITEMS)]
+    return f"<body>{json.dumps(items)}</body>"
+
+
+def measure(name: str, function) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    total_time = time.perf_counter() - start
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>17}: {total_time * 1000:8.1f} ms, retained {memory / 1e6:6.1f} MB")
+    return result
+
+
+def main():
+    pages = [regional_page(region) for region in range(REGIONS)]
+    parsed = measure("separate regions", lambda: [parse({"video-card": page}) for page in pages])
+
+    def build_catalog() -> GlobalCatalog:
+        catalog = GlobalCatalog()
+        for region, page in enumerate(pages):
+            catalog.add(str(region), "video-card", parse({"video-card": page})["video-card"])
+        return catalog
+    catalog = measure("global catalog", build_catalog)
+    print(f"{catalog.info().listings} listings of {catalog.info().products} products")
+    assert list(catalog.view("3", "video-card")) == parsed[3]["video-card"]
+
+
+if __name__ == "__main__":
+    main()
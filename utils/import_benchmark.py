@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import time
+
+RUNS = 10
+
+STATEMENTS = {
+    "interpreter": "pass",
+    "import pcpartpicker": "import pcpartpicker",
+    "API()": "from pcpartpicker import API; API()",
+    "import parts": "import pcpartpicker.parts",
+    "import parse_utils": "import pcpartpicker.parse_utils",
+    "import scraper + aiohttp": "import pcpartpicker.scraper, aiohttp",
+}
+
+
+def time_statement(statement: str) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    baseline = time_statement("pass")
+    for name, statement in STATEMENTS.items():
+        total_time = time_statement(statement)
+        print(f"{name:>26}: {total_time * 1000:7.1f} ms ({(total_time - baseline) * 1000:+7.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
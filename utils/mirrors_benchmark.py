@@ -0,0 +1,35 @@
+import time
+
+from pcpartpicker.api import API
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_pages
+
+ROUNDS = 10
+
+
+def recorded_pages() -> dict:
+    return {("us", part): page for part, page in make_pages().items()}
+
+
+def refresh_times(api: API) -> list:
+    times = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        api.retrieve(*make_pages(), force_refresh=True)
+        times.append(time.perf_counter() - start)
+    return sorted(times)
+
+
+def main():
+    with StandInServer(recorded_pages(), latency=0.1, error_rate=0.2, seed=1) as slow, \
+            StandInServer(recorded_pages(), latency=0.01) as fast:
+        for name, base_url in (("single mirror", slow.base_url), ("mirror set", [slow.base_url, fast.base_url])):
+            api = API(base_url=base_url)
+            if isinstance(base_url, list):
+                api.probe_mirrors()
+            times = refresh_times(api)
+            print(f"{name:>13}: median {times[ROUNDS // 2] * 1000:7.1f} ms, worst {times[-1] * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
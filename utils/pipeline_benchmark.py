@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from pcpartpicker.handler import Handler
+from pcpartpicker.limiter import RequestLimiter
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.scraper import Scraper
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_page, sample_items
+
+ITEMS_PER_PAGE = 5000
+BANDWIDTH = 2e6
+
+
+def recorded_pages() -> dict:
+    return {("us", part): make_page([dict(item, model=f"{item['model']} #{i}")
+                                     for i in range(ITEMS_PER_PAGE) for item in items[:1]]).encode()
+            for part, items in sample_items.items()}
+
+
+def sequential(base_url: str) -> float:
+    start = time.perf_counter()
+    scraper = Scraper("us", RequestLimiter(concurrency_limit=1), base_url=base_url)
+    parse(asyncio.run(scraper.retrieve(sample_items)))
+    return time.perf_counter() - start
+
+
+def pipelined(base_url: str) -> float:
+    start = time.perf_counter()
+    handler = Handler(concurrency_limit=1, base_url=base_url)
+    for _ in handler.iter_retrieve(*sample_items):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    with StandInServer(recorded_pages(), bandwidth=BANDWIDTH, compress=False) as server:
+        print(f"download then parse: {sequential(server.base_url) * 1000:8.1f} ms")
+        print(f"          pipelined: {pipelined(server.base_url) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
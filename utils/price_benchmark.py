@@ -0,0 +1,52 @@
+import gc
+import json
+import random
+import time
+
+from pcpartpicker.parse_utils import parse
+
+ITEMS = 20000
+
+
+def memory_item(index: int) -> dict:
+    price = random.randint(2000, 90000) / 100
+    return {"brand": "Corsair", "model": f"Vengeance #{index}", "module_type": "DDR4", "speed": {"cycles": 3200000000},
+            "number_of_modules": 2, "module_size": {"total": 8000000000}, "price_per_gb": [f"{price / 16:.3f}", "USD"],
+            "color": "Black", "first_word_latency": 10.0, "cas_timing": 16, "error_correction": "Non-ECC",
+            "price": [f"{price:.2f}", "USD"]}
+
+
+def storage_item(index: int) -> dict:
+    price = random.randint(2000, 90000) / 100
+    return {"brand": "Samsung", "model": f"860 Evo #{index}", "capacity": {"total": 1000000000000},
+            "price_per_gb": [f"{price / 1000:.4f}", "USD"], "storage_type": "SSD", "platter_rpm": 0,
+            "cache_amount": {"total": 1000000000}, "form_factor": "2.5\"", "interface": "SATA 6 Gb/s",
+            "price": [f"{price:.2f}", "USD"]}
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    random.seed(0)
+    pages = {
+        "memory": f"<body>{json.dumps([memory_item(i) for i in range(ITEMS)])}</body>",
+        "internal-hard-drive": f"<body>{json.dumps([storage_item(i) for i in range(ITEMS)])}</body>",
+    }
+    for compact in (False, True):
+        name = "compact" if compact else "  money"
+        gc.collect()
+        parsed, parse_time = timed(lambda: parse(pages, compact_prices=compact))
+        print(f"{name}: parse {parse_time * 1000:8.1f} ms")
+        for part, parts in parsed.items():
+            for field in ("price", "price_per_gb"):
+                _, sort_time = timed(lambda: sorted(parts, key=lambda p: getattr(p, field)))
+                print(f"{name}: sort {part}.{field:<13} {sort_time * 1000:8.1f} ms")
+        del parsed
+
+
+if __name__ == "__main__":
+    main()
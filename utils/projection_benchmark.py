@@ -0,0 +1,32 @@
+import gc
+import json
+import time
+import tracemalloc
+
+from pcpartpicker.parse_utils import parse
+from tests.sample_pages import sample_items
+
+ITEMS = 20000
+FIELDS = ["brand", "model", "price"]
+
+
+def main():
+    template = sample_items["video-card"][0]
+    items = [dict(template, model=f"{template['model']} #{i}") for i in range(ITEMS)]
+    page = f"<body>{json.dumps(items)}</body>"
+    for fields in (None, FIELDS):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        parsed = parse({"video-card": page}, fields=fields)
+        total_time = time.perf_counter() - start
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        name = "full" if fields is None else ",".join(fields)
+        print(f"{name:>17}: parse {total_time * 1000:8.1f} ms, retained {memory / 1e6:6.1f} MB "
+              f"for {len(parsed['video-card'])} parts")
+        del parsed
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import json
+import time
+
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.parts import GPU
+from pcpartpicker.schema import price_from_list
+from tests.sample_pages import sample_items
+
+ITEMS = 20000
+
+
+def dacite_decode(items: list) -> list:
+    from dacite import Config, from_dict
+    config = Config(check_types=False)
+    return [from_dict(GPU, {field: price_from_list(value) if isinstance(value, list) else value
+                            for field, value in item.items()}, config=config) for item in items]
+
+
+def main():
+    template = sample_items["video-card"][0]
+    items = [dict(template, model=f"{template['model']} #{i}") for i in range(ITEMS)]
+    page = f"<body>{json.dumps(items)}</body>"
+    start = time.perf_counter()
+    parsed = parse({"video-card": page})["video-card"]
+    print(f"compiled: parse {(time.perf_counter() - start) * 1000:8.1f} ms for {len(parsed)} parts")
+    try:
+        start = time.perf_counter()
+        decoded = dacite_decode(json.loads(page[6:-7]))
+    except ImportError:
+        print("  dacite: not installed")
+        return
+    print(f"  dacite: parse {(time.perf_counter() - start) * 1000:8.1f} ms for {len(decoded)} parts")
+    assert decoded == parsed
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import json
+import multiprocessing
+import time
+import tracemalloc
+
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.shared_catalog import SharedCatalog
+from tests.sample_pages import sample_items
+
+ITEMS = 20000
+WORKERS = 4
+
+
+def make_catalog_page() -> str:
+    template = sample_items["video-card"][0]
+    items = [dict(template, model=f"{template['model']} #{i}") for i in range(ITEMS)]
+    return f"<body>{json.dumps(items)}</body>"
+
+
+def parsing_worker(page: str, queue) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    parts = parse({"video-card": page})["video-card"]
+    cheapest = min(parts, key=lambda part: part.price)
+    queue.put((time.perf_counter() - start, tracemalloc.get_traced_memory()[0], cheapest.model))
+
+
+def attaching_worker(name: str, queue) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    catalog = SharedCatalog.attach(name)
+    view = catalog.view("us", "video-card")
+    prices = view.column("price")
+    cheapest = view[min(range(len(view)), key=prices.__getitem__)]
+    queue.put((time.perf_counter() - start, tracemalloc.get_traced_memory()[0], cheapest.model))
+    catalog.close()
+
+
+def run(target, argument) -> None:
+    queue = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=target, args=(argument, queue)) for _ in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    results = [queue.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    total_time = max(result[0] for result in results)
+    memory = sum(result[1] for result in results)
+    print(f"{target.__name__:>16}: {WORKERS} workers, slowest {total_time * 1000:8.1f} ms, "
+          f"private heap {memory / 1e6:6.1f} MB in total")
+
+
+def main():
+    page = make_catalog_page()
+    run(parsing_worker, page)
+    start = time.perf_counter()
+    with SharedCatalog.create({"us": parse({"video-card": page})}) as catalog:
+        print(f"{'create':>16}: {(time.perf_counter() - start) * 1000:8.1f} ms")
+        run(attaching_worker, catalog.name)
+
+
+if __name__ == "__main__":
+    main()
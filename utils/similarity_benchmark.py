@@ -0,0 +1,40 @@
+import json
+import time
+
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.similarity import SimilarityIndex, has_numpy
+from pcpartpicker.parts import GPU
+from tests.sample_pages import sample_items
+
+ITEMS = 20000
+QUERIES = 50
+
+
+def video_card_page() -> str:
+    template = sample_items["video-card"][0]
+    items = [dict(template, model=f"{template['model']} #{i}", vram={"total": (2 + i % 7) * 1000000000},
+                  boost_clock={"cycles": 1200000000 + (i * 7919) % 800000000}, length=150.0 + i % 180,
+                  price=[f"{100 + (i * 104729) % 1500}.99", "USD"]) for i in range(ITEMS)]
+    return f"<body>{json.dumps(items)}</body>"
+
+
+def measure(name: str, cards: list, use_numpy: bool) -> list:
+    start = time.perf_counter()
+    index = SimilarityIndex(GPU, cards, use_numpy=use_numpy)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = [index.similar(card, 5) for card in cards[:QUERIES]]
+    query_time = (time.perf_counter() - start) / QUERIES
+    print(f"{name:>7}: build {build_time * 1000:7.1f} ms, {query_time * 1000:7.2f} ms per query")
+    return results
+
+
+def main():
+    cards = parse({"video-card": video_card_page()})["video-card"]
+    python = measure("python", cards, False)
+    if has_numpy():
+        assert measure("numpy", cards, True) == python
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+from pcpartpicker.handler import Handler
+from pcpartpicker.limiter import RequestLimiter
+from pcpartpicker.scraper import Scraper
+from pcpartpicker.stand_in import StandInServer
+from tests.sample_pages import make_page, sample_items
+
+ITEMS_PER_PAGE = 2000
+LATENCY = 0.05
+
+
+def recorded_pages() -> dict:
+    pages = {}
+    for part, items in sample_items.items():
+        page = make_page([dict(item, model=f"{item['model']} #{i}")
+                          for i in range(ITEMS_PER_PAGE) for item in items[:1]]).encode()
+        for region in Handler._supported_regions:
+            pages[(region, part)] = page
+    return pages
+
+
+async def scrape_all(base_url: str, limiter: RequestLimiter) -> int:
+    scrapers = [Scraper(region, limiter, base_url=base_url) for region in sorted(Handler._supported_regions)]
+    results = await asyncio.gather(*[scraper.retrieve(sample_items) for scraper in scrapers])
+    return sum(len(page) for pages in results for page in pages.values())
+
+
+def main():
+    pages = recorded_pages()
+    with StandInServer(pages, latency=LATENCY) as server:
+        for limit in (1, 4, 16, None):
+            limiter = RequestLimiter(concurrency_limit=limit)
+            start = time.perf_counter()
+            total_bytes = asyncio.run(scrape_all(server.base_url, limiter))
+            total_time = time.perf_counter() - start
+            print(f"Scraper.retrieve, concurrency {str(limit):>4}: {len(pages) / total_time:7.1f} pages/s, "
+                  f"{total_bytes / total_time / 1e6:6.1f} MB/s, max queue {limiter.metrics.max_waiting}")
+
+        handler = Handler(base_url=server.base_url)
+        start = time.perf_counter()
+        data = handler.retrieve(*sample_items)
+        total_time = time.perf_counter() - start
+        parts = sum(len(items) for items in data.values())
+        print(f"Handler.retrieve: {total_time * 1000:.1f} ms for {parts} parts ({parts / total_time:,.0f} parts/s)")
+
+
+if __name__ == "__main__":
+    main()
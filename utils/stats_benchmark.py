@@ -0,0 +1,60 @@
+import json
+import statistics
+import time
+
+from pcpartpicker.arrow import columns
+from pcpartpicker.parse_utils import parse
+from pcpartpicker.part_data import PartData
+from pcpartpicker.parts import GPU
+from pcpartpicker.similarity import has_numpy
+from pcpartpicker.stats import summarize
+from tests.sample_pages import sample_items
+
+ITEMS = 20000
+BRANDS = ["ASUS", "EVGA", "Gigabyte", "MSI", "Sapphire", "Zotac"]
+
+
+def video_card_page() -> str:
+    template = sample_items["video-card"][0]
+    items = [dict(template, brand=BRANDS[i % len(BRANDS)], model=f"{template['model']} #{i}",
+                  boost_clock={"cycles": 1200000000 + (i * 7919) % 800000000}, length=150.0 + i % 180,
+                  price=[f"{100 + (i * 104729) % 1500}.99", "USD"]) for i in range(ITEMS)]
+    return f"<body>{json.dumps(items)}</body>"
+
+
+def loops(cards: list) -> dict:
+    # What dashboards did before: one filter and one pass per brand and column.
+    results = {}
+    for brand in sorted({card.brand for card in cards}):
+        for name, kind, get in columns(GPU):
+            if kind not in ("int", "float"):
+                continue
+            values = [float(get(card)) for card in cards if card.brand == brand and get(card) is not None]
+            quartiles = statistics.quantiles(values, n=4, method="inclusive")
+            results[(brand, name)] = (len(values), min(values), max(values), statistics.fmean(values), quartiles)
+    return results
+
+
+def measure(name: str, function, repeat: int = 3) -> None:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    print(f"{name:>16}: {min(timings) * 1000:8.1f} ms")
+
+
+def main():
+    cards = parse({"video-card": video_card_page()})["video-card"]
+    measure("python loops", lambda: loops(cards))
+    measure("stats (python)", lambda: summarize(GPU, cards, group_by="brand", use_numpy=False))
+    if has_numpy():
+        measure("stats (numpy)", lambda: summarize(GPU, cards, group_by="brand", use_numpy=True))
+    data = PartData()
+    data["video-card"] = cards
+    data.stats("video-card", group_by="brand")
+    measure("stats (cached)", lambda: data.stats("video-card", group_by="brand"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import time
+
+from pcpartpicker.parts import Bytes
+from pcpartpicker.units import BytesArray
+
+VALUES = 100000
+
+
+def measure(name: str, function) -> None:
+    start = time.perf_counter()
+    result = function()
+    total_time = time.perf_counter() - start
+    print(f"{name:>20}: {total_time * 1000:8.1f} ms for {len(result)} values")
+
+
+def main():
+    strings = [f"{i % 64 + 1} GB" for i in range(VALUES)]
+    numbers = [i % 64 + 0.5 for i in range(VALUES)]
+    measure("scalar strings", lambda: [Bytes.from_gb(value) for value in strings])
+    measure("from_gb_many strings", lambda: Bytes.from_gb_many(strings))
+    measure("BytesArray strings", lambda: BytesArray.from_scaled(strings, "gb"))
+    measure("scalar numbers", lambda: [Bytes.from_gb(value) for value in numbers])
+    measure("from_gb_many numbers", lambda: Bytes.from_gb_many(numbers))
+    measure("BytesArray numbers", lambda: BytesArray.from_scaled(numbers, "gb"))
+
+
+if __name__ == "__main__":
+    main()
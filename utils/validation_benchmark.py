@@ -0,0 +1,35 @@
+import time
+
+from moneyed import Money
+
+from pcpartpicker.parts import GPU, Bytes, ClockSpeed
+from pcpartpicker.validation import validation_mode, validate_parts
+
+ITERATIONS = 100000
+
+
+def build_gpus(count: int) -> list:
+    vram = Bytes.from_gb(8)
+    core_clock = ClockSpeed.from_mhz(1410)
+    boost_clock = ClockSpeed.from_mhz(1710)
+    price = Money("499.99", "USD")
+    return [GPU("EVGA", f"GeForce RTX 2070 #{i}", "GeForce RTX 2070", vram, core_clock, boost_clock,
+                "Black", 267.0, price) for i in range(count)]
+
+
+def main():
+    for mode in ("strict", "sampled", "off"):
+        with validation_mode(mode):
+            start = time.perf_counter()
+            gpus = build_gpus(ITERATIONS)
+            total_time = time.perf_counter() - start
+        print(f"{mode:>8}: {ITERATIONS / total_time:,.0f} GPU objects per second")
+
+    start = time.perf_counter()
+    validate_parts(gpus, GPU)
+    total_time = time.perf_counter() - start
+    print(f"   batch: {ITERATIONS / total_time:,.0f} GPU objects validated per second")
+
+
+if __name__ == "__main__":
+    main()